@@ -1,12 +1,14 @@
 # agents/communication_filter/filter_agent.py
 
-import json
+import os
 import re
 from typing import Dict, Any, List
 
 from core.base.base_agent import BaseAgent
-from core.memory.event_store import EventStore
+from core.events.codec import EventDecodeError, load_event_data
+from core.memory.event_store import create_event_store
 from core.security.contact_filter import ContactProtectionFilter
+from core.security.verdict_cache import VerdictCache
 
 class CommunicationFilterAgent(BaseAgent):
     """
@@ -22,7 +24,15 @@ class CommunicationFilterAgent(BaseAgent):
             agent_id=agent_id
         )
         self.contact_filter = ContactProtectionFilter()
-        self.event_store = EventStore()
+        # Repeated messages reuse earlier verdicts. With VERDICT_CACHE_SHARED=true
+        # the verdicts are also shared with other replicas through Redis.
+        shared = os.getenv("VERDICT_CACHE_SHARED", "false").lower() == "true"
+        self.verdict_cache = VerdictCache(
+            self.contact_filter,
+            get_client=(lambda: self.event_consumer.redis_client) if shared else None,
+        )
+        self.add_cache(self.verdict_cache.cache)
+        self.event_store = create_event_store()
 
     async def process_event(self, event_data: Dict[str, Any]) -> None:
         """
@@ -30,17 +40,17 @@ class CommunicationFilterAgent(BaseAgent):
         """
         correlation_id = event_data.get('correlation_id')
         try:
-            raw_data = json.loads(event_data.get('data', '{}'))
+            raw_data = load_event_data(event_data)
             content_to_scan = raw_data.get('content', '')
             user_id = raw_data.get('user_id')
             project_id = raw_data.get('project_id')
-        except (json.JSONDecodeError, KeyError) as e:
+        except (EventDecodeError, KeyError) as e:
             self.logger.error(f"Could not parse event data for filtering: {e}")
             return
 
         self.logger.info(f"Scanning content for project {project_id} from user {user_id}.")
 
-        violations = self.contact_filter.scan_content(content_to_scan)
+        violations = await self.verdict_cache.scan_content(content_to_scan)
 
         if any(violations.values()):
             self.logger.warning(f"VIOLATION DETECTED for project {project_id}. User: {user_id}.")
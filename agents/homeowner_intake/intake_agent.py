@@ -7,18 +7,21 @@
 # - Removed multimodal features that were breaking the agent
 
 from core.base.base_agent import BaseAgent
-from core.events.publisher import EventPublisher
 from agents.homeowner_intake.nlp_processor import NLPProcessor
 from core.security.contact_filter import ContactProtectionFilter
-from core.memory.event_store import EventStore
+from core.memory.event_store import create_event_store
 from core.events.schemas import IntakePayload
+from core.events.codec import load_event_data
 from pydantic import ValidationError
 import asyncio
-import json
+import os
 
 class HomeownerIntakeAgent(BaseAgent):
     """Processes homeowner project submissions."""
 
+    # Every submission triggers a multimodal LLM call; keep bursts bounded.
+    max_concurrency = 5
+
     def __init__(self, agent_id: str | None = None):
         super().__init__(
             agent_type="homeowner_intake",
@@ -26,16 +29,22 @@ class HomeownerIntakeAgent(BaseAgent):
             group_name="intake_processors",
             agent_id=agent_id,
         )
-        self.nlp_processor = NLPProcessor()
+        # Identical submissions reuse earlier extractions. With LLM_CACHE_SHARED=true
+        # (the default) they are shared with other replicas through Redis, so
+        # redeliveries and retries handled elsewhere hit the cache too.
+        shared = os.getenv("LLM_CACHE_SHARED", "true").lower() == "true"
+        self.nlp_processor = NLPProcessor(
+            get_client=(lambda: self.event_consumer.redis_client) if shared else None,
+        )
+        self.add_cache(self.nlp_processor.cache.cache)
         self.contact_filter = ContactProtectionFilter()
-        self.event_store = EventStore()
-        self.event_publisher = EventPublisher()
+        self.event_store = create_event_store()
 
     async def process_event(self, event_data: dict) -> None:
         """Handle a single project submission event."""
         correlation_id = event_data.get("correlation_id")
         try:
-            payload = IntakePayload(**json.loads(event_data.get("data", "{}")))
+            payload = IntakePayload(**load_event_data(event_data))
         except ValidationError as e:
             self.logger.error(f"Invalid intake payload: {e}")
             return
@@ -43,7 +52,8 @@ class HomeownerIntakeAgent(BaseAgent):
         self.logger.info(f"Processing project submission {payload.project_id}...")
 
         description = payload.project_details.raw_description
-        violations = self.contact_filter.scan_content(description)
+        matches = self.contact_filter.find_matches(description)
+        violations = self.contact_filter.violations(matches)
 
         if any(violations.values()):
             self.logger.warning(
@@ -60,7 +70,7 @@ class HomeownerIntakeAgent(BaseAgent):
                 correlation_id=correlation_id,
             )
             payload.project_details.raw_description = self.contact_filter.scrub_content(
-                description
+                description, matches
             )
 
         extracted_data = await self.nlp_processor.extract_project_info(
@@ -1,19 +1,35 @@
 # agents/homeowner_intake/nlp_processor.py
 import os
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
+from core.memory.llm_cache import LLMResultCache
 import json
 
+# Bump when the extraction prompt or the parsing of its answer changes, so
+# cached extractions from the old prompt are not reused.
+PROMPT_VERSION = 1
+
+def normalize_description(description: str) -> str:
+    """Collapses spacing and blank lines, which don't change what the description says."""
+    return "\n".join(" ".join(line.split()) for line in description.splitlines() if line.strip())
+
 class NLPProcessor:
-    """Uses a multimodal LLM to extract structured data from text and images."""
-    def __init__(self):
+    """
+    Uses a multimodal LLM to extract structured data from text and images.
+    Extractions run at temperature 0, so they are cached per normalized
+    description and image URLs; see LLMResultCache.
+    """
+    def __init__(self, get_client: Optional[Callable[[], Any]] = None):
         self.logger = logging.getLogger(__name__)
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY environment variable must be set.")
         # gpt-4o is inherently multimodal
         self.llm = ChatOpenAI(model_name="gpt-4o", temperature=0.0)
+        self.cache = LLMResultCache(
+            "project_extractions", model=self.llm.model_name, prompt_version=PROMPT_VERSION, get_client=get_client
+        )
 
     def _create_multimodal_prompt(self, description: str, image_urls: List[str]) -> List[any]:
         """Creates a prompt list with both text and image content for gpt-4o."""
@@ -27,7 +43,14 @@ class NLPProcessor:
 
     async def extract_project_info(self, description: str, image_urls: Optional[List[str]] = None) -> Dict[str, Any]:
         """Extracts structured information from a multimodal prompt (text and optional images)."""
-        self.logger.info(f"Extracting project info with {len(image_urls or [])} images.")
+        description = normalize_description(description)
+        image_urls = list(image_urls or [])
+        inputs = {"description": description, "image_urls": image_urls}
+        cached = await self.cache.get(inputs)
+        if cached is not None:
+            self.logger.info("Reusing cached project extraction.")
+            return cached
+        self.logger.info(f"Extracting project info with {len(image_urls)} images.")
         
         # The prompt now includes instructions for analyzing the image.
         prompt_text = f"""
@@ -50,7 +73,7 @@ class NLPProcessor:
         """
         
         try:
-            prompt = self._create_multimodal_prompt(prompt_text, image_urls or [])
+            prompt = self._create_multimodal_prompt(prompt_text, image_urls)
             response = await self.llm.ainvoke(prompt)
             # The actual content is in the 'content' attribute of the AIMessage response
             json_response = response.content
@@ -62,10 +85,12 @@ class NLPProcessor:
                 json_str = json_response[json_start:json_end]
                 extracted_data = json.loads(json_str)
                 self.logger.info(f"Successfully extracted multimodal data: {extracted_data}")
+                await self.cache.set(inputs, extracted_data)
                 return extracted_data
             else:
                 raise json.JSONDecodeError("No JSON object found in response", json_response, 0)
 
         except Exception as e:
+            # The fallback is not cached: the next attempt calls the LLM again.
             self.logger.error(f"Multimodal NLP processing error: {e}", exc_info=True)
             return {"unclear_points": ["Could not fully analyze the project details."]}
@@ -7,6 +7,7 @@ from openai import AsyncOpenAI
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 import io
+from core.security.stream_scanner import StreamingContactScanner
 
 class RealtimeSTT_OpenAI:
     """Handles real-time speech-to-text using OpenAI's Whisper API."""
@@ -78,6 +79,8 @@ class VoiceIntakeAgent:
         self.llm = ChatOpenAI(model_name="gpt-4o", temperature=0.7)
         self.stt = RealtimeSTT_OpenAI()
         self.tts = RealtimeTTS_OpenAI()
+        # Utterances are scanned as one stream so numbers split across them are caught.
+        self.contact_scanner = StreamingContactScanner()
 
         self.conversation_history = [
             SystemMessage(content="You are a friendly and helpful home improvement consultant for Instabids. Your goal is to understand the user's project needs through a natural conversation. Start by greeting them and asking how you can help with their project today. Keep your responses concise and conversational.")
@@ -105,6 +108,7 @@ class VoiceIntakeAgent:
             return # Ignore empty transcriptions
 
         self.logger.info(f"User said (transcribed): {user_text}")
+        self._report_contact_matches(self.contact_scanner.feed(f"{user_text} "))
         self.conversation_history.append(HumanMessage(content=user_text))
 
         # 2. Generate Agent's Text Response
@@ -116,4 +120,17 @@ class VoiceIntakeAgent:
         audio_stream = await self.tts.stream_audio(agent_response.content)
         if audio_stream:
             async for chunk in audio_stream:
-                await self.client_socket.send_bytes(chunk)
\ No newline at end of file
+                await self.client_socket.send_bytes(chunk)
+
+    async def end_conversation(self):
+        """
+        Call when the session ends: reports contact details in the last
+        utterances, which the scanner holds until it knows they are complete.
+        """
+        self._report_contact_matches(self.contact_scanner.finish())
+
+    def _report_contact_matches(self, matches):
+        violations = self.contact_scanner.contact_filter.violations(matches)
+        if any(violations.values()):
+            kinds = sorted(kind for kind, found in violations.items() if found)
+            self.logger.warning(f"Contact violation ({', '.join(kinds)}) detected in voice intake for project {self.project_id}.")
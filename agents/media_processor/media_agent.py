@@ -18,10 +18,13 @@ from livekit import rtc, agents
 from openai import AsyncOpenAI
 from core.events.publisher import EventPublisher
 from core.memory.supabase_client import SupabaseClient # Assuming this exists for storage
+from core.security.contact_filter import ContactProtectionFilter
+from core.security.stream_scanner import StreamingContactScanner
 
 # Initialize clients
 openai_client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 event_publisher = EventPublisher()
+contact_filter = ContactProtectionFilter()
 # supabase_client = SupabaseClient() # This should be properly initialized
 
 class MediaProcessingAgent:
@@ -92,6 +95,8 @@ class MediaProcessingAgent:
             return
 
         stt = agents.stt.STT()
+        # Contact details are often spoken across several transcripts.
+        contact_scanner = StreamingContactScanner(contact_filter)
         async for stt_event in stt.start(ctx, audio_track):
             if stt_event.type == agents.stt.SpeechEventType.FINAL_TRANSCRIPT:
                 transcript = stt_event.alternatives[0].text
@@ -101,3 +106,15 @@ class MediaProcessingAgent:
                         "ai:speech_to_text_transcripts",
                         {"project_id": ctx.room.name, "transcript": transcript}
                     )
+                    await self.report_contact_matches(ctx, contact_scanner.feed(f"{transcript} "))
+        await self.report_contact_matches(ctx, contact_scanner.finish())
+
+    async def report_contact_matches(self, ctx: agents.JobContext, matches):
+        """Publishes a contact violation for matches found in the transcript stream."""
+        violations = contact_filter.violations(matches)
+        if any(violations.values()):
+            await event_publisher.publish(
+                stream="security:contact_violations",
+                event_type="security:contact_violation_detected",
+                data={"project_id": ctx.room.name, "source": "voice_transcript", "violations": violations},
+            )
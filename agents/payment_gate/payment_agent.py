@@ -1,11 +1,11 @@
 # agents/payment_gate/payment_agent.py
 
-import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from core.base.base_agent import BaseAgent
-from core.memory.event_store import EventStore
+from core.events.codec import EventDecodeError, load_event_data
+from core.memory.event_store import create_event_store
 from core.security.cost_breaker import CostCircuitBreaker
 # In a real application, you would use the Stripe Python library and uncomment the following line
 # import stripe
@@ -20,9 +20,17 @@ class PaymentGateAgent(BaseAgent):
             agent_type='payment_gate',
             stream_name='payment:events',
             group_name='payment_gate_processors',
-            agent_id=agent_id
+            agent_id=agent_id,
+            streams=['homeowner:scope_complete'],
+            # Only projects scoped from now on: replaying the stream's history
+            # would ask every past project to pay again.
+            start_ids={'homeowner:scope_complete': '$'},
         )
-        self.event_store = EventStore()
+        # Scoped projects arrive on homeowner:scope_complete, Stripe webhooks
+        # on payment:events. Both streams are read by the same consumer.
+        self.route_event('homeowner:scope_complete', self._on_scope_complete)
+        self.route_event('stripe:webhook:payment_succeeded', self._on_payment_succeeded)
+        self.event_store = create_event_store()
         self.cost_breaker = CostCircuitBreaker()
         # if not os.getenv("STRIPE_SECRET_KEY"):
         #     self.logger.warning("STRIPE_SECRET_KEY not set. Payment processing will be simulated.")
@@ -30,23 +38,25 @@ class PaymentGateAgent(BaseAgent):
         #     stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
 
     async def process_event(self, event_data: Dict[str, Any]) -> None:
-        """Processes payment-related events from multiple upstream sources."""
-        event_type = event_data.get('event_type')
-        correlation_id = event_data.get('correlation_id')
+        """Fallback for events without a route; payment events are routed by type."""
+        self.logger.debug(f"PaymentGateAgent ignoring event type '{event_data.get('event_type')}'.")
+
+    def _parse_data(self, event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         try:
-            raw_data = json.loads(event_data.get('data', '{}'))
-        except (json.JSONDecodeError, TypeError):
+            return load_event_data(event_data)
+        except (EventDecodeError, TypeError):
             self.logger.error(f"Invalid JSON data in event: {event_data}")
-            return
+            return None
+
+    async def _on_scope_complete(self, event_data: Dict[str, Any]) -> None:
+        raw_data = self._parse_data(event_data)
+        if raw_data is not None:
+            await self._initiate_payment_flow(raw_data, event_data.get('correlation_id'))
 
-        # This agent listens to two streams. In a real system, it would have two consumer instances.
-        # Here we simulate this by checking the event type.
-        if event_type == 'homeowner:scope_complete':
-            await self._initiate_payment_flow(raw_data, correlation_id)
-        elif event_type == 'stripe:webhook:payment_succeeded':
-            await self._handle_payment_success(raw_data, correlation_id)
-        else:
-            self.logger.debug(f"PaymentGateAgent ignoring event type '{event_type}'.")
+    async def _on_payment_succeeded(self, event_data: Dict[str, Any]) -> None:
+        raw_data = self._parse_data(event_data)
+        if raw_data is not None:
+            await self._handle_payment_success(raw_data, event_data.get('correlation_id'))
 
     async def _initiate_payment_flow(self, scope_data: Dict[str, Any], correlation_id: str):
         """Initiates a payment request once a project is ready."""
@@ -75,14 +85,15 @@ class PaymentGateAgent(BaseAgent):
 
         self.logger.info(f"Payment successful for project {project_id}. Releasing contact info.")
 
-        # 1. Log the payment success event for auditing
+        # 1. Log the payment success event for auditing. Contact release must
+        # not happen without the audit record, so wait until it is stored.
         await self.event_store.append_event({
             "event_type": "payment:succeeded",
             "aggregate_id": project_id,
             "event_data": payment_data,
             "agent_id": self.agent_id,
             "correlation_id": correlation_id,
-        })
+        }, durable=True)
 
         # 2. CRITICAL: Publish the contact release event.
         # This is the single source of truth that authorizes contact info to be shared.
@@ -1,20 +1,28 @@
 # agents/project_scope/scope_agent.py
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 import os
 from core.base.base_agent import BaseAgent
-from core.memory.event_store import EventStore
+from core.events.codec import load_event_data
+from core.memory.event_store import create_event_store
+from core.memory.llm_cache import LLMResultCache
 from langchain.chains import LLMChain
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
+# Bump when the scope prompt or the parsing of its answer changes, so cached
+# scopes from the old prompt are not reused.
+SCOPE_PROMPT_VERSION = 1
+
 class ProjectScopeAgent(BaseAgent):
     """Agent responsible for generating a scoped project plan."""
 
     # Define the attribute at the class level so tests can patch it without
     # instantiating the LLM chain in `__init__`.
     chain: LLMChain | None = None
+    max_concurrency = 5
+
     def __init__(self, agent_id: str = None):
         super().__init__(
             agent_type='project_scope',
@@ -22,11 +30,21 @@ class ProjectScopeAgent(BaseAgent):
             group_name='scope_processors',
             agent_id=agent_id
         )
-        self.event_store = EventStore()
+        self.event_store = create_event_store()
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY environment variable must be set.")
         self.llm = ChatOpenAI(model_name="gpt-4o", temperature=0.1)
         self.chain = LLMChain(llm=self.llm, prompt=self._create_scope_prompt())
+        # The scope depends only on extracted_data, so repeats reuse the first
+        # answer; shared through Redis like the intake extractions.
+        shared = os.getenv("LLM_CACHE_SHARED", "true").lower() == "true"
+        self.scope_cache: Optional[LLMResultCache] = LLMResultCache(
+            "project_scopes",
+            model=self.llm.model_name,
+            prompt_version=SCOPE_PROMPT_VERSION,
+            get_client=(lambda: self.event_consumer.redis_client) if shared else None,
+        )
+        self.add_cache(self.scope_cache.cache)
 
     def _create_scope_prompt(self) -> ChatPromptTemplate:
         template = """
@@ -46,17 +64,29 @@ class ProjectScopeAgent(BaseAgent):
         """
         return ChatPromptTemplate.from_template(template)
 
+    async def generate_scope(self, extracted_data: Any) -> Dict[str, Any]:
+        """Runs the scope chain, or reuses its answer for the same extracted data."""
+        if self.scope_cache is not None:
+            cached = await self.scope_cache.get(extracted_data)
+            if cached is not None:
+                return cached
+        response = await self.chain.arun(intake_data=json.dumps(extracted_data))
+        structured_scope = json.loads(response)
+        # Failures raise above, so only parsed answers are cached.
+        if self.scope_cache is not None:
+            await self.scope_cache.set(extracted_data, structured_scope)
+        return structured_scope
+
     async def process_event(self, event_data: Dict[str, Any]) -> None:
         correlation_id = event_data.get('correlation_id')
         try:
-            raw_data = json.loads(event_data.get('data', '{}'))
+            raw_data = load_event_data(event_data)
             project_id = raw_data.get('project_id')
             if not project_id:
                 return
 
             self.logger.info(f"Generating scope for project {project_id}...")
-            response = await self.chain.arun(intake_data=json.dumps(raw_data.get("extracted_data")))
-            structured_scope = json.loads(response)
+            structured_scope = await self.generate_scope(raw_data.get("extracted_data"))
 
             await self.event_store.append_event({
                 "event_type": "project:scope_generated", "aggregate_id": project_id,
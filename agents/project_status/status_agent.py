@@ -0,0 +1,81 @@
+# agents/project_status/status_agent.py
+
+from typing import Dict, Any, Optional
+
+from core.base.base_agent import BaseAgent
+from core.events.codec import EventDecodeError, load_event_data
+from core.memory.event_store import create_event_store
+from core.memory.project_status import ProjectStatusStore, scope_fields
+
+class ProjectStatusAgent(BaseAgent):
+    """Projects the pipeline streams into the per-project status records
+    served by GET /projects/{project_id}/status, so the API answers with a
+    single hash lookup instead of reconstructing state from events.
+    """
+    def __init__(self, agent_id: str = None):
+        super().__init__(
+            agent_type='project_status',
+            stream_name='homeowner:project_submitted',
+            group_name='project_status_projectors',
+            agent_id=agent_id,
+            streams=[
+                'homeowner:intake_complete',
+                'homeowner:scope_complete',
+                'ui:updates',
+                'payment:contact_released',
+                'system:agent_errors',
+            ],
+        )
+        self.route_event('homeowner:project_submitted', self._on_submitted)
+        self.route_event('homeowner:intake_complete', self._on_intake_complete)
+        self.route_event('homeowner:scope_complete', self._on_scope_complete)
+        self.route_event('ui:payment_required', self._on_payment_required)
+        self.route_event('payment:contact_released', self._on_contact_released)
+        self.route_event('scope:generation_failed', self._on_failed)
+        # Status records live next to the streams, on the consumer's connection.
+        self.status_store = ProjectStatusStore(lambda: self.event_consumer.redis_client)
+        self.event_store = create_event_store()
+
+    async def process_event(self, event_data: Dict[str, Any]) -> None:
+        """Fallback for events that don't change a project's status."""
+        self.logger.debug(f"ProjectStatusAgent ignoring event type '{event_data.get('event_type')}'.")
+
+    async def _record(self, event_data: Dict[str, Any], stage: str, fields_from=None) -> None:
+        try:
+            data = load_event_data(event_data)
+        except (EventDecodeError, TypeError):
+            self.logger.error(f"Invalid JSON data in event: {event_data}")
+            return
+        project_id = data.get('project_id')
+        if not project_id or project_id == 'unknown':
+            return
+        fields = fields_from(data) if fields_from else None
+        await self.status_store.record(project_id, stage, event_data.get('timestamp'), fields)
+
+    async def _on_submitted(self, event_data: Dict[str, Any]) -> None:
+        await self._record(event_data, 'submitted')
+
+    async def _on_intake_complete(self, event_data: Dict[str, Any]) -> None:
+        await self._record(event_data, 'intake_complete')
+
+    async def _on_scope_complete(self, event_data: Dict[str, Any]) -> None:
+        await self._record(event_data, 'scope_complete', lambda data: scope_fields(data.get('structured_scope') or {}))
+
+    async def _on_payment_required(self, event_data: Dict[str, Any]) -> None:
+        await self._record(event_data, 'payment_required', lambda data: {
+            "payment_state": "required", "payment_amount_cents": data.get('amount_cents'),
+        })
+
+    async def _on_contact_released(self, event_data: Dict[str, Any]) -> None:
+        # Contact is only released after a successful payment.
+        await self._record(event_data, 'payment_succeeded', lambda data: {
+            "payment_state": "succeeded", "payment_transaction_id": data.get('transaction_id'),
+        })
+        await self._record(event_data, 'contact_released')
+
+    async def _on_failed(self, event_data: Dict[str, Any]) -> None:
+        await self._record(event_data, 'failed', lambda data: {"error": data.get('error')})
+
+    async def rebuild(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Replaces a project's status record with one replayed from the event store."""
+        return await self.status_store.rebuild(project_id, self.event_store)
@@ -1,7 +1,7 @@
 # agents/ui_generator/ui_agent.py
-import json
 from typing import Dict, Any
 from core.base.base_agent import BaseAgent
+from core.events.codec import load_event_data
 
 class UIGeneratorAgent(BaseAgent):
     """
@@ -24,7 +24,7 @@ class UIGeneratorAgent(BaseAgent):
         the event into a standardized UI state object.
         """
         event_type = event_data.get('event_type')
-        raw_data = json.loads(event_data.get('data', '{}'))
+        raw_data = load_event_data(event_data)
         project_id = raw_data.get('project_id')
 
         self.logger.info(f"UI-Generator received event '{event_type}' for project '{project_id}'. A real-time update would be pushed to the UI.")
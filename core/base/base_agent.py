@@ -2,27 +2,68 @@
 import asyncio
 import uuid
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional
 from core.events.consumer import EventConsumer
+from core.events.envelope import EventEnvelope
 from core.events.publisher import EventPublisher
+from core.events.consume_scheduler import ConsumeScheduler
+from core.events.reclaimer import PendingReclaimer
+from core.base.worker_pool import AdaptiveWorkerPool
+from core.base.metrics import AgentMetrics, publish_snapshot, remove_snapshot
 from typing import Any
 
 class BaseAgent(ABC):
-    def __init__(self, agent_type: str, stream_name: str, group_name: str, agent_id: Optional[str] = None):
+    # Upper bound on concurrently running handlers. Subclasses doing heavy LLM
+    # work can lower it; operators override it per agent type with
+    # <AGENT_TYPE>_MAX_CONCURRENCY (e.g. HOMEOWNER_INTAKE_MAX_CONCURRENCY) or
+    # for every agent with AGENT_MAX_CONCURRENCY.
+    max_concurrency: int = 10
+    # Agents that record events set this; graceful_shutdown() closes it.
+    event_store: Any = None
+
+    def __init__(
+        self,
+        agent_type: str,
+        stream_name: str,
+        group_name: str,
+        agent_id: Optional[str] = None,
+        streams: Optional[List[str]] = None,
+        start_ids: Optional[Dict[str, str]] = None,
+    ):
+        """
+        `stream_name` is the agent's primary input stream. Agents that react
+        to several upstream streams pass the additional ones in `streams`;
+        all of them are read by one consumer with a single XREADGROUP.
+        `start_ids` sets where a newly created group starts on a stream (see
+        EventConsumer).
+        """
         self.agent_type = agent_type
         self.agent_id = agent_id or f"{self.agent_type}_{uuid.uuid4().hex[:8]}"
-        self.event_consumer = EventConsumer(stream_name=stream_name, group_name=group_name, consumer_name=self.agent_id)
-
-        # Create a fresh publisher instance for each agent. When EventPublisher
-        # is patched in tests, calling it normally would return the same mock
-        # object for every agent, causing shared call counts. By instantiating a
-        # new object from the returned instance's class, each agent gets an
-        # isolated mock publisher.
-        initial_pub = EventPublisher()
-        self._event_publisher = initial_pub.__class__()
+        self.event_consumer = EventConsumer(
+            stream_name=stream_name, group_name=group_name, consumer_name=self.agent_id, streams=streams,
+            start_ids=start_ids,
+        )
+        self._event_routes: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        self._stream_routes: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        self._event_publisher = EventPublisher()
         self.is_running = False
-        self._tasks: List[asyncio.Task] = []
+        self.worker_pool = AdaptiveWorkerPool(
+            max_workers=self._resolve_max_concurrency(),
+            min_workers=int(os.getenv("AGENT_MIN_CONCURRENCY", "1")),
+            name=self.agent_id,
+        )
+        self.consume_scheduler = ConsumeScheduler()
+        self.reclaimer = PendingReclaimer(self.event_consumer)
+        self._reclaim_task: Optional[asyncio.Task] = None
+        # Snapshots go to a shared hash every METRICS_INTERVAL seconds (0 disables).
+        self.metrics = AgentMetrics(self.agent_type, self.agent_id)
+        self.metrics_interval = float(os.getenv("METRICS_INTERVAL", "5.0"))
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+        self._caches: List[Any] = []
         self.logger = logging.getLogger(f"agent.{self.agent_type}.{self.agent_id}")
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
@@ -38,10 +79,55 @@ class BaseAgent(ABC):
         except Exception:
             self._event_publisher = value
 
+    def _resolve_max_concurrency(self) -> int:
+        value = (
+            os.getenv(f"{self.agent_type.upper()}_MAX_CONCURRENCY")
+            or os.getenv("AGENT_MAX_CONCURRENCY")
+            or self.max_concurrency
+        )
+        return max(1, int(value))
+
     @abstractmethod
     async def process_event(self, event_data: Dict[str, Any]) -> None:
         pass
 
+    def route_event(self, event_type: str, handler: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """Dispatches events of `event_type` to `handler` instead of process_event()."""
+        self._event_routes[event_type] = handler
+
+    def route_stream(self, stream: str, handler: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """Dispatches events read from `stream` to `handler` instead of process_event()."""
+        self._stream_routes[stream] = handler
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Registers a coroutine function awaited during graceful_shutdown(),
+        after in-flight handlers finished and before connections close, e.g.
+        to flush buffered writes. The agent's `event_store` needs no hook: it
+        is closed after these, so buffered event writes reach the database
+        before exit.
+        """
+        self._shutdown_hooks.append(hook)
+
+    def add_cache(self, cache: Any) -> None:
+        """
+        Reports `cache` (anything with `name` and `stats()`, e.g. a
+        TieredCache) in the agent's metrics snapshots.
+        """
+        self._caches.append(cache)
+
+    async def dispatch_event(self, stream: str, event_data: Dict[str, Any]) -> None:
+        """
+        Routes an event by event type first, then by source stream, falling
+        back to process_event() when no route matches.
+        """
+        handler = (
+            self._event_routes.get(event_data.get('event_type'))
+            or self._stream_routes.get(stream)
+            or self.process_event
+        )
+        await handler(event_data)
+
     async def setup(self):
         """
         Performs one-time, awaitable setup for the agent, like creating
@@ -51,7 +137,7 @@ class BaseAgent(ABC):
         self.logger.info(f"Setting up agent {self.agent_id}...")
         await self.event_consumer.setup()
         self.logger.info(
-            f"Agent {self.agent_id} setup complete for stream '{self.event_consumer.stream_name}'."
+            f"Agent {self.agent_id} setup complete for streams {self.event_consumer.streams}."
         )
 
     async def run(self):
@@ -61,21 +147,63 @@ class BaseAgent(ABC):
         """
         self.logger.info(f"Agent {self.agent_id} entering main processing loop.")
         self.is_running = True
+        self._reclaim_task = asyncio.create_task(self._reclaim_loop())
+        if self.metrics_interval > 0:
+            self._metrics_task = asyncio.create_task(self._metrics_loop())
         while self.is_running:
             try:
-                events = await self.event_consumer.consume()
-                if not events:
-                    await asyncio.sleep(1)  # Short sleep when idle
-                    continue
-                for stream, messages in events:
+                # Backpressure: only read as many messages as there are free
+                # worker slots, and don't read at all while the pool is full.
+                free_slots = await self.worker_pool.wait_for_slot()
+                if self.consume_scheduler.lag_sample_due():
+                    self.consume_scheduler.record_lag(await self.event_consumer.get_lag())
+                params = self.consume_scheduler.next_params(free_slots, self.worker_pool.in_flight)
+                events = await self.event_consumer.consume(count=params.count, block=params.block)
+                self.consume_scheduler.record_read(
+                    params.count, sum(len(messages) for _, messages in events or [])
+                )
+                # No idle sleep here: the blocking read already waits for work.
+                for stream, messages in events or []:
                     for message_id, event_data in messages:
-                        task = asyncio.create_task(self._handle_message(stream, message_id, event_data))
-                        self._tasks.append(task)
-                        task.add_done_callback(self._tasks.remove)
+                        await self.worker_pool.submit(self._handle_message(stream, message_id, event_data))
             except Exception as e:
                 self.logger.error(f"Error in consumer loop: {e}", exc_info=True)
                 await asyncio.sleep(5)  # Backoff on loop error
 
+    async def _reclaim_loop(self) -> None:
+        """
+        Periodically retries idle pending entries. It only ever uses half of
+        the currently free worker slots so new messages keep flowing.
+        """
+        while self.is_running:
+            await asyncio.sleep(self.reclaimer.interval)
+            try:
+                budget = min(self.reclaimer.batch_size, (self.worker_pool.free_slots + 1) // 2)
+                for stream, messages in await self.reclaimer.reclaim(budget):
+                    for message_id, event_data in messages:
+                        await self.worker_pool.submit(self._handle_message(stream, message_id, event_data))
+            except Exception as e:
+                self.logger.error(f"Error reclaiming pending entries: {e}", exc_info=True)
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        reclaimer = self.reclaimer.stats()
+        return self.metrics.snapshot(
+            in_flight=self.worker_pool.in_flight,
+            worker_limit=self.worker_pool.limit,
+            retries=reclaimer["reclaimed"],
+            dead_lettered=reclaimer["dead_lettered"],
+            pending_acks=self.event_consumer.ack_batcher.pending_count,
+            caches={cache.name: cache.stats() for cache in self._caches},
+        )
+
+    async def _metrics_loop(self) -> None:
+        while self.is_running:
+            await asyncio.sleep(self.metrics_interval)
+            try:
+                await publish_snapshot(self.event_consumer.redis_client, self.metrics_snapshot())
+            except Exception as e:
+                self.logger.warning(f"Could not publish metrics: {e}")
+
     # Deprecate the old method to avoid confusion.
     # We will remove it after confirming the new logic works.
     async def start_processing(self):
@@ -84,22 +212,47 @@ class BaseAgent(ABC):
         await self.setup()
         await self.run()
 
-    async def _handle_message(self, stream: bytes, message_id: bytes, event_data: Dict[bytes, bytes]) -> None:
+    async def _handle_message(self, stream: bytes, message_id: bytes, event_data: Dict[bytes, bytes]) -> bool:
+        started = time.perf_counter()
         decoded_stream = stream.decode('utf-8')
         decoded_message_id = message_id.decode('utf-8')
         try:
-            decoded_event_data = {k.decode('utf-8'): v.decode('utf-8') for k, v in event_data.items()}
-            await self.process_event(decoded_event_data)
+            # Fields are decoded lazily; routing on event_type never touches `data`.
+            envelope = event_data if isinstance(event_data, EventEnvelope) else EventEnvelope(event_data)
+            decoded = time.perf_counter()
+            await self.dispatch_event(decoded_stream, envelope)
+            processed = time.perf_counter()
             await self.event_consumer.acknowledge(decoded_stream, decoded_message_id)
+            self.metrics.observe(decoded - started, processed - decoded, time.perf_counter() - processed)
             self.logger.debug(f"Processed message {decoded_message_id}.")
+            return True
         except Exception as e:
+            self.metrics.record_error()
             self.logger.error(f"Failed to process message {decoded_message_id}: {e}", exc_info=True)
+            return False
 
     async def graceful_shutdown(self) -> None:
         self.logger.info(f"Shutting down agent {self.agent_id}...")
         self.is_running = False
-        if self._tasks:
-            await asyncio.wait(self._tasks, timeout=5.0)
+        if self._reclaim_task:
+            self._reclaim_task.cancel()
+        if self._metrics_task:
+            self._metrics_task.cancel()
+        await self.worker_pool.drain(timeout=5.0)
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                self.logger.error(f"Shutdown hook {hook} failed: {e}", exc_info=True)
+        if self.event_store is not None:
+            try:
+                await self.event_store.close()
+            except Exception as e:
+                self.logger.error(f"Closing the event store failed: {e}", exc_info=True)
+        try:
+            await remove_snapshot(self.event_consumer.redis_client, self.agent_id)
+        except Exception as e:
+            self.logger.warning(f"Could not remove metrics snapshot: {e}")
         await self.event_consumer.close()
         await self.event_publisher.close()
         self.logger.info(f"Agent {self.agent_id} shut down.")
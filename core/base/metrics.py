@@ -0,0 +1,256 @@
+# core/base/metrics.py
+import bisect
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# Redis hash holding the latest snapshot of every agent process, one field
+# per agent_id. Agents overwrite their field every METRICS_INTERVAL seconds.
+METRICS_KEY = "swarm:metrics"
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus style.
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# `handler` is the whole message; the others break it down. `decode` covers
+# decoding the stream key and ID and wrapping the fields in an envelope,
+# `process` routing and the handler itself (including lazy payload
+# decoding), `ack` queueing the XACK.
+STAGES = ("handler", "decode", "process", "ack")
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; cheap enough to update on every event."""
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the q-quantile by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= target:
+                lower = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else LATENCY_BUCKETS[-1]
+                return lower + (upper - lower) * (target - cumulative) / count
+            cumulative += count
+        return LATENCY_BUCKETS[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"buckets": list(self.counts), "sum": self.sum, "count": self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        counts = data.get("buckets") or []
+        if len(counts) == len(histogram.counts):
+            histogram.counts = list(counts)
+        histogram.sum = data.get("sum", 0.0)
+        histogram.count = data.get("count", 0)
+        return histogram
+
+class AgentMetrics:
+    """
+    In-process counters and latency histograms for one agent. Updated on
+    the hot path, so it only does integer and float arithmetic there;
+    rates are computed when a snapshot is taken.
+    """
+    def __init__(self, agent_type: str, agent_id: str):
+        self.agent_type = agent_type
+        self.agent_id = agent_id
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self.processed = 0
+        self.errors = 0
+        self.started_at = time.time()
+        self._last_snapshot = time.monotonic()
+        self._last_processed = 0
+        self._last_errors = 0
+
+    def observe(self, decode: float, process: float, ack: float) -> None:
+        histograms = self.histograms
+        histograms["decode"].observe(decode)
+        histograms["process"].observe(process)
+        histograms["ack"].observe(ack)
+        histograms["handler"].observe(decode + process + ack)
+        self.processed += 1
+
+    def record_error(self) -> None:
+        self.errors += 1
+
+    def snapshot(self, **gauges: Any) -> Dict[str, Any]:
+        """
+        Returns a JSON-serialisable snapshot. `events_per_sec` and
+        `error_rate` cover the period since the previous snapshot; extra
+        gauges (in-flight count, worker limit, ...) are passed as keywords.
+        """
+        now = time.monotonic()
+        elapsed = max(now - self._last_snapshot, 1e-9)
+        processed = self.processed - self._last_processed
+        errors = self.errors - self._last_errors
+        self._last_snapshot, self._last_processed, self._last_errors = now, self.processed, self.errors
+        snapshot = {
+            "agent_type": self.agent_type,
+            "agent_id": self.agent_id,
+            "updated_at": time.time(),
+            "uptime_s": time.time() - self.started_at,
+            "processed": self.processed,
+            "errors": self.errors,
+            "events_per_sec": processed / elapsed,
+            "error_rate": errors / (processed + errors) if processed + errors else 0.0,
+            "latency": {stage: histogram.to_dict() for stage, histogram in self.histograms.items()},
+        }
+        snapshot.update(gauges)
+        return snapshot
+
+async def publish_snapshot(client: Any, snapshot: Dict[str, Any], key: str = METRICS_KEY) -> None:
+    await client.hset(key, snapshot["agent_id"], json.dumps(snapshot))
+
+async def remove_snapshot(client: Any, agent_id: str, key: str = METRICS_KEY) -> None:
+    await client.hdel(key, agent_id)
+
+async def load_snapshots(client: Any, max_age: Optional[float] = None, key: str = METRICS_KEY) -> List[Dict[str, Any]]:
+    """
+    Returns the snapshots of all agent processes. Those not refreshed within
+    `max_age` seconds (METRICS_STALE_AFTER, default 30) belong to processes
+    that died without cleaning up; they are skipped and deleted, as are
+    unreadable ones, so the hash doesn't grow with every restart.
+    """
+    max_age = max_age if max_age is not None else float(os.getenv("METRICS_STALE_AFTER", "30"))
+    cutoff = time.time() - max_age
+    snapshots, stale = [], []
+    for field, raw in (await client.hgetall(key)).items():
+        try:
+            snapshot = json.loads(raw)
+        except ValueError:
+            logging.getLogger(__name__).warning("Deleting unreadable metrics snapshot.")
+            stale.append(field)
+            continue
+        if snapshot.get("updated_at", 0) >= cutoff:
+            snapshots.append(snapshot)
+        else:
+            stale.append(field)
+    if stale:
+        await client.hdel(key, *stale)
+    return sorted(snapshots, key=lambda snapshot: (snapshot["agent_type"], snapshot["agent_id"]))
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+def aggregate(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Combines per-process snapshots into one summary per agent type."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+    for snapshot in snapshots:
+        agent_type = snapshot["agent_type"]
+        entry = summary.setdefault(agent_type, {
+            "status": "active", "instances": 0, "processed": 0, "errors": 0, "retries": 0,
+            "dead_lettered": 0, "in_flight": 0, "events_per_sec": 0.0, "error_rate": 0.0, "workers": [],
+            "caches": {},
+        })
+        entry["instances"] += 1
+        entry["workers"].append(snapshot["agent_id"])
+        for field in ("processed", "errors", "retries", "dead_lettered", "in_flight"):
+            entry[field] += snapshot.get(field, 0)
+        entry["events_per_sec"] += snapshot.get("events_per_sec", 0.0)
+        for name, stats in snapshot.get("caches", {}).items():
+            cache = entry["caches"].setdefault(name, {field: 0 for field, _, _ in _CACHE_COUNTERS + _CACHE_GAUGES})
+            for field in cache:
+                cache[field] += stats.get(field, 0)
+        merged = histograms.setdefault(agent_type, {stage: LatencyHistogram() for stage in STAGES})
+        for stage, data in snapshot.get("latency", {}).items():
+            if stage in merged:
+                merged[stage].merge(LatencyHistogram.from_dict(data))
+    for agent_type, entry in summary.items():
+        attempts = entry["processed"] + entry["errors"]
+        entry["error_rate"] = entry["errors"] / attempts if attempts else 0.0
+        for cache in entry["caches"].values():
+            lookups = cache["hits"] + cache["misses"]
+            cache["hit_rate"] = cache["hits"] / lookups if lookups else 0.0
+        entry["latency_ms"] = {
+            stage: {"p50": _ms(histogram.quantile(0.5)), "p99": _ms(histogram.quantile(0.99)),
+                    "mean": _ms(histogram.sum / histogram.count if histogram.count else None)}
+            for stage, histogram in histograms[agent_type].items()
+        }
+    return summary
+
+_COUNTERS = (
+    ("processed", "swarm_agent_events_processed_total", "Events handled successfully."),
+    ("errors", "swarm_agent_event_errors_total", "Events whose handler failed."),
+    ("retries", "swarm_agent_event_retries_total", "Pending events reclaimed for another attempt."),
+    ("dead_lettered", "swarm_agent_events_dead_lettered_total", "Poison events moved to a dead-letter stream."),
+)
+_GAUGES = (
+    ("in_flight", "swarm_agent_in_flight", "Handlers currently running."),
+    ("worker_limit", "swarm_agent_worker_limit", "Current adaptive concurrency limit."),
+    ("events_per_sec", "swarm_agent_events_per_second", "Events handled per second since the previous snapshot."),
+)
+
+# Per cache, from the `caches` entry of a snapshot (see BaseAgent.add_cache).
+_CACHE_COUNTERS = (
+    ("hits", "swarm_agent_cache_hits_total", "Cache lookups answered from either tier."),
+    ("shared_hits", "swarm_agent_cache_shared_hits_total", "Cache lookups answered from the shared Redis tier."),
+    ("misses", "swarm_agent_cache_misses_total", "Cache lookups that found nothing."),
+    ("evictions", "swarm_agent_cache_evictions_total", "Entries evicted from the in-process tier."),
+    ("shared_errors", "swarm_agent_cache_shared_errors_total", "Failed reads and writes of the shared tier."),
+)
+_CACHE_GAUGES = (
+    ("size", "swarm_agent_cache_entries", "Entries in the in-process tier."),
+)
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+def render_prometheus(snapshots: Iterable[Dict[str, Any]]) -> str:
+    """Renders snapshots in the Prometheus text exposition format (0.0.4)."""
+    snapshots = list(snapshots)
+    lines: List[str] = []
+    for kind, metrics in (("counter", _COUNTERS), ("gauge", _GAUGES)):
+        for field, name, help_text in metrics:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for snapshot in snapshots:
+                labels = _labels(agent_type=snapshot["agent_type"], agent_id=snapshot["agent_id"])
+                lines.append(f"{name}{labels} {snapshot.get(field, 0)}")
+    for kind, metrics in (("counter", _CACHE_COUNTERS), ("gauge", _CACHE_GAUGES)):
+        for field, name, help_text in metrics:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for snapshot in snapshots:
+                for cache, stats in snapshot.get("caches", {}).items():
+                    labels = _labels(agent_type=snapshot["agent_type"], agent_id=snapshot["agent_id"], cache=cache)
+                    lines.append(f"{name}{labels} {stats.get(field, 0)}")
+    name = "swarm_agent_stage_seconds"
+    lines += [f"# HELP {name} Per-event latency by stage (handler = decode + process + ack).",
+              f"# TYPE {name} histogram"]
+    for snapshot in snapshots:
+        for stage, data in snapshot.get("latency", {}).items():
+            histogram = LatencyHistogram.from_dict(data)
+            base = dict(agent_type=snapshot["agent_type"], agent_id=snapshot["agent_id"], stage=stage)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(**base, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(**base)} {histogram.sum}")
+            lines.append(f"{name}_count{_labels(**base)} {histogram.count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,128 @@
+# core/base/worker_pool.py
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, Optional, Set
+
+class AdaptiveWorkerPool:
+    """
+    Bounded pool of in-flight event handlers for a single agent.
+
+    The consume loop calls wait_for_slot() before reading from Redis so it only
+    pulls as many messages as it can actually run. The slot limit adapts to
+    observed handler behaviour: it is cut multiplicatively when the error rate
+    or the handler latency degrades, and grows by one slot at a time while the
+    pool is saturated and healthy (AIMD).
+    """
+    def __init__(
+        self,
+        max_workers: int,
+        min_workers: int = 1,
+        window_size: int = 20,
+        error_rate_threshold: float = 0.2,
+        latency_tolerance: float = 2.0,
+        name: str = "worker_pool",
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self.min_workers = max(1, min(min_workers, max_workers))
+        self.window_size = window_size
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_tolerance = latency_tolerance
+        self.limit = max_workers
+        self.logger = logging.getLogger(f"worker_pool.{name}")
+
+        self._tasks: Set[asyncio.Task] = set()
+        self._slot_freed = asyncio.Condition()
+        self._baseline_latency: Optional[float] = None
+        self._reset_window()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def free_slots(self) -> int:
+        return max(0, self.limit - self.in_flight)
+
+    async def wait_for_slot(self) -> int:
+        """Blocks until at least one slot is free and returns the number of free slots."""
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self.free_slots > 0)
+            return self.free_slots
+
+    async def submit(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Schedules a handler once a slot is available."""
+        await self.wait_for_slot()
+        task = asyncio.create_task(self._run(coro))
+        self._tasks.add(task)
+        if self.in_flight >= self.limit:
+            self._window_saturated = True
+        return task
+
+    async def _run(self, coro: Awaitable[Any]) -> None:
+        started = time.perf_counter()
+        success = False
+        try:
+            # Handlers report a handled failure by returning False.
+            success = (await coro) is not False
+        except Exception as e:
+            self.logger.error(f"Unhandled error in worker: {e}", exc_info=True)
+        finally:
+            self._record(time.perf_counter() - started, success)
+            self._tasks.discard(asyncio.current_task())
+            async with self._slot_freed:
+                self._slot_freed.notify_all()
+
+    def _reset_window(self) -> None:
+        self._window_count = 0
+        self._window_errors = 0
+        self._window_latency = 0.0
+        self._window_saturated = False
+
+    def _record(self, latency: float, success: bool) -> None:
+        self._window_count += 1
+        self._window_latency += latency
+        if not success:
+            self._window_errors += 1
+        if self._window_count >= self.window_size:
+            self._adapt()
+
+    def _adapt(self) -> None:
+        error_rate = self._window_errors / self._window_count
+        avg_latency = self._window_latency / self._window_count
+        if self._baseline_latency is None or avg_latency < self._baseline_latency:
+            self._baseline_latency = avg_latency
+
+        previous = self.limit
+        if error_rate > self.error_rate_threshold:
+            self.limit = max(self.min_workers, self.limit // 2)
+        elif avg_latency > self._baseline_latency * self.latency_tolerance:
+            self.limit = max(self.min_workers, int(self.limit * 0.75))
+        elif self._window_saturated:
+            self.limit = min(self.max_workers, self.limit + 1)
+
+        if self.limit != previous:
+            self.logger.info(
+                f"Concurrency limit {previous} -> {self.limit} "
+                f"(error_rate={error_rate:.2f}, avg_latency={avg_latency * 1000:.1f}ms)"
+            )
+        # Let the baseline drift upwards slowly so a one-off fast window does
+        # not pin the limit low forever.
+        self._baseline_latency += (avg_latency - self._baseline_latency) * 0.1
+        self._reset_window()
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Waits for in-flight handlers to finish."""
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "max_workers": self.max_workers,
+            "min_workers": self.min_workers,
+            "in_flight": self.in_flight,
+            "baseline_latency_ms": round((self._baseline_latency or 0.0) * 1000, 3),
+        }
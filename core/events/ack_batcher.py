@@ -0,0 +1,80 @@
+# core/events/ack_batcher.py
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+import redis.asyncio as redis
+
+class AckBatcher:
+    """
+    Collects acknowledged message IDs per stream and flushes them as one
+    multi-ID XACK per stream, all in a single pipelined round trip.
+
+    A flush happens when `max_batch_size` IDs are pending, `flush_interval`
+    seconds after the first ID of a batch was added, or on close().
+    """
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        group_name: str,
+        max_batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self.redis_client = redis_client
+        self.group_name = group_name
+        self.max_batch_size = max_batch_size or int(os.getenv("ACK_BATCH_SIZE", "50"))
+        self.flush_interval = (
+            flush_interval if flush_interval is not None
+            else int(os.getenv("ACK_FLUSH_INTERVAL_MS", "100")) / 1000.0
+        )
+        self.logger = logging.getLogger(f"ack_batcher.{group_name}")
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_count = 0
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    async def add(self, stream: str, message_id: str) -> None:
+        self._pending.setdefault(stream, []).append(message_id)
+        self._pending_count += 1
+        if self._pending_count >= self.max_batch_size:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._flush_timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending, self._pending_count = self._pending, {}, 0
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for stream, message_ids in batch.items():
+                    pipe.xack(stream, self.group_name, *message_ids)
+                await pipe.execute()
+                self.logger.debug(f"Acknowledged {sum(len(ids) for ids in batch.values())} messages.")
+            except Exception as e:
+                # Put the IDs back so the next flush retries them. Until then
+                # they simply stay in the PEL, which is safe.
+                self.logger.error(f"Failed to flush acknowledgements: {e}", exc_info=True)
+                for stream, message_ids in batch.items():
+                    self._pending.setdefault(stream, [])[:0] = message_ids
+                    self._pending_count += len(message_ids)
+                if self._flush_timer is None and not self._closed:
+                    self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        await self.flush()
@@ -0,0 +1,106 @@
+# core/events/codec.py
+import json
+import os
+from typing import Any, Dict, Mapping, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency
+    msgpack = None
+
+class EventDecodeError(ValueError):
+    """Raised when an event's `data` field can't be decoded with its codec."""
+
+class EventCodec:
+    """
+    Encodes the `data` field of the stream envelope. `name` is the wire
+    format written to the envelope's `codec` field, so consumers can decode
+    events from producers configured with a different codec.
+    """
+    name = "json"
+
+    def encode(self, data: Any) -> Union[str, bytes]:
+        return json.dumps(data)
+
+    def decode(self, raw: Union[str, bytes]) -> Any:
+        return json.loads(raw)
+
+class OrjsonCodec(EventCodec):
+    """orjson writes standard JSON text, so it stays on the `json` wire format."""
+    name = "json"
+
+    def encode(self, data: Any) -> Union[str, bytes]:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, raw: Union[str, bytes]) -> Any:
+        return orjson.loads(raw)
+
+class MsgpackCodec(EventCodec):
+    """Binary format; consumers older than the codec field can't read it."""
+    name = "msgpack"
+
+    def encode(self, data: Any) -> Union[str, bytes]:
+        return msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, raw: Union[str, bytes]) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+
+CODECS: Dict[str, type] = {
+    "json": EventCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+def get_codec(name: Optional[str] = None) -> EventCodec:
+    """
+    Returns the encoder configured by `name` (default: EVENT_CODEC env var,
+    falling back to stdlib json).
+    """
+    name = name or os.getenv("EVENT_CODEC", "json")
+    if name not in CODECS:
+        raise ValueError(f"Unknown event codec '{name}'. Expected one of {sorted(CODECS)}.")
+    if name == "orjson" and orjson is None:
+        raise ValueError("EVENT_CODEC=orjson requires the 'orjson' package.")
+    if name == "msgpack" and msgpack is None:
+        raise ValueError("EVENT_CODEC=msgpack requires the 'msgpack' package.")
+    return CODECS[name]()
+
+# Decoders by wire format. JSON is decoded with orjson when it is installed,
+# whichever library produced it.
+_DECODERS: Dict[str, EventCodec] = {"json": OrjsonCodec() if orjson is not None else EventCodec()}
+if msgpack is not None:
+    _DECODERS["msgpack"] = MsgpackCodec()
+
+def decode_data(raw: Union[str, bytes], codec_name: Union[str, bytes, None] = None) -> Any:
+    """Decodes a raw `data` field written with the wire format `codec_name`."""
+    if isinstance(codec_name, bytes):
+        codec_name = codec_name.decode('utf-8')
+    decoder = _DECODERS.get(codec_name or "json")
+    if decoder is None:
+        raise EventDecodeError(f"No decoder available for event codec '{codec_name}'.")
+    try:
+        return decoder.decode(raw)
+    except Exception as e:
+        raise EventDecodeError(f"Could not decode event data with codec '{codec_name or 'json'}': {e}") from e
+
+def is_text_codec(codec_name: Union[str, bytes, None]) -> bool:
+    return codec_name in (None, "json", b"json")
+
+def load_event_data(event_data: Mapping[str, Any]) -> Any:
+    """
+    Returns the decoded `data` payload of an event handed to process_event().
+    Already-decoded payloads are returned as is; a missing payload decodes
+    to an empty dict.
+    """
+    payload = getattr(event_data, 'payload', None)
+    if payload is not None:  # EventEnvelope: decoded once and cached
+        return payload
+    data = event_data.get('data', '{}')
+    if isinstance(data, (dict, list)):
+        return data
+    return decode_data(data, event_data.get('codec'))
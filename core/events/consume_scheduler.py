@@ -0,0 +1,84 @@
+# core/events/consume_scheduler.py
+import os
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+class ConsumeParams(NamedTuple):
+    count: int
+    block: Optional[int]  # milliseconds; None means a non-blocking read
+
+class ConsumeScheduler:
+    """
+    Chooses XREADGROUP `count` and `block` for every read of the consume loop.
+
+    - Backlogged (known group lag, or the last read came back full): read as
+      many messages as there are free worker slots without blocking.
+    - Handlers in flight but no backlog: block briefly so slots freed by
+      finishing handlers are picked up quickly.
+    - Fully idle: block for longer and longer (up to `idle_block_ms`). A new
+      message still wakes the blocked read immediately, so this only saves
+      empty round trips and never adds latency.
+    """
+    def __init__(
+        self,
+        max_count: Optional[int] = None,
+        busy_block_ms: Optional[int] = None,
+        idle_block_ms: Optional[int] = None,
+        lag_sample_interval: Optional[float] = None,
+    ):
+        self.max_count = max_count or int(os.getenv("CONSUME_MAX_COUNT", "100"))
+        self.busy_block_ms = busy_block_ms or int(os.getenv("CONSUME_BUSY_BLOCK_MS", "50"))
+        self.idle_block_ms = idle_block_ms or int(os.getenv("CONSUME_IDLE_BLOCK_MS", "5000"))
+        self.lag_sample_interval = (
+            lag_sample_interval if lag_sample_interval is not None
+            else float(os.getenv("CONSUME_LAG_SAMPLE_INTERVAL", "5.0"))
+        )
+        self.last_params: Optional[ConsumeParams] = None
+        self._lag: Optional[int] = None
+        self._lag_sampled_at = 0.0
+        self._last_read_full = False
+        self._empty_reads = 0
+
+    def lag_sample_due(self) -> bool:
+        return time.monotonic() - self._lag_sampled_at >= self.lag_sample_interval
+
+    def record_lag(self, lag: Optional[int]) -> None:
+        """Records the consumer group lag reported by Redis (None if unknown)."""
+        self._lag = lag
+        self._lag_sampled_at = time.monotonic()
+
+    def record_read(self, requested: int, received: int) -> None:
+        self._last_read_full = received >= requested > 0
+        self._empty_reads = self._empty_reads + 1 if received == 0 else 0
+        if self._lag is not None:
+            # Keep the sampled lag roughly current between samples. An empty
+            # read means nothing is left, e.g. other replicas drained it.
+            self._lag = max(0, self._lag - received) if received else 0
+
+    @property
+    def backlogged(self) -> bool:
+        if self._lag is not None and self._lag > 0:
+            return True
+        return self._last_read_full
+
+    def next_params(self, free_slots: int, in_flight: int) -> ConsumeParams:
+        count = max(1, min(free_slots, self.max_count))
+        if self.backlogged:
+            if self._lag:
+                count = max(1, min(count, self._lag))
+            block = None
+        elif in_flight > 0:
+            block = self.busy_block_ms
+        else:
+            block = min(self.idle_block_ms, self.busy_block_ms * (2 ** min(self._empty_reads, 16)))
+        self.last_params = ConsumeParams(count=count, block=block)
+        return self.last_params
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.last_params.count if self.last_params else None,
+            "block_ms": self.last_params.block if self.last_params else None,
+            "backlogged": self.backlogged,
+            "lag": self._lag,
+            "consecutive_empty_reads": self._empty_reads,
+        }
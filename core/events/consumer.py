@@ -1,43 +1,109 @@
 # core/events/consumer.py
-import redis.asyncio as redis
-import redis.exceptions  # Import exceptions from main redis module
+from redis.exceptions import ResponseError
 import os
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
+from core.events.ack_batcher import AckBatcher
+from core.events.transport import acquire_connections, get_transport_name, release_connections
 
 class EventConsumer:
-    def __init__(self, stream_name: str, group_name: str, consumer_name: str, redis_url: Optional[str] = None):
+    """
+    Reads one or more streams through a single consumer group. All streams
+    are read with one XREADGROUP call; `stream_name` is the primary stream
+    (the first entry of `streams`).
+
+    The group is created on every stream at ID '0', so a new group reads the
+    stream's whole history; `start_ids` overrides that per stream, e.g. '$'
+    to only see messages added from now on.
+    """
+    def __init__(
+        self,
+        stream_name: str,
+        group_name: str,
+        consumer_name: str,
+        redis_url: Optional[str] = None,
+        streams: Optional[List[str]] = None,
+        transport: Optional[str] = None,
+        start_ids: Optional[Dict[str, str]] = None,
+    ):
+        self.transport = get_transport_name(transport)
         self.redis_url = redis_url or os.getenv("REDIS_URL")
-        if not self.redis_url:
-            raise ValueError("REDIS_URL environment variable not set.")
-        # Fix for DigitalOcean managed Redis TLS connection - use proper async client
-        # Using Redis.from_url() instead of redis.from_url() to get async client
-        self.redis_client = redis.Redis.from_url(self.redis_url, ssl_cert_reqs=None)
+        # Clients come from the process-wide pools of the configured transport:
+        # `read_client` is reserved for blocking XREADGROUP calls, `redis_client`
+        # serves everything else.
+        self._connections = acquire_connections(self.transport, self.redis_url)
+        self.read_client = self._connections.reader
+        self.redis_client = self._connections.writer
+        self.streams = list(dict.fromkeys([stream_name] + list(streams or [])))
         self.stream_name = stream_name
         self.group_name = group_name
+        self.start_ids = dict(start_ids or {})
         self.consumer_name = consumer_name
         self.logger = logging.getLogger(f"consumer.{consumer_name}")
+        self.ack_batcher = AckBatcher(self.redis_client, group_name)
 
     async def setup(self) -> None:
+        for stream in self.streams:
+            try:
+                await self.redis_client.xgroup_create(
+                    stream, self.group_name, id=self.start_ids.get(stream, '0'), mkstream=True
+                )
+                self.logger.info(f"Consumer group '{self.group_name}' ready for stream '{stream}'.")
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    self.logger.error(f"Error creating consumer group: {e}", exc_info=True)
+                    raise
+
+    async def consume(self, count: int = 10, block: Optional[int] = 2000):
+        """
+        Reads new messages for this consumer. `block=None` makes the read
+        non-blocking. Errors are logged and re-raised so the caller can back off.
+        """
         try:
-            await self.redis_client.xgroup_create(self.stream_name, self.group_name, id='0', mkstream=True)
-            self.logger.info(f"Consumer group '{self.group_name}' ready for stream '{self.stream_name}'.")
-        except redis.exceptions.ResponseError as e:  # Use redis.exceptions instead of redis.asyncio.exceptions
-            if "BUSYGROUP" not in str(e):
-                self.logger.error(f"Error creating consumer group: {e}", exc_info=True)
-                raise
-
-    async def consume(self, count: int = 10, block: int = 2000):
-        try:
-            return await self.redis_client.xreadgroup(
-                self.group_name, self.consumer_name, {self.stream_name: '>'}, count=count, block=block
+            return await self.read_client.xreadgroup(
+                self.group_name, self.consumer_name, {stream: '>' for stream in self.streams},
+                count=count, block=block
             )
         except Exception as e:
-            self.logger.error(f"Error consuming events from stream {self.stream_name}: {e}", exc_info=True)
+            self.logger.error(f"Error consuming events from streams {self.streams}: {e}", exc_info=True)
+            raise
+
+    async def get_lag(self) -> Optional[int]:
+        """
+        Returns the number of entries not yet delivered to the group across
+        all streams, or None when Redis can't tell for any of them (servers
+        older than 7.0 or an unknown lag).
+        """
+        lags = [await self._get_stream_lag(stream) for stream in self.streams]
+        known = [lag for lag in lags if lag is not None]
+        return sum(known) if known else None
+
+    async def _get_stream_lag(self, stream: str) -> Optional[int]:
+        try:
+            groups = await self.redis_client.xinfo_groups(stream)
+        except Exception as e:
+            self.logger.warning(f"Could not read group info for {stream}: {e}")
             return None
+        for group in groups:
+            name = group.get('name')
+            if isinstance(name, bytes):
+                name = name.decode('utf-8')
+            if name == self.group_name:
+                return group.get('lag')
+        return None
 
     async def acknowledge(self, stream: str, message_id: str) -> None:
-        await self.redis_client.xack(stream, self.group_name, message_id)
+        """
+        Queues the message for acknowledgement. IDs are flushed to Redis in
+        batches by the AckBatcher; call flush_acknowledgements() to force it.
+        """
+        await self.ack_batcher.add(stream, message_id)
+
+    async def flush_acknowledgements(self) -> None:
+        await self.ack_batcher.flush()
 
     async def close(self) -> None:
-        await self.redis_client.close()
+        await self.ack_batcher.close()
+        if self._connections is not None:
+            self._connections = None
+            await release_connections(self.transport, self.redis_url)
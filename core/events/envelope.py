@@ -0,0 +1,141 @@
+# core/events/envelope.py
+import json
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Union
+from core.events.codec import decode_data, is_text_codec
+
+_UNSET = object()
+
+class EventEnvelope(Mapping):
+    """
+    Read-only view over the raw fields of one stream entry.
+
+    Nothing is decoded up front: each envelope field is decoded from bytes on
+    first access and cached in its slot, and the `data` payload is only
+    parsed when `payload` is read. Agents that route or skip on `event_type`
+    therefore never pay for decoding the rest of the message.
+
+    Envelopes from the in-memory transport carry the payload object itself
+    in `data`; it is returned by `payload` as is.
+
+    For compatibility with handlers written against the old decoded dict,
+    the envelope is a Mapping: `event_data.get('data')`, `event_data['event_type']`
+    and `dict(event_data)` keep working and return the same strings as before.
+    """
+    __slots__ = (
+        '_fields', '_event_id', '_event_type', '_timestamp',
+        '_correlation_id', '_codec', '_data', '_payload',
+    )
+
+    def __init__(self, fields: Mapping):
+        self._fields = fields
+        self._event_id = _UNSET
+        self._event_type = _UNSET
+        self._timestamp = _UNSET
+        self._correlation_id = _UNSET
+        self._codec = _UNSET
+        self._data = _UNSET
+        self._payload = _UNSET
+
+    def _raw(self, name: str) -> Any:
+        value = self._fields.get(name.encode('utf-8'), _UNSET)
+        if value is _UNSET:
+            value = self._fields.get(name, _UNSET)
+        return value
+
+    def _text(self, name: str) -> Optional[str]:
+        value = self._raw(name)
+        if value is _UNSET:
+            return None
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    @property
+    def event_id(self) -> Optional[str]:
+        if self._event_id is _UNSET:
+            self._event_id = self._text('event_id')
+        return self._event_id
+
+    @property
+    def event_type(self) -> Optional[str]:
+        if self._event_type is _UNSET:
+            self._event_type = self._text('event_type')
+        return self._event_type
+
+    @property
+    def timestamp(self) -> Optional[str]:
+        if self._timestamp is _UNSET:
+            self._timestamp = self._text('timestamp')
+        return self._timestamp
+
+    @property
+    def correlation_id(self) -> Optional[str]:
+        if self._correlation_id is _UNSET:
+            self._correlation_id = self._text('correlation_id')
+        return self._correlation_id
+
+    @property
+    def codec(self) -> Optional[str]:
+        """Wire format of `data`; None for envelopes written before codecs existed (JSON)."""
+        if self._codec is _UNSET:
+            self._codec = self._text('codec')
+        return self._codec
+
+    @property
+    def data(self) -> Union[str, bytes, None]:
+        """The raw `data` field: text for JSON envelopes, bytes for binary codecs."""
+        if self._data is _UNSET:
+            value = self._raw('data')
+            if value is _UNSET:
+                value = None
+            elif isinstance(value, bytes):
+                if is_text_codec(self.codec):
+                    value = value.decode('utf-8')
+            elif not isinstance(value, str):
+                # In-process payload object; legacy handlers expect JSON text.
+                value = json.dumps(value)
+            self._data = value
+        return self._data
+
+    @property
+    def payload(self) -> Any:
+        """The decoded `data` payload, parsed once on first access."""
+        if self._payload is _UNSET:
+            raw = self._raw('data')
+            if raw is _UNSET:
+                self._payload = {}
+            elif isinstance(raw, (str, bytes)):
+                self._payload = decode_data(self.data, self.codec)
+            else:
+                self._payload = raw
+        return self._payload
+
+    _PROPERTIES = {
+        'event_id': event_id, 'event_type': event_type, 'timestamp': timestamp,
+        'correlation_id': correlation_id, 'codec': codec, 'data': data,
+    }
+
+    def __getitem__(self, key: str) -> Any:
+        prop = self._PROPERTIES.get(key)
+        if prop is not None:
+            value = prop.__get__(self)
+            if value is None:
+                raise KeyError(key)
+            return value
+        value = self._text(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            yield key.decode('utf-8') if isinstance(key, bytes) else key
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f"EventEnvelope(event_type={self.event_type!r}, event_id={self.event_id!r})"
+
+    def to_dict(self) -> dict:
+        """Eagerly decoded copy, equivalent to the dict handlers used to receive."""
+        return {key: self[key] for key in self}
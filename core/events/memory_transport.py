@@ -0,0 +1,458 @@
+# core/events/memory_transport.py
+import asyncio
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+from core.events.envelope import EventEnvelope
+
+StreamId = Tuple[int, int]
+
+# With `approximate=True` trimming only happens once a stream overshoots its
+# cap by this many entries, like Redis trimming whole macro nodes.
+APPROXIMATE_TRIM_SLACK = 100
+
+def _text(value: Union[str, bytes]) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+def _parse_id(value: Union[str, bytes]) -> StreamId:
+    ms, _, seq = _text(value).partition('-')
+    return int(ms), int(seq or 0)
+
+def _format_id(stream_id: StreamId) -> bytes:
+    return f"{stream_id[0]}-{stream_id[1]}".encode('utf-8')
+
+class _PendingEntry:
+    __slots__ = ('consumer', 'delivered_at', 'times_delivered')
+
+    def __init__(self, consumer: str, delivered_at: float):
+        self.consumer = consumer
+        self.delivered_at = delivered_at
+        self.times_delivered = 1
+
+class _Group:
+    __slots__ = ('last_delivered', 'pending', 'consumers')
+
+    def __init__(self, last_delivered: StreamId):
+        self.last_delivered = last_delivered
+        self.pending: Dict[StreamId, _PendingEntry] = {}
+        # Consumer name -> time.monotonic() of its last read or claim.
+        self.consumers: Dict[str, float] = {}
+
+class _Stream:
+    __slots__ = ('ids', 'entries', 'last_id', 'groups')
+
+    def __init__(self):
+        self.ids: List[StreamId] = []
+        self.entries: Dict[StreamId, EventEnvelope] = {}
+        self.last_id: StreamId = (0, 0)
+        self.groups: Dict[str, _Group] = {}
+
+class MemoryStreamBroker:
+    """
+    In-process stand-in for the Redis stream commands used by the event
+    layer (XADD, XREADGROUP, XACK, XAUTOCLAIM, XPENDING, XINFO),
+    plus the hash and key commands used for shared agent state (HSET,
+    HGETALL, HDEL, GET, SET with an expiry, DEL).
+
+    Consumer-group semantics are kept: every group tracks its last delivered
+    ID and a pending entries list per message, so unacknowledged messages
+    stay pending and can be reclaimed and redelivered. Fields are stored as
+    given and handed to consumers as the same EventEnvelope object, so
+    nothing is serialized. Payloads are shared between consumers and must
+    be treated as read-only.
+
+    Method signatures and return shapes follow redis.asyncio, so the
+    consumer, publisher, ack batcher and reclaimer run unchanged on top of it.
+    """
+    def __init__(self):
+        self._streams: Dict[str, _Stream] = {}
+        self._hashes: Dict[str, Dict[str, Any]] = {}
+        # Plain keys: name -> (value, monotonic expiry time or None).
+        self._values: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._waiters: set = set()
+
+    def reset(self) -> None:
+        """Drops all streams, groups, hashes and keys (tests and benchmarks)."""
+        self._streams.clear()
+        self._hashes.clear()
+        self._values.clear()
+
+    def _stream(self, name: Union[str, bytes], create: bool = True) -> Optional[_Stream]:
+        name = _text(name)
+        stream = self._streams.get(name)
+        if stream is None and create:
+            stream = self._streams[name] = _Stream()
+        return stream
+
+    def _group(self, name: Union[str, bytes], groupname: Union[str, bytes]) -> Tuple[_Stream, _Group]:
+        stream = self._stream(name, create=False)
+        group = stream.groups.get(_text(groupname)) if stream else None
+        if group is None:
+            raise RuntimeError(f"NOGROUP No such key '{_text(name)}' or consumer group '{_text(groupname)}'")
+        return stream, group
+
+    def _next_id(self, stream: _Stream) -> StreamId:
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = stream.last_id
+        return (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+
+    def _notify(self) -> None:
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                try:
+                    waiter.set_result(None)
+                except RuntimeError:  # Waiter's event loop is already closed
+                    pass
+
+    def _trim(self, stream: _Stream, maxlen: Optional[int], minid: Optional[Union[str, bytes]], approximate: bool) -> None:
+        cut = 0
+        if maxlen is not None:
+            excess = len(stream.ids) - maxlen
+            if excess > (APPROXIMATE_TRIM_SLACK if approximate else 0):
+                cut = excess
+        if minid is not None:
+            cut = max(cut, bisect.bisect_left(stream.ids, _parse_id(minid)))
+        if cut:
+            for stream_id in stream.ids[:cut]:
+                del stream.entries[stream_id]
+            del stream.ids[:cut]
+
+    async def xadd(
+        self,
+        name: Union[str, bytes],
+        fields: Dict[Any, Any],
+        id: Union[str, bytes] = '*',
+        maxlen: Optional[int] = None,
+        approximate: bool = True,
+        minid: Optional[Union[str, bytes]] = None,
+    ) -> bytes:
+        stream = self._stream(name)
+        stream_id = self._next_id(stream) if _text(id) == '*' else _parse_id(id)
+        if stream_id <= stream.last_id:
+            raise ValueError("The ID specified in XADD is equal or smaller than the target stream top item")
+        stream.last_id = stream_id
+        stream.ids.append(stream_id)
+        stream.entries[stream_id] = fields if isinstance(fields, EventEnvelope) else EventEnvelope(dict(fields))
+        self._trim(stream, maxlen, minid, approximate)
+        self._notify()
+        return _format_id(stream_id)
+
+    async def xlen(self, name: Union[str, bytes]) -> int:
+        stream = self._stream(name, create=False)
+        return len(stream.ids) if stream else 0
+
+    async def xgroup_create(
+        self, name: Union[str, bytes], groupname: Union[str, bytes], id: Union[str, bytes] = '$', mkstream: bool = False
+    ) -> bool:
+        """Idempotent: an existing group is left untouched."""
+        stream = self._stream(name, create=mkstream)
+        if stream is None:
+            raise RuntimeError("The XGROUP subcommand requires the key to exist.")
+        groupname = _text(groupname)
+        if groupname not in stream.groups:
+            start = stream.last_id if _text(id) == '$' else _parse_id(id)
+            stream.groups[groupname] = _Group(start)
+        return True
+
+    async def xgroup_destroy(self, name: Union[str, bytes], groupname: Union[str, bytes]) -> int:
+        stream = self._stream(name, create=False)
+        if stream is None:
+            return 0
+        return 1 if stream.groups.pop(_text(groupname), None) is not None else 0
+
+    def _read_new(self, groupname: str, consumername: str, names: List[str], count: Optional[int]) -> List[Any]:
+        now = time.monotonic()
+        result = []
+        for name in names:
+            stream, group = self._group(name, groupname)
+            group.consumers[consumername] = now
+            start = bisect.bisect_right(stream.ids, group.last_delivered)
+            stop = len(stream.ids) if count is None else min(len(stream.ids), start + count)
+            if start >= stop:
+                continue
+            messages = []
+            for stream_id in stream.ids[start:stop]:
+                group.pending[stream_id] = _PendingEntry(consumername, now)
+                messages.append((_format_id(stream_id), stream.entries[stream_id]))
+            group.last_delivered = stream.ids[stop - 1]
+            result.append([name.encode('utf-8'), messages])
+            if count is not None:
+                count -= len(messages)
+                if count <= 0:
+                    break
+        return result
+
+    async def xreadgroup(
+        self,
+        groupname: Union[str, bytes],
+        consumername: Union[str, bytes],
+        streams: Dict[Union[str, bytes], Union[str, bytes]],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+        noack: bool = False,
+    ) -> List[Any]:
+        """
+        Only new messages (ID '>') are supported. `block=None` returns
+        immediately, `block=0` waits until a message arrives.
+        """
+        if any(_text(last_id) != '>' for last_id in streams.values()):
+            raise ValueError("The in-memory transport only supports reading new messages ('>').")
+        groupname, consumername = _text(groupname), _text(consumername)
+        names = [_text(name) for name in streams]
+        loop = asyncio.get_running_loop()
+        deadline = None if not block else loop.time() + block / 1000.0
+        while True:
+            result = self._read_new(groupname, consumername, names, count)
+            if result or block is None:
+                break
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                break
+            waiter = loop.create_future()
+            self._waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiters.discard(waiter)
+        if noack:
+            for name, messages in result:
+                _, group = self._group(name, groupname)
+                for message_id, _ in messages:
+                    group.pending.pop(_parse_id(message_id), None)
+        return result
+
+    async def xack(self, name: Union[str, bytes], groupname: Union[str, bytes], *ids: Union[str, bytes]) -> int:
+        _, group = self._group(name, groupname)
+        return sum(1 for message_id in ids if group.pending.pop(_parse_id(message_id), None) is not None)
+
+    async def xautoclaim(
+        self,
+        name: Union[str, bytes],
+        groupname: Union[str, bytes],
+        consumername: Union[str, bytes],
+        min_idle_time: int,
+        start_id: Union[str, bytes] = '0-0',
+        count: Optional[int] = None,
+        justid: bool = False,
+    ) -> List[Any]:
+        stream, group = self._group(name, groupname)
+        consumername = _text(consumername)
+        now = time.monotonic()
+        group.consumers[consumername] = now
+        start = _parse_id(start_id)
+        claimed, deleted = [], []
+        next_cursor = (0, 0)
+        for stream_id in sorted(group.pending):
+            if stream_id < start:
+                continue
+            if count is not None and len(claimed) >= count:
+                next_cursor = stream_id
+                break
+            entry = group.pending[stream_id]
+            if (now - entry.delivered_at) * 1000 < min_idle_time:
+                continue
+            fields = stream.entries.get(stream_id)
+            if fields is None:
+                # Trimmed while pending: drop it from the PEL like Redis 7.
+                del group.pending[stream_id]
+                deleted.append(_format_id(stream_id))
+                continue
+            entry.consumer = consumername
+            entry.delivered_at = now
+            if not justid:
+                entry.times_delivered += 1
+            claimed.append(_format_id(stream_id) if justid else (_format_id(stream_id), fields))
+        return [_format_id(next_cursor), claimed, deleted]
+
+    async def xpending_range(
+        self,
+        name: Union[str, bytes],
+        groupname: Union[str, bytes],
+        min: Union[str, bytes],
+        max: Union[str, bytes],
+        count: int,
+        consumername: Optional[Union[str, bytes]] = None,
+        idle: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        _, group = self._group(name, groupname)
+        low = (0, 0) if _text(min) == '-' else _parse_id(min)
+        high = None if _text(max) == '+' else _parse_id(max)
+        consumername = _text(consumername) if consumername is not None else None
+        now = time.monotonic()
+        result = []
+        for stream_id in sorted(group.pending):
+            if stream_id < low or (high is not None and stream_id > high):
+                continue
+            entry = group.pending[stream_id]
+            idle_ms = int((now - entry.delivered_at) * 1000)
+            if consumername is not None and entry.consumer != consumername:
+                continue
+            if idle is not None and idle_ms < idle:
+                continue
+            result.append({
+                'message_id': _format_id(stream_id),
+                'consumer': entry.consumer.encode('utf-8'),
+                'time_since_delivered': idle_ms,
+                'times_delivered': entry.times_delivered,
+            })
+            if len(result) >= count:
+                break
+        return result
+
+    async def xinfo_groups(self, name: Union[str, bytes]) -> List[Dict[str, Any]]:
+        stream = self._stream(name, create=False)
+        if stream is None:
+            raise RuntimeError("no such key")
+        return [
+            {
+                'name': groupname.encode('utf-8'),
+                'consumers': len(group.consumers),
+                'pending': len(group.pending),
+                'last-delivered-id': _format_id(group.last_delivered),
+                'lag': len(stream.ids) - bisect.bisect_right(stream.ids, group.last_delivered),
+            }
+            for groupname, group in stream.groups.items()
+        ]
+
+    async def xinfo_stream(self, name: Union[str, bytes]) -> Dict[str, Any]:
+        stream = self._stream(name, create=False)
+        if stream is None:
+            raise RuntimeError("no such key")
+        first = stream.ids[0] if stream.ids else None
+        last = stream.ids[-1] if stream.ids else None
+        return {
+            'length': len(stream.ids),
+            'groups': len(stream.groups),
+            'last-generated-id': _format_id(stream.last_id),
+            'first-entry': (_format_id(first), stream.entries[first]) if first else None,
+            'last-entry': (_format_id(last), stream.entries[last]) if last else None,
+        }
+
+    async def xinfo_consumers(self, name: Union[str, bytes], groupname: Union[str, bytes]) -> List[Dict[str, Any]]:
+        _, group = self._group(name, groupname)
+        now = time.monotonic()
+        pending: Dict[str, int] = {}
+        for entry in group.pending.values():
+            pending[entry.consumer] = pending.get(entry.consumer, 0) + 1
+        return [
+            {'name': consumer.encode('utf-8'), 'pending': pending.get(consumer, 0), 'idle': int((now - seen) * 1000)}
+            for consumer, seen in group.consumers.items()
+        ]
+
+    async def xpending(self, name: Union[str, bytes], groupname: Union[str, bytes]) -> Dict[str, Any]:
+        _, group = self._group(name, groupname)
+        if not group.pending:
+            return {'pending': 0, 'min': None, 'max': None, 'consumers': []}
+        counts: Dict[str, int] = {}
+        for entry in group.pending.values():
+            counts[entry.consumer] = counts.get(entry.consumer, 0) + 1
+        return {
+            'pending': len(group.pending),
+            'min': _format_id(min(group.pending)),
+            'max': _format_id(max(group.pending)),
+            'consumers': [{'name': consumer.encode('utf-8'), 'pending': count} for consumer, count in counts.items()],
+        }
+
+    async def hset(
+        self, name: Union[str, bytes], key: Optional[Any] = None, value: Optional[Any] = None,
+        mapping: Optional[Dict[Any, Any]] = None,
+    ) -> int:
+        fields = dict(mapping or {})
+        if key is not None:
+            fields[key] = value
+        table = self._hashes.setdefault(_text(name), {})
+        added = 0
+        for field, field_value in fields.items():
+            field = _text(field)
+            added += field not in table
+            table[field] = field_value
+        return added
+
+    async def hgetall(self, name: Union[str, bytes]) -> Dict[bytes, Any]:
+        return {field.encode('utf-8'): value for field, value in self._hashes.get(_text(name), {}).items()}
+
+    async def hdel(self, name: Union[str, bytes], *keys: Union[str, bytes]) -> int:
+        table = self._hashes.get(_text(name), {})
+        return sum(1 for key in keys if table.pop(_text(key), None) is not None)
+
+    async def get(self, name: Union[str, bytes]) -> Optional[Any]:
+        name = _text(name)
+        value, expires_at = self._values.get(name, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[name]
+            return None
+        return value
+
+    async def set(self, name: Union[str, bytes], value: Any, ex: Optional[float] = None) -> bool:
+        self._values[_text(name)] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def delete(self, *names: Union[str, bytes]) -> int:
+        removed = 0
+        for name in names:
+            name = _text(name)
+            removed += (
+                (self._hashes.pop(name, None) is not None)
+                + (self._streams.pop(name, None) is not None)
+                + (self._values.pop(name, None) is not None)
+            )
+        return removed
+
+    def pipeline(self, transaction: bool = False) -> "MemoryPipeline":
+        return MemoryPipeline(self)
+
+    async def aclose(self) -> None:
+        pass
+
+class MemoryPipeline:
+    """Queues broker commands and runs them in order on execute(), like a Redis pipeline."""
+    def __init__(self, broker: MemoryStreamBroker):
+        self._broker = broker
+        self._commands: List[Tuple[Any, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._broker, name)
+
+        def queue(*args, **kwargs) -> "MemoryPipeline":
+            self._commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        commands, self._commands = self._commands, []
+        results = []
+        for command, args, kwargs in commands:
+            try:
+                results.append(await command(*args, **kwargs))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+
+    async def __aenter__(self) -> "MemoryPipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._commands = []
+
+class MemoryConnections:
+    """
+    Connection set for the in-memory transport. Reader and writer are the
+    same process-wide broker; `serializes = False` tells the publisher to
+    hand payloads over as objects instead of encoding them.
+    """
+    serializes = False
+
+    def __init__(self):
+        self.broker = MemoryStreamBroker()
+        self.reader = self.broker
+        self.writer = self.broker
+
+memory_connections = MemoryConnections()
@@ -1,48 +1,165 @@
 # core/events/publisher.py
-import redis.asyncio as redis
 import json
+import time
 import uuid
 from datetime import datetime
 import os
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+from core.events.codec import EventCodec, get_codec
+from core.events.transport import acquire_connections, get_transport_name, release_connections
 
 class EventPublisher:
-    _client: Optional[redis.Redis] = None
+    # Streams that are only read by live consumers and would otherwise grow
+    # forever. Policies are approximate (`MAXLEN ~` / `MINID ~`) so Redis can
+    # trim whole macro nodes cheaply. Override or extend with the
+    # STREAM_RETENTION env var, e.g. '{"ui:updates": {"maxlen": 5000}}' or
+    # '{"system:agent_errors": {"max_age_seconds": 86400}}'.
+    DEFAULT_RETENTION: Dict[str, Dict[str, int]] = {
+        "ui:updates": {"maxlen": 10000},
+        "security:contact_violations": {"maxlen": 100000},
+    }
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        retention: Optional[Dict[str, Dict[str, int]]] = None,
+        codec: Optional[EventCodec] = None,
+        transport: Optional[str] = None,
+    ):
+        self.transport = get_transport_name(transport)
         self.redis_url = redis_url or os.getenv("REDIS_URL")
-        if not self.redis_url:
+        if self.transport == "redis" and not self.redis_url:
             raise ValueError("REDIS_URL environment variable not set.")
         self.logger = logging.getLogger(__name__)
+        self._connections: Optional[Any] = None
+        # Encodes the `data` field (EVENT_CODEC=json|orjson|msgpack).
+        self.codec = codec or get_codec()
+        self.retention = dict(self.DEFAULT_RETENTION)
+        self.retention.update(json.loads(os.getenv("STREAM_RETENTION", "{}")))
+        if retention:
+            self.retention.update(retention)
 
-    async def _get_client(self) -> redis.Redis:
-        if self.__class__._client is None:
-            self.logger.info("Initializing Redis connection for publisher.")
-            # Fix for DigitalOcean managed Redis TLS connection - use proper async client
-            self.__class__._client = redis.Redis.from_url(self.redis_url, ssl_cert_reqs=None)
-        return self.__class__._client
+    async def _get_client(self) -> Any:
+        if self._connections is None:
+            self._connections = acquire_connections(self.transport, self.redis_url)
+        return self._connections.writer
 
-    async def publish(self, stream: str, event_type: str, data: dict, correlation_id: Optional[str] = None) -> str:
-        client = await self._get_client()
+    def set_retention(self, stream: str, maxlen: Optional[int] = None, max_age_seconds: Optional[int] = None) -> None:
+        """Caps a stream by approximate length or by entry age (MINID)."""
+        if maxlen is None and max_age_seconds is None:
+            self.retention.pop(stream, None)
+            return
+        policy = {}
+        if maxlen is not None:
+            policy["maxlen"] = maxlen
+        if max_age_seconds is not None:
+            policy["max_age_seconds"] = max_age_seconds
+        self.retention[stream] = policy
+
+    def _trim_args(self, stream: str) -> Dict[str, Any]:
+        policy = self.retention.get(stream)
+        if not policy:
+            return {}
+        if "max_age_seconds" in policy:
+            min_ms = int((time.time() - policy["max_age_seconds"]) * 1000)
+            return {"minid": f"{min_ms}-0", "approximate": True}
+        return {"maxlen": policy["maxlen"], "approximate": True}
+
+    def _build_payload(self, event_type: str, data: dict, correlation_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         event_id = str(uuid.uuid4())
-        event_payload = {
+        payload = {
             'event_id': event_id,
             'event_type': event_type,
             'timestamp': datetime.utcnow().isoformat(),
             'correlation_id': correlation_id or event_id,
-            'data': json.dumps(data)
         }
+        if self._connections is not None and not self._connections.serializes:
+            # In-process transport: consumers get the payload object itself.
+            payload['data'] = data
+        else:
+            payload['codec'] = self.codec.name
+            payload['data'] = self.codec.encode(data)
+        return event_id, payload
+
+    async def publish(self, stream: str, event_type: str, data: dict, correlation_id: Optional[str] = None) -> str:
+        client = await self._get_client()
+        event_id, event_payload = self._build_payload(event_type, data, correlation_id)
         try:
-            message_id = await client.xadd(stream, event_payload)
+            message_id = await client.xadd(stream, event_payload, **self._trim_args(stream))
             self.logger.debug(f"Published event {event_id} to stream {stream}")
             return message_id.decode()
         except Exception as e:
             self.logger.error(f"Failed to publish to stream {stream}: {e}", exc_info=True)
             raise
 
+    async def publish_many(self, events: List[Dict[str, Any]]) -> List[str]:
+        """
+        Publishes several events in one pipelined round trip. Each event is a
+        dict with `stream`, `event_type`, `data` and optional `correlation_id`.
+        Returns the stream message IDs in the same order.
+        """
+        if not events:
+            return []
+        client = await self._get_client()
+        pipe = client.pipeline(transaction=False)
+        for event in events:
+            _, event_payload = self._build_payload(event['event_type'], event['data'], event.get('correlation_id'))
+            pipe.xadd(event['stream'], event_payload, **self._trim_args(event['stream']))
+        try:
+            message_ids = await pipe.execute()
+            self.logger.debug(f"Published {len(events)} events in one pipeline")
+            return [message_id.decode() for message_id in message_ids]
+        except Exception as e:
+            self.logger.error(f"Failed to publish batch of {len(events)} events: {e}", exc_info=True)
+            raise
+
+    def buffered(self, max_size: int = 100) -> "PublishBuffer":
+        """Returns a buffer that collects events and publishes them with publish_many()."""
+        return PublishBuffer(self, max_size=max_size)
+
     async def close(self) -> None:
-        if self.__class__._client:
-            await self.__class__._client.close()
-            self.__class__._client = None
-            self.logger.info("Redis publisher connection closed.")
+        """Releases this publisher's share of the process-wide transport connections."""
+        if self._connections is not None:
+            self._connections = None
+            await release_connections(self.transport, self.redis_url)
+
+class PublishBuffer:
+    """
+    Buffered publisher mode for fan-out paths:
+
+        async with publisher.buffered() as buffer:
+            for project_id in project_ids:
+                await buffer.add('ui:updates', 'ui:state_change', {...})
+
+    Events are flushed as one pipeline whenever the buffer reaches `max_size`
+    and when the block exits.
+    """
+    def __init__(self, publisher: EventPublisher, max_size: int = 100):
+        self.publisher = publisher
+        self.max_size = max_size
+        self.message_ids: List[str] = []
+        self._events: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    async def add(self, stream: str, event_type: str, data: dict, correlation_id: Optional[str] = None) -> None:
+        self._events.append({
+            'stream': stream, 'event_type': event_type, 'data': data, 'correlation_id': correlation_id,
+        })
+        if len(self._events) >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> List[str]:
+        events, self._events = self._events, []
+        message_ids = await self.publisher.publish_many(events)
+        self.message_ids.extend(message_ids)
+        return message_ids
+
+    async def __aenter__(self) -> "PublishBuffer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
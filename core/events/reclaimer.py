@@ -0,0 +1,121 @@
+# core/events/reclaimer.py
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+class PendingReclaimer:
+    """
+    Recovers entries stuck in a consumer group's pending entries list (PEL).
+
+    Entries idle for longer than `min_idle_ms` (failed handlers, crashed
+    consumers) are taken over with XAUTOCLAIM and handed back for another
+    attempt. Once an entry has been delivered more than `max_deliveries`
+    times it is considered poison: it is copied to `<stream>:dead_letter`
+    together with its delivery metadata and acknowledged on the source stream.
+    """
+    DEAD_LETTER_SUFFIX = ":dead_letter"
+
+    def __init__(
+        self,
+        consumer: Any,
+        min_idle_ms: Optional[int] = None,
+        max_deliveries: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        self.consumer = consumer
+        self.min_idle_ms = min_idle_ms or int(os.getenv("RECLAIM_MIN_IDLE_MS", "60000"))
+        self.max_deliveries = max_deliveries or int(os.getenv("RECLAIM_MAX_DELIVERIES", "5"))
+        self.batch_size = batch_size or int(os.getenv("RECLAIM_BATCH_SIZE", "20"))
+        self.interval = interval or float(os.getenv("RECLAIM_INTERVAL", "10.0"))
+        self.logger = logging.getLogger(f"reclaimer.{consumer.consumer_name}")
+        self._cursors: Dict[str, str] = {}
+        self.reclaimed_count = 0
+        self.dead_lettered_count = 0
+
+    @classmethod
+    def dead_letter_stream(cls, stream: str) -> str:
+        return f"{stream}{cls.DEAD_LETTER_SUFFIX}"
+
+    async def reclaim(self, max_count: int) -> List[Tuple[bytes, List[Tuple[bytes, Dict[bytes, bytes]]]]]:
+        """
+        Claims up to `max_count` idle entries for this consumer across all of
+        its streams. Returns the entries to retry in the same shape as
+        XREADGROUP; poison entries are dead-lettered and not returned.
+        """
+        events = []
+        for stream in self.consumer.streams:
+            if max_count < 1:
+                break
+            stream_events = await self._reclaim_stream(stream, max_count)
+            for _, messages in stream_events:
+                max_count -= len(messages)
+            events.extend(stream_events)
+        return events
+
+    async def _reclaim_stream(self, stream: str, max_count: int) -> List[Tuple[bytes, List[Tuple[bytes, Dict[bytes, bytes]]]]]:
+        client = self.consumer.redis_client
+        group = self.consumer.group_name
+
+        response = await client.xautoclaim(
+            stream, group, self.consumer.consumer_name,
+            min_idle_time=self.min_idle_ms, start_id=self._cursors.get(stream, '0-0'), count=max_count,
+        )
+        next_cursor, messages = response[0], response[1]
+        self._cursors[stream] = next_cursor.decode('utf-8') if isinstance(next_cursor, bytes) else next_cursor
+        # Entries deleted from the stream while pending come back without fields.
+        messages = [(message_id, fields) for message_id, fields in messages if fields]
+        if not messages:
+            return []
+
+        delivery_counts = await self._delivery_counts(stream, group, [message_id for message_id, _ in messages])
+        retry, poison = [], []
+        for message_id, fields in messages:
+            deliveries = delivery_counts.get(message_id, 0)
+            (poison if deliveries > self.max_deliveries else retry).append((message_id, fields, deliveries))
+
+        if poison:
+            await self._dead_letter(stream, group, poison)
+        self.reclaimed_count += len(retry)
+        if retry:
+            self.logger.info(f"Reclaimed {len(retry)} idle entries from {stream}.")
+        stream_key = stream.encode('utf-8')
+        return [(stream_key, [(message_id, fields) for message_id, fields, _ in retry])] if retry else []
+
+    async def _delivery_counts(self, stream: str, group: str, message_ids: List[bytes]) -> Dict[bytes, int]:
+        pipe = self.consumer.redis_client.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipe.xpending_range(stream, group, min=message_id, max=message_id, count=1)
+        counts = {}
+        for message_id, entries in zip(message_ids, await pipe.execute()):
+            counts[message_id] = entries[0]['times_delivered'] if entries else 0
+        return counts
+
+    async def _dead_letter(self, stream: str, group: str, poison: List[Tuple[bytes, Dict[bytes, bytes], int]]) -> None:
+        dead_letter_stream = self.dead_letter_stream(stream)
+        pipe = self.consumer.redis_client.pipeline(transaction=False)
+        for message_id, fields, deliveries in poison:
+            original_id = message_id.decode('utf-8') if isinstance(message_id, bytes) else message_id
+            entry = dict(fields)
+            entry.update({
+                'original_stream': stream,
+                'original_id': original_id,
+                'delivery_count': deliveries,
+                'dead_lettered_at': datetime.utcnow().isoformat(),
+            })
+            pipe.xadd(dead_letter_stream, entry)
+            pipe.xack(stream, group, message_id)
+        await pipe.execute()
+        self.dead_lettered_count += len(poison)
+        self.logger.warning(
+            f"Moved {len(poison)} poison entries from {stream} to {dead_letter_stream} "
+            f"after more than {self.max_deliveries} deliveries."
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "reclaimed": self.reclaimed_count,
+            "dead_lettered": self.dead_lettered_count,
+            "cursors": dict(self._cursors),
+        }
@@ -0,0 +1,134 @@
+# core/events/stream_health.py
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Every stream the swarm reads or writes. Override with a comma-separated
+# SWARM_STREAMS env var when agents are added.
+SWARM_STREAMS = [
+    "homeowner:project_submitted",
+    "homeowner:intake_complete",
+    "homeowner:scope_complete",
+    "payment:events",
+    "payment:contact_released",
+    "communication:filter",
+    "security:contact_violations",
+    "ui:updates",
+    "system:agent_errors",
+]
+
+def _text(value: Union[str, bytes, None]) -> Optional[str]:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+def _id_age_seconds(stream_id: Union[str, bytes, None], now: float) -> Optional[float]:
+    """Stream IDs start with their creation time in milliseconds."""
+    if not stream_id:
+        return None
+    ms = int(_text(stream_id).split('-', 1)[0])
+    return max(0.0, now - ms / 1000.0)
+
+class StreamHealthMonitor:
+    """
+    Samples backlog and consumer health for the swarm's streams:
+    XINFO STREAM and XINFO GROUPS for every stream, then XPENDING and
+    XINFO CONSUMERS for every group, each step in one pipelined round trip.
+
+    Results are cached for `ttl` seconds (STREAM_HEALTH_TTL, default 2) and
+    concurrent callers share a single in-flight sample, so dashboards and
+    health checks can poll freely without adding load on Redis.
+    """
+    def __init__(self, get_client: Callable[[], Any], streams: Optional[List[str]] = None, ttl: Optional[float] = None):
+        self.get_client = get_client
+        configured = os.getenv("SWARM_STREAMS")
+        self.streams = streams or ([s.strip() for s in configured.split(",") if s.strip()] if configured else list(SWARM_STREAMS))
+        self.ttl = ttl if ttl is not None else float(os.getenv("STREAM_HEALTH_TTL", "2.0"))
+        self.logger = logging.getLogger(__name__)
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self, force: bool = False) -> Dict[str, Any]:
+        if not force and self._fresh():
+            return self._cached
+        async with self._lock:
+            # Another caller may have refreshed it while we waited.
+            if not force and self._fresh():
+                return self._cached
+            self._cached = await self._sample()
+            self._cached_at = time.monotonic()
+            return self._cached
+
+    def _fresh(self) -> bool:
+        return self._cached is not None and time.monotonic() - self._cached_at < self.ttl
+
+    async def _sample(self) -> Dict[str, Any]:
+        client = self.get_client()
+        now = time.time()
+
+        pipe = client.pipeline(transaction=False)
+        for stream in self.streams:
+            pipe.xinfo_stream(stream)
+            pipe.xinfo_groups(stream)
+        replies = await pipe.execute(raise_on_error=False)
+
+        report: Dict[str, Any] = {}
+        groups_to_inspect = []
+        for index, stream in enumerate(self.streams):
+            info, groups = replies[2 * index], replies[2 * index + 1]
+            if isinstance(info, Exception):
+                # XINFO fails on keys that don't exist yet.
+                report[stream] = {"exists": False, "length": 0, "groups": {}}
+                continue
+            report[stream] = {
+                "exists": True,
+                "length": info.get('length', 0),
+                "last_generated_id": _text(info.get('last-generated-id')),
+                "groups": {},
+            }
+            for group in groups if not isinstance(groups, Exception) else []:
+                name = _text(group.get('name'))
+                report[stream]["groups"][name] = {
+                    "lag": group.get('lag'),
+                    "pending": group.get('pending', 0),
+                    "last_delivered_id": _text(group.get('last-delivered-id')),
+                    "oldest_pending_id": None,
+                    "oldest_pending_age_s": None,
+                    "consumers": {},
+                }
+                groups_to_inspect.append((stream, name))
+
+        if groups_to_inspect:
+            pipe = client.pipeline(transaction=False)
+            for stream, group in groups_to_inspect:
+                pipe.xpending(stream, group)
+                pipe.xinfo_consumers(stream, group)
+            replies = await pipe.execute(raise_on_error=False)
+            for index, (stream, group) in enumerate(groups_to_inspect):
+                pending, consumers = replies[2 * index], replies[2 * index + 1]
+                entry = report[stream]["groups"][group]
+                if not isinstance(pending, Exception):
+                    entry["oldest_pending_id"] = _text(pending.get('min'))
+                    entry["oldest_pending_age_s"] = _id_age_seconds(pending.get('min'), now)
+                if not isinstance(consumers, Exception):
+                    entry["consumers"] = {
+                        _text(consumer.get('name')): {"pending": consumer.get('pending', 0), "idle_ms": consumer.get('idle')}
+                        for consumer in consumers
+                    }
+
+        all_groups = [group for stream in report.values() for group in stream["groups"].values()]
+        return {
+            "sampled_at": datetime.utcfromtimestamp(now).isoformat(),
+            "ttl_s": self.ttl,
+            "streams": report,
+            "totals": {
+                "lag": sum(group["lag"] or 0 for group in all_groups),
+                "pending": sum(group["pending"] for group in all_groups),
+                "max_oldest_pending_age_s": max(
+                    (group["oldest_pending_age_s"] for group in all_groups if group["oldest_pending_age_s"] is not None),
+                    default=None,
+                ),
+            },
+        }
@@ -0,0 +1,53 @@
+# core/events/transport.py
+import os
+from typing import Any, Optional
+from core.events.memory_transport import memory_connections
+from core.memory.redis_client import connection_registry
+
+# EVENT_TRANSPORT selects what carries events between publishers and consumers:
+# - redis:  Redis streams (default, required when agents run in several processes)
+# - memory: in-process broker for single-process runs (`run_agents.py all`),
+#           tests and benchmarks; events are passed without serialization.
+TRANSPORTS = ("redis", "memory")
+
+def get_transport_name(name: Optional[str] = None) -> str:
+    name = name or os.getenv("EVENT_TRANSPORT", "redis")
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown event transport '{name}'. Expected one of {list(TRANSPORTS)}.")
+    return name
+
+def acquire_connections(transport: str, redis_url: Optional[str] = None) -> Any:
+    """
+    Returns the connection set for `transport`: an object with `reader` and
+    `writer` clients speaking the redis.asyncio stream commands, and a
+    `serializes` flag. Pair every call with release_connections().
+    """
+    if transport == "memory":
+        return memory_connections
+    if not redis_url:
+        raise ValueError("REDIS_URL environment variable not set.")
+    return connection_registry.acquire(redis_url)
+
+async def release_connections(transport: str, redis_url: Optional[str] = None) -> None:
+    if transport == "redis":
+        await connection_registry.release(redis_url)
+
+class TransportClient:
+    """
+    Lazily acquired client for processes that read shared swarm state
+    (metrics, stream health) without consuming events, e.g. the API.
+    """
+    def __init__(self, transport: Optional[str] = None, redis_url: Optional[str] = None):
+        self.transport = get_transport_name(transport)
+        self.redis_url = redis_url or os.getenv("REDIS_URL")
+        self._connections = None
+
+    def get(self) -> Any:
+        if self._connections is None:
+            self._connections = acquire_connections(self.transport, self.redis_url)
+        return self._connections.writer
+
+    async def close(self) -> None:
+        if self._connections is not None:
+            self._connections = None
+            await release_connections(self.transport, self.redis_url)
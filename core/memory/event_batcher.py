@@ -0,0 +1,127 @@
+# core/memory/event_batcher.py
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+class EventStoreWriteError(Exception):
+    """Raised to durable writers when their batch could not be stored."""
+
+class EventWriteBatcher:
+    """
+    Write-behind buffer for event store rows. Rows are inserted with one
+    bulk insert per batch when `max_batch_size` rows are buffered or
+    `flush_interval` seconds after the first row of a batch, and on close().
+
+    A failed batch is retried up to `max_retries` times with exponential
+    backoff. Rows get their event_id and timestamp when buffered, so retries
+    are idempotent (duplicates are skipped on event_id) and stored
+    timestamps don't depend on when the batch was flushed. Once more than
+    `max_buffered` rows are waiting, add() waits for a flush, which pushes
+    back on the handlers when the store is slow or down.
+    """
+    def __init__(
+        self,
+        db_client: Any,
+        table: str = 'event_store',
+        max_batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        max_buffered: Optional[int] = None,
+    ):
+        self.db_client = db_client
+        self.table = table
+        self.max_batch_size = max_batch_size or int(os.getenv("EVENT_STORE_BATCH_SIZE", "100"))
+        self.flush_interval = (
+            flush_interval if flush_interval is not None
+            else int(os.getenv("EVENT_STORE_FLUSH_INTERVAL_MS", "200")) / 1000.0
+        )
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("EVENT_STORE_MAX_RETRIES", "3"))
+        self.retry_backoff = (
+            retry_backoff if retry_backoff is not None
+            else int(os.getenv("EVENT_STORE_RETRY_BACKOFF_MS", "200")) / 1000.0
+        )
+        self.max_buffered = max_buffered or 10 * self.max_batch_size
+        self.logger = logging.getLogger(f"event_batcher.{table}")
+        self._pending: List[Tuple[Dict[str, Any], Optional[asyncio.Future]]] = []
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+        self.stored = 0
+        self.failed = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, row: Dict[str, Any], durable: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Buffers `row`. With `durable`, waits until its batch is stored and
+        returns the stored row, raising EventStoreWriteError if it failed.
+        """
+        if not row.get('event_id'):
+            row['event_id'] = str(uuid.uuid4())
+        if not row.get('timestamp'):
+            row['timestamp'] = datetime.now(timezone.utc).isoformat()
+        future = asyncio.get_running_loop().create_future() if durable else None
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_buffered:
+            await self.flush()
+        elif len(self._pending) >= self.max_batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+        return await future if future is not None else None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._flush_timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            while self._pending:
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+                await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], Optional[asyncio.Future]]]) -> None:
+        rows = [row for row, _ in batch]
+        for attempt in range(self.max_retries + 1):
+            try:
+                stored = await self.db_client.insert_many(self.table, rows, on_conflict='event_id')
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.failed += len(rows)
+                    self.logger.error(
+                        f"Dropping {len(rows)} events after {attempt + 1} failed inserts: {e}", exc_info=True
+                    )
+                    error = EventStoreWriteError(f"Failed to store {len(rows)} events: {e}")
+                    for _, future in batch:
+                        if future is not None and not future.done():
+                            future.set_exception(error)
+                    return
+                delay = self.retry_backoff * 2 ** attempt
+                self.logger.warning(f"Insert of {len(rows)} events failed ({e}); retrying in {delay:.2f}s.")
+                await asyncio.sleep(delay)
+        self.stored += len(rows)
+        self.logger.debug(f"Stored {len(rows)} events.")
+        # Rows skipped as duplicates of an earlier attempt aren't returned.
+        by_id = {str(row.get('event_id')): row for row in stored or []}
+        for row, future in batch:
+            if future is not None and not future.done():
+                future.set_result(by_id.get(str(row['event_id']), row))
+
+    async def close(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
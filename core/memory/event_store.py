@@ -1,28 +1,149 @@
 # core/memory/event_store.py
 from core.memory.supabase_client import SupabaseClient
-from typing import Dict, Any, List, Optional
+from core.memory.event_batcher import EventStoreWriteError, EventWriteBatcher
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 import logging
 import json
+import os
+
+# EVENT_STORE_WRITE_MODE selects how append_event() writes:
+# - sync:  one insert per event, awaited by the caller (default)
+# - batch: write-behind; events are buffered and inserted in bulk, see
+#          EventWriteBatcher. Pass durable=True to wait for the insert.
+WRITE_MODES = ("sync", "batch")
+
+# EVENT_STORE_BACKEND selects where events are stored:
+# - supabase: PostgREST over HTTP (default)
+# - postgres: native protocol to DATABASE_URL, see PostgresEventStore
+BACKENDS = ("supabase", "postgres")
+
+def create_event_store(backend: Optional[str] = None, write_mode: Optional[str] = None) -> "EventStore":
+    backend = backend or os.getenv("EVENT_STORE_BACKEND", "supabase")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown event store backend '{backend}'. Expected one of {list(BACKENDS)}.")
+    if backend == "postgres":
+        from core.memory.postgres_event_store import PostgresEventStore
+        return PostgresEventStore(write_mode=write_mode)
+    return EventStore(write_mode=write_mode)
 
 class EventStore:
-    def __init__(self):
-        self.db_client = SupabaseClient()
+    def __init__(self, write_mode: Optional[str] = None, db_client: Optional[Any] = None):
+        self.db_client = db_client or SupabaseClient()
         self.logger = logging.getLogger(__name__)
+        self.write_mode = write_mode or os.getenv("EVENT_STORE_WRITE_MODE", "sync")
+        if self.write_mode not in WRITE_MODES:
+            raise ValueError(f"Unknown event store write mode '{self.write_mode}'. Expected one of {list(WRITE_MODES)}.")
+        self.batcher = EventWriteBatcher(self.db_client) if self.write_mode == "batch" else None
 
-    async def append_event(self, event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def append_event(self, event_data: Dict[str, Any], durable: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Appends an event. In batch mode this returns once the event is
+        buffered, unless `durable` is set. With `durable`, in either mode, it
+        returns the stored row and raises EventStoreWriteError if the write
+        failed (after retries in batch mode); otherwise failures are logged.
+        """
+        if 'event_data' in event_data and isinstance(event_data['event_data'], dict):
+            event_data['event_data'] = json.dumps(event_data['event_data'])
+        if self.batcher is not None:
+            return await self.batcher.add(event_data, durable=durable)
+        if durable:
+            # insert() swallows errors; insert_many() raises them.
+            try:
+                rows = await self.db_client.insert_many('event_store', [event_data])
+            except Exception as e:
+                raise EventStoreWriteError(f"Failed to store event: {e}") from e
+            return rows[0] if rows else None
         try:
-            if 'event_data' in event_data and isinstance(event_data['event_data'], dict):
-                event_data['event_data'] = json.dumps(event_data['event_data'])
             return await self.db_client.insert('event_store', event_data)
         except Exception as e:
             self.logger.error(f"Failed to append event to store: {e}", exc_info=True)
             return None
 
+    async def flush(self) -> None:
+        if self.batcher is not None:
+            await self.batcher.flush()
+
+    async def close(self) -> None:
+        """Writes any buffered events and releases the HTTP client; call on shutdown."""
+        if self.batcher is not None:
+            await self.batcher.close()
+        await self.db_client.close()
+
+    async def iter_events_for_aggregate(
+        self, aggregate_id: str, after_id: int = 0, page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the aggregate's events with id > `after_id`, oldest first. Pages
+        of `page_size` rows (EVENT_STORE_PAGE_SIZE, default 500) are fetched
+        in keyset order on id, so memory stays flat however long the
+        history is and every page is an index range scan.
+        """
+        page_size = page_size or int(os.getenv("EVENT_STORE_PAGE_SIZE", "500"))
+        while True:
+            page = await self.db_client.select_rows('event_store', {
+                "aggregate_id": f"eq.{aggregate_id}",
+                "id": f"gt.{after_id}",
+                "order": "id.asc",
+                "limit": page_size,
+            })
+            for event in page:
+                yield event
+            if len(page) < page_size:
+                return
+            after_id = page[-1]['id']
+
     async def get_events_for_aggregate(self, aggregate_id: str) -> List[Dict[str, Any]]:
+        """Loads the aggregate's whole history; prefer iter_events_for_aggregate()."""
         try:
-            client = await self.db_client.get_client()
-            response = await client.table('event_store').select('*').eq('aggregate_id', aggregate_id).order('timestamp', desc=False).execute()
-            return response.data or []
+            return [event async for event in self.iter_events_for_aggregate(aggregate_id)]
         except Exception as e:
             self.logger.error(f"Failed to get events for aggregate {aggregate_id}: {e}", exc_info=True)
             return []
+
+    async def load_snapshot(self, aggregate_id: str, projection: str) -> Optional[Dict[str, Any]]:
+        rows = await self.db_client.select_rows('aggregate_snapshots', {
+            "aggregate_id": f"eq.{aggregate_id}",
+            "projection": f"eq.{projection}",
+            "limit": 1,
+        })
+        return rows[0] if rows else None
+
+    async def save_snapshot(self, aggregate_id: str, projection: str, state: Any, last_event_id: int) -> None:
+        await self.db_client.upsert('aggregate_snapshots', {
+            "aggregate_id": aggregate_id,
+            "projection": projection,
+            "last_event_id": last_event_id,
+            "state": state,
+        }, on_conflict='aggregate_id,projection')
+
+    async def rebuild(
+        self,
+        aggregate_id: str,
+        apply_fn: Callable[[Any, Dict[str, Any]], Any],
+        projection: str,
+        initial_state: Any = None,
+        snapshot_every: Optional[int] = None,
+    ) -> Any:
+        """
+        Folds the aggregate's events into a state with `apply_fn(state, event)`,
+        starting from the latest `projection` snapshot and replaying only the
+        events after it. When the replayed tail is `snapshot_every` events or
+        longer (EVENT_STORE_SNAPSHOT_EVERY, default 100), the result is saved
+        as the new snapshot. The state must be JSON-serialisable.
+        """
+        snapshot_every = snapshot_every or int(os.getenv("EVENT_STORE_SNAPSHOT_EVERY", "100"))
+        snapshot = await self.load_snapshot(aggregate_id, projection)
+        state = snapshot['state'] if snapshot else initial_state
+        last_event_id = snapshot['last_event_id'] if snapshot else 0
+        replayed = 0
+        async for event in self.iter_events_for_aggregate(aggregate_id, after_id=last_event_id):
+            state = apply_fn(state, event)
+            last_event_id = event['id']
+            replayed += 1
+        if replayed >= snapshot_every:
+            try:
+                await self.save_snapshot(aggregate_id, projection, state, last_event_id)
+            except Exception as e:
+                # The snapshot only speeds up the next rebuild.
+                self.logger.warning(f"Could not save {projection} snapshot of {aggregate_id}: {e}")
+        return state
@@ -0,0 +1,70 @@
+# core/memory/http_client.py
+import os
+import logging
+from typing import Dict
+import httpx
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # Optional dependency (httpx[http2])
+    h2 = None
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Builds a keep-alive client from the HTTP_* environment variables. HTTP/2
+    (one multiplexed connection per host) is used when h2 is installed and
+    HTTP2_ENABLED isn't "false".
+    """
+    http2 = h2 is not None and os.getenv("HTTP2_ENABLED", "true").lower() != "false"
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0")),
+    )
+    timeout = httpx.Timeout(
+        float(os.getenv("HTTP_TIMEOUT", "10.0")),
+        connect=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5.0")),
+        pool=float(os.getenv("HTTP_POOL_TIMEOUT", "10.0")),
+    )
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+class HTTPClientRegistry:
+    """
+    Process-wide, reference-counted registry of pooled HTTP clients keyed by
+    base URL, the HTTP counterpart of RedisConnectionRegistry. Every
+    SupabaseClient in a process shares one client per URL, so requests reuse
+    warm TCP/TLS connections instead of handshaking per call. A client is
+    closed when the last user releases it.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._ref_counts: Dict[str, int] = {}
+
+    def acquire(self, base_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            self.logger.info("Creating shared HTTP client.")
+            client = create_http_client()
+            self._clients[base_url] = client
+        self._ref_counts[base_url] = self._ref_counts.get(base_url, 0) + 1
+        return client
+
+    async def release(self, base_url: str) -> None:
+        if base_url not in self._clients:
+            return
+        self._ref_counts[base_url] -= 1
+        if self._ref_counts[base_url] <= 0:
+            del self._ref_counts[base_url]
+            await self._clients.pop(base_url).aclose()
+            self.logger.info("Shared HTTP client closed.")
+
+    def ref_count(self, base_url: str) -> int:
+        return self._ref_counts.get(base_url, 0)
+
+    async def close_all(self) -> None:
+        for base_url in list(self._clients):
+            self._ref_counts.pop(base_url, None)
+            await self._clients.pop(base_url).aclose()
+
+http_client_registry = HTTPClientRegistry()
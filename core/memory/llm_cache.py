@@ -0,0 +1,50 @@
+# core/memory/llm_cache.py
+import copy
+import hashlib
+import json
+import os
+from typing import Any, Callable, Optional
+from core.memory.tiered_cache import TieredCache
+
+class LLMResultCache:
+    """
+    Remembers the parsed results of deterministic LLM calls, so resubmitted,
+    retried and redelivered events don't pay for the same answer again.
+    Entries are keyed by a BLAKE2b hash of the model name, the prompt
+    version and the call's JSON-serialisable inputs; bump the prompt
+    version whenever the prompt or the parsing of the answer changes. Only
+    store real answers, never error fallbacks.
+
+    LLM_CACHE_SIZE (default 1000) bounds the in-process tier and
+    LLM_CACHE_TTL (seconds, default 604800) the shared one, which is only
+    used when `get_client` is given.
+    """
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        prompt_version: int,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        get_client: Optional[Callable[[], Any]] = None,
+    ):
+        self.model = model
+        self.prompt_version = prompt_version
+        self.cache = TieredCache(
+            name,
+            max_entries=max_entries or int(os.getenv("LLM_CACHE_SIZE", "1000")),
+            ttl=ttl or int(os.getenv("LLM_CACHE_TTL", "604800")),
+            get_client=get_client,
+        )
+
+    def key(self, inputs: Any) -> str:
+        source = json.dumps([self.model, self.prompt_version, inputs], sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def get(self, inputs: Any) -> Optional[Any]:
+        result = await self.cache.get(self.key(inputs))
+        # Callers get their own copy; the cached entry stays untouched.
+        return copy.deepcopy(result)
+
+    async def set(self, inputs: Any, result: Any) -> None:
+        await self.cache.set(self.key(inputs), copy.deepcopy(result))
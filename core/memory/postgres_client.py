@@ -0,0 +1,172 @@
+# core/memory/postgres_client.py
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import asyncpg
+except ImportError:  # Optional dependency (EVENT_STORE_BACKEND=postgres)
+    asyncpg = None
+
+JSON_COLUMNS = ("event_data", "metadata", "state")
+TIMESTAMP_COLUMNS = ("timestamp", "created_at")
+UUID_COLUMNS = ("event_id", "correlation_id")
+
+def to_db_value(column: str, value: Any) -> Any:
+    """Converts a row value as the agents produce it to what asyncpg's codecs expect."""
+    if value is None:
+        return None
+    if column in JSON_COLUMNS and not isinstance(value, str):
+        return json.dumps(value)
+    if column in TIMESTAMP_COLUMNS and isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if column in UUID_COLUMNS and isinstance(value, str):
+        return uuid.UUID(value)
+    return value
+
+def from_db_record(record: Any) -> Dict[str, Any]:
+    """Converts a fetched record to the JSON-shaped dict PostgREST would return."""
+    row = dict(record)
+    for column, value in row.items():
+        if column in JSON_COLUMNS and isinstance(value, str):
+            row[column] = json.loads(value)
+        elif isinstance(value, datetime):
+            row[column] = value.isoformat()
+        elif isinstance(value, uuid.UUID):
+            row[column] = str(value)
+    return row
+
+def quote_columns(columns: Sequence[str]) -> str:
+    return ", ".join(f'"{column}"' for column in columns)
+
+def group_by_columns(rows: Sequence[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """Rows with the same keys share a COPY; omitted columns keep their defaults."""
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    return groups
+
+class PostgresPoolRegistry:
+    """
+    Process-wide, reference-counted registry of asyncpg pools keyed by
+    DSN, the Postgres counterpart of RedisConnectionRegistry. A pool is
+    closed when the last user releases it.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._pools: Dict[str, Any] = {}
+        self._ref_counts: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, dsn: str) -> Any:
+        async with self._lock:
+            pool = self._pools.get(dsn)
+            if pool is None:
+                self.logger.info("Creating shared Postgres connection pool.")
+                pool = await asyncpg.create_pool(
+                    dsn,
+                    min_size=int(os.getenv("PG_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("PG_POOL_MAX_SIZE", "10")),
+                    command_timeout=float(os.getenv("PG_COMMAND_TIMEOUT", "10.0")),
+                )
+                self._pools[dsn] = pool
+            self._ref_counts[dsn] = self._ref_counts.get(dsn, 0) + 1
+            return pool
+
+    async def release(self, dsn: str) -> None:
+        async with self._lock:
+            if dsn not in self._pools:
+                return
+            self._ref_counts[dsn] -= 1
+            if self._ref_counts[dsn] <= 0:
+                del self._ref_counts[dsn]
+                await self._pools.pop(dsn).close()
+                self.logger.info("Shared Postgres connection pool closed.")
+
+    def ref_count(self, dsn: str) -> int:
+        return self._ref_counts.get(dsn, 0)
+
+pool_registry = PostgresPoolRegistry()
+
+class PostgresClient:
+    """
+    Event store client speaking the native Postgres protocol through a
+    shared asyncpg pool. Queries run as prepared statements (asyncpg
+    prepares and caches every statement per connection), and bulk inserts
+    use COPY into a temporary table followed by one INSERT ... SELECT, which
+    keeps COPY's throughput while still skipping duplicate rows.
+    """
+    def __init__(self, database_url: Optional[str] = None):
+        if asyncpg is None:
+            raise ValueError("EVENT_STORE_BACKEND=postgres requires the 'asyncpg' package.")
+        self.database_url = database_url or os.getenv("DATABASE_URL")
+        if not self.database_url:
+            raise ValueError("DATABASE_URL must be set for EVENT_STORE_BACKEND=postgres")
+        self.logger = logging.getLogger(__name__)
+        self._pool: Optional[Any] = None
+
+    async def get_pool(self) -> Any:
+        if self._pool is None:
+            self._pool = await pool_registry.acquire(self.database_url)
+        return self._pool
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            self._pool = None
+            await pool_registry.release(self.database_url)
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        pool = await self.get_pool()
+        return [from_db_record(record) for record in await pool.fetch(query, *args)]
+
+    async def execute(self, query: str, *args: Any) -> None:
+        pool = await self.get_pool()
+        await pool.execute(query, *args)
+
+    async def insert(self, table: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Insert one row. Like SupabaseClient.insert(), failures are logged and return None."""
+        try:
+            columns = list(data)
+            placeholders = ", ".join(f"${index}" for index in range(1, len(columns) + 1))
+            rows = await self.fetch(
+                f"INSERT INTO {table} ({quote_columns(columns)}) VALUES ({placeholders}) RETURNING *",
+                *(to_db_value(column, data[column]) for column in columns),
+            )
+            return rows[0] if rows else None
+        except Exception as e:
+            self.logger.error(f"Failed to insert into {table}: {e}", exc_info=True)
+            return None
+
+    async def insert_many(
+        self, table: str, rows: List[Dict[str, Any]], on_conflict: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk-inserts `rows` in one transaction: COPY into a temporary table,
+        then INSERT ... SELECT into `table`, skipping rows that clash on
+        `on_conflict`. Returns the inserted rows; failures raise.
+        """
+        pool = await self.get_pool()
+        stored: List[Dict[str, Any]] = []
+        async with pool.acquire() as connection:
+            async with connection.transaction():
+                for index, (columns, group) in enumerate(group_by_columns(rows).items()):
+                    column_list = quote_columns(columns)
+                    staging = f"{table}_ingest_{index}"
+                    await connection.execute(
+                        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA"
+                    )
+                    await connection.copy_records_to_table(
+                        staging,
+                        records=[tuple(to_db_value(column, row[column]) for column in columns) for row in group],
+                        columns=list(columns),
+                    )
+                    conflict = f" ON CONFLICT ({on_conflict}) DO NOTHING" if on_conflict else ""
+                    records = await connection.fetch(
+                        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}{conflict} RETURNING *"
+                    )
+                    stored.extend(from_db_record(record) for record in records)
+        return stored
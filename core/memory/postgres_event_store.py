@@ -0,0 +1,45 @@
+# core/memory/postgres_event_store.py
+from typing import Any, AsyncIterator, Dict, Optional
+import os
+from core.memory.event_store import EventStore
+from core.memory.postgres_client import PostgresClient, to_db_value
+
+class PostgresEventStore(EventStore):
+    """
+    EventStore for self-hosted deployments that talks to the Postgres
+    database from deployment/postgres/init.sql directly (DATABASE_URL)
+    instead of through PostgREST. Writes go through the same sync/batch
+    modes; batches are ingested with COPY.
+    """
+    def __init__(self, write_mode: Optional[str] = None, database_url: Optional[str] = None):
+        super().__init__(write_mode=write_mode, db_client=PostgresClient(database_url))
+
+    async def iter_events_for_aggregate(
+        self, aggregate_id: str, after_id: int = 0, page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        page_size = page_size or int(os.getenv("EVENT_STORE_PAGE_SIZE", "500"))
+        while True:
+            page = await self.db_client.fetch(
+                "SELECT * FROM event_store WHERE aggregate_id = $1 AND id > $2 ORDER BY id LIMIT $3",
+                aggregate_id, after_id, page_size,
+            )
+            for event in page:
+                yield event
+            if len(page) < page_size:
+                return
+            after_id = page[-1]['id']
+
+    async def load_snapshot(self, aggregate_id: str, projection: str) -> Optional[Dict[str, Any]]:
+        rows = await self.db_client.fetch(
+            "SELECT * FROM aggregate_snapshots WHERE aggregate_id = $1 AND projection = $2",
+            aggregate_id, projection,
+        )
+        return rows[0] if rows else None
+
+    async def save_snapshot(self, aggregate_id: str, projection: str, state: Any, last_event_id: int) -> None:
+        await self.db_client.execute(
+            "INSERT INTO aggregate_snapshots (aggregate_id, projection, last_event_id, state) VALUES ($1, $2, $3, $4)"
+            " ON CONFLICT (aggregate_id, projection) DO UPDATE"
+            " SET last_event_id = EXCLUDED.last_event_id, state = EXCLUDED.state, created_at = NOW()",
+            aggregate_id, projection, last_event_id, to_db_value("state", state),
+        )
@@ -0,0 +1,156 @@
+# core/memory/project_status.py
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Pipeline stages in the order a project moves through them. Each stage
+# reached is stored as its own `<stage>_at` field and the current stage is
+# the furthest one recorded (`failed` wins over all), so writes are plain
+# HSETs: idempotent, and safe to apply out of order or from several
+# projector processes at once.
+STAGES = (
+    "submitted",
+    "intake_complete",
+    "scope_complete",
+    "payment_required",
+    "payment_succeeded",
+    "contact_released",
+    "failed",
+)
+STAGE_RANK = {stage: rank for rank, stage in enumerate(STAGES)}
+
+def _text(value: Union[str, bytes, None]) -> Optional[str]:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+class ProjectStatusStore:
+    """
+    Compact per-project status record kept in the Redis hash
+    `project:status:<project_id>`: a timestamp per stage reached, a scope
+    summary and the payment state. Written by the project status
+    projector and read by the API with a single HGETALL.
+    """
+    KEY_PREFIX = "project:status:"
+
+    def __init__(self, get_client: Callable[[], Any]):
+        self.get_client = get_client
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def key(cls, project_id: str) -> str:
+        return f"{cls.KEY_PREFIX}{project_id}"
+
+    async def record(
+        self,
+        project_id: str,
+        stage: str,
+        timestamp: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Records that `project_id` reached `stage` at `timestamp` and merges
+        `fields` into the record.
+        """
+        await self.get_client().hset(self.key(project_id), mapping=stage_mapping(stage, timestamp, fields))
+
+    async def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.get_client().hgetall(self.key(project_id))
+        if not raw:
+            return None
+        fields = {_text(name): _text(value) for name, value in raw.items()}
+        stages = {stage: fields[f"{stage}_at"] for stage in STAGES if f"{stage}_at" in fields}
+        status = {
+            "projectId": project_id,
+            "status": max(stages, key=STAGE_RANK.__getitem__) if stages else None,
+            "updatedAt": max(stages.values()) if stages else None,
+            "stages": stages,
+        }
+        if "scope_title" in fields:
+            status["scope"] = {
+                "title": fields.get("scope_title"),
+                "complexity": fields.get("scope_complexity"),
+                "estimatedDurationWeeks": _json_field(fields, "scope_duration_weeks", None),
+                "requiredSkills": _json_field(fields, "scope_required_skills", []),
+            }
+        if "payment_state" in fields:
+            status["payment"] = {
+                "state": fields["payment_state"],
+                "amountCents": int(fields["payment_amount_cents"]) if "payment_amount_cents" in fields else None,
+                "transactionId": fields.get("payment_transaction_id"),
+            }
+        if "error" in fields:
+            status["error"] = fields["error"]
+        return status
+
+    async def delete(self, project_id: str) -> None:
+        await self.get_client().delete(self.key(project_id))
+
+    async def rebuild(self, project_id: str, event_store: Any) -> Optional[Dict[str, Any]]:
+        """
+        Recreates the record from the event store, replacing whatever is
+        stored. The event store folds the hash fields from its latest
+        `project_status` snapshot plus the events after it. Returns the
+        rebuilt status, or None when no stored event maps to a stage.
+        """
+        mapping = await event_store.rebuild(project_id, apply_stored_event, projection='project_status', initial_state={})
+        await self.delete(project_id)
+        if not mapping:
+            return None
+        await self.get_client().hset(self.key(project_id), mapping=mapping)
+        self.logger.info(f"Rebuilt status of project {project_id} from the event store.")
+        return await self.get(project_id)
+
+def stage_mapping(stage: str, timestamp: Optional[str] = None, fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Hash fields recording `stage`; strings and numbers are stored as is, anything else as JSON."""
+    if stage not in STAGE_RANK:
+        raise ValueError(f"Unknown project stage '{stage}'.")
+    mapping = {f"{stage}_at": timestamp or datetime.utcnow().isoformat()}
+    for name, value in (fields or {}).items():
+        if value is not None:
+            mapping[name] = value if isinstance(value, (str, int, float)) else json.dumps(value)
+    return mapping
+
+def apply_stored_event(mapping: Dict[str, Any], row: Dict[str, Any]) -> Dict[str, Any]:
+    """Folds an event_store row into the status hash fields."""
+    for stage, fields in stage_updates_from_store(row):
+        mapping.update(stage_mapping(stage, _text(row.get('timestamp')), fields))
+    return mapping
+
+def scope_fields(structured_scope: Dict[str, Any]) -> Dict[str, Any]:
+    # The LLM may answer with a string ("2-3") or a structure; always store
+    # JSON so get() can decode either.
+    duration = structured_scope.get("estimated_duration_weeks")
+    skills = structured_scope.get("required_skills")
+    return {
+        "scope_title": structured_scope.get("project_title"),
+        "scope_complexity": structured_scope.get("complexity_level"),
+        "scope_duration_weeks": json.dumps(duration) if duration is not None else None,
+        "scope_required_skills": json.dumps(skills) if skills is not None else None,
+    }
+
+def _json_field(fields: Dict[str, str], name: str, default: Any) -> Any:
+    """Decodes a JSON hash field; records written before it was always JSON may hold plain text."""
+    if name not in fields:
+        return default
+    try:
+        return json.loads(fields[name])
+    except ValueError:
+        return fields[name]
+
+def stage_updates_from_store(row: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Maps an event_store row to the (stage, fields) updates it implies."""
+    data = row.get('event_data') or {}
+    if isinstance(data, (str, bytes)):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = {}
+    event_type = row.get('event_type')
+    if event_type == "homeowner:project_submitted":
+        # Stored by the intake agent once extraction has finished.
+        return [("submitted", {}), ("intake_complete", {})]
+    if event_type == "project:scope_generated":
+        return [("scope_complete", scope_fields(data))]
+    if event_type == "payment:succeeded":
+        return [("payment_succeeded", {"payment_state": "succeeded", "payment_transaction_id": data.get("id")})]
+    return []
@@ -0,0 +1,84 @@
+# core/memory/redis_client.py
+import os
+import logging
+from typing import Dict
+import redis.asyncio as redis
+
+class RedisConnections:
+    """
+    A pair of clients sharing one Redis URL:
+
+    - `reader` is backed by a pool reserved for blocking reads (XREADGROUP
+      with BLOCK holds its connection for the whole block period).
+    - `writer` is backed by a separate pool for short, non-blocking commands
+      (XADD, XACK, XAUTOCLAIM, XINFO, ...), so writes never queue behind a
+      blocked read.
+    """
+    # Events cross the network, so the publisher encodes payloads with its codec.
+    serializes = True
+
+    def __init__(self, redis_url: str, read_pool_size: int, write_pool_size: int, pool_timeout: float):
+        self.redis_url = redis_url
+        self.ref_count = 0
+        self.reader = redis.Redis(connection_pool=self._create_pool(redis_url, read_pool_size, pool_timeout))
+        self.writer = redis.Redis(connection_pool=self._create_pool(redis_url, write_pool_size, pool_timeout))
+
+    @staticmethod
+    def _create_pool(redis_url: str, max_connections: int, timeout: float) -> redis.BlockingConnectionPool:
+        kwargs = {"max_connections": max_connections, "timeout": timeout}
+        if redis_url.startswith("rediss://"):
+            # Fix for DigitalOcean managed Redis TLS connection
+            kwargs["ssl_cert_reqs"] = None
+        return redis.BlockingConnectionPool.from_url(redis_url, **kwargs)
+
+    async def close(self) -> None:
+        await self.reader.aclose()
+        await self.writer.aclose()
+        await self.reader.connection_pool.disconnect()
+        await self.writer.connection_pool.disconnect()
+
+class RedisConnectionRegistry:
+    """
+    Process-wide, reference-counted registry of Redis connection pools keyed
+    by URL. Every consumer and publisher in a process acquires its clients
+    here, so `run_agents.py all` opens (and TLS-handshakes) one set of pools
+    instead of one per agent. Pools are closed when the last user releases.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._connections: Dict[str, RedisConnections] = {}
+
+    def acquire(self, redis_url: str) -> RedisConnections:
+        connections = self._connections.get(redis_url)
+        if connections is None:
+            self.logger.info("Creating shared Redis connection pools.")
+            connections = RedisConnections(
+                redis_url,
+                read_pool_size=int(os.getenv("REDIS_READ_POOL_SIZE", "20")),
+                write_pool_size=int(os.getenv("REDIS_WRITE_POOL_SIZE", "20")),
+                pool_timeout=float(os.getenv("REDIS_POOL_TIMEOUT", "10.0")),
+            )
+            self._connections[redis_url] = connections
+        connections.ref_count += 1
+        return connections
+
+    async def release(self, redis_url: str) -> None:
+        connections = self._connections.get(redis_url)
+        if connections is None:
+            return
+        connections.ref_count -= 1
+        if connections.ref_count <= 0:
+            del self._connections[redis_url]
+            await connections.close()
+            self.logger.info("Shared Redis connection pools closed.")
+
+    def ref_count(self, redis_url: str) -> int:
+        connections = self._connections.get(redis_url)
+        return connections.ref_count if connections else 0
+
+    async def close_all(self) -> None:
+        for redis_url in list(self._connections):
+            connections = self._connections.pop(redis_url)
+            await connections.close()
+
+connection_registry = RedisConnectionRegistry()
@@ -4,10 +4,13 @@ import logging
 from typing import Dict, Any, List, Optional
 import httpx
 import json
+from core.memory.http_client import http_client_registry
 
 class SupabaseClient:
     """
-    Simplified Supabase client for event store operations.
+    Simplified Supabase client for event store operations. Requests go
+    through the process-wide pooled HTTP client for SUPABASE_URL, acquired
+    on first use; call close() when done with this instance.
     """
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
@@ -21,26 +24,82 @@ class SupabaseClient:
             "Content-Type": "application/json"
         }
         self.logger = logging.getLogger(__name__)
+        self._http: Optional[httpx.AsyncClient] = None
 
     async def get_client(self):
         """Return the client instance - for compatibility with existing code."""
         return self
 
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = http_client_registry.acquire(self.supabase_url)
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None:
+            self._http = None
+            await http_client_registry.release(self.supabase_url)
+
     async def insert(self, table: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Insert a record into a Supabase table."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.supabase_url}/rest/v1/{table}",
-                    headers=self.headers,
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json() if response.content else None
+            response = await self._http_client().post(
+                f"{self.supabase_url}/rest/v1/{table}",
+                headers=self.headers,
+                json=data
+            )
+            response.raise_for_status()
+            return response.json() if response.content else None
         except Exception as e:
             self.logger.error(f"Failed to insert into {table}: {e}", exc_info=True)
             return None
 
+    async def insert_many(
+        self, table: str, rows: List[Dict[str, Any]], on_conflict: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Inserts `rows` with one bulk POST, in a single statement. Rows may
+        have different keys; missing columns take their defaults. With
+        `on_conflict`, rows clashing on that unique column are skipped, so a
+        retried batch doesn't fail on rows that already made it. Unlike
+        insert(), failures raise so callers can retry.
+        """
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        params = {"columns": ",".join(columns)}
+        headers = dict(self.headers, Prefer="return=representation")
+        if on_conflict:
+            params["on_conflict"] = on_conflict
+            headers["Prefer"] += ",resolution=ignore-duplicates"
+        response = await self._http_client().post(
+            f"{self.supabase_url}/rest/v1/{table}",
+            headers=headers,
+            params=params,
+            json=rows
+        )
+        response.raise_for_status()
+        return response.json() if response.content else []
+
+    async def upsert(self, table: str, row: Dict[str, Any], on_conflict: str) -> None:
+        """Inserts `row` or overwrites the row it clashes with on `on_conflict`. Failures raise."""
+        response = await self._http_client().post(
+            f"{self.supabase_url}/rest/v1/{table}",
+            headers=dict(self.headers, Prefer="resolution=merge-duplicates"),
+            params={"on_conflict": on_conflict},
+            json=row
+        )
+        response.raise_for_status()
+
+    async def select_rows(self, table: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Selects with raw PostgREST query parameters (operator filters such as
+        {"id": "gt.10"}, `order`, `limit`). Unlike select(), failures raise.
+        """
+        response = await self._http_client().get(
+            f"{self.supabase_url}/rest/v1/{table}", headers=self.headers, params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
     async def select(self, table: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Select records from a Supabase table."""
         try:
@@ -50,10 +109,9 @@ class SupabaseClient:
                 for key, value in filters.items():
                     params[key] = f"eq.{value}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self._http_client().get(url, headers=self.headers, params=params)
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             self.logger.error(f"Failed to select from {table}: {e}", exc_info=True)
             return []
@@ -0,0 +1,102 @@
+# core/memory/tiered_cache.py
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+class TieredCache:
+    """
+    Bounded in-process LRU in front of an optional shared Redis tier.
+
+    get() tries the LRU first, then Redis when `get_client` is given; a
+    shared hit is copied into the LRU. set() writes both tiers, Redis under
+    `<name>:<key>` with a TTL of `ttl` seconds. Values must be
+    JSON-serialisable and not None. Entries never go stale in place, so
+    keys must include everything the value depends on, versions included.
+
+    The shared tier is best effort: its errors, unreadable values included,
+    are logged and count as misses, so a Redis outage only costs
+    recomputation. A bad value is overwritten by the next set().
+    """
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl: Optional[int] = None,
+        get_client: Optional[Callable[[], Any]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"Cache '{name}' needs max_entries >= 1, got {max_entries}.")
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.get_client = get_client
+        self.logger = logging.getLogger(f"cache.{name}")
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def shared_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.get_client is not None:
+            try:
+                raw = await self.get_client().get(self.shared_key(key))
+                value = json.loads(raw) if raw is not None else None
+            except Exception as e:
+                # Includes corrupt or foreign values under our key.
+                self.shared_errors += 1
+                self.logger.warning(f"Shared cache read failed: {e}")
+                value = None
+            if value is not None:
+                self._store(key, value)
+                self.hits += 1
+                self.shared_hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        self._store(key, value)
+        if self.get_client is not None:
+            try:
+                await self.get_client().set(self.shared_key(key), json.dumps(value), ex=self.ttl)
+            except Exception as e:
+                self.shared_errors += 1
+                self.logger.warning(f"Shared cache write failed: {e}")
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drops the in-process entries; the shared tier expires on its own."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "shared_errors": self.shared_errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,6 +1,127 @@
 # core/security/contact_filter.py
+import hashlib
 import re
-from typing import Dict, List
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+FILTERED = "[FILTERED]"
+# Bump when what the filter reports changes without a pattern changing;
+# pattern_version() covers the patterns themselves.
+PATTERN_VERSION = 1
+_WORD_CHAR = re.compile(r'\w')
+
+class ContactMatch(NamedTuple):
+    kind: str      # "phones", "emails" or "intent"
+    pattern: int   # index into ContactProtectionFilter.scan_patterns()
+    start: int
+    end: int
+    text: str      # what re.findall() reports: group 1 for intent patterns
+
+def _is_word(content: str, index: int) -> bool:
+    return 0 <= index < len(content) and _WORD_CHAR.match(content, index) is not None
+
+class Trigger(NamedTuple):
+    """
+    Where some patterns can start, for ContactScanner. `condition` matches
+    exactly one character, which is in the regex class `first`; the
+    patterns are then tried at that position or, with `local_part`, at every
+    word boundary of the email local part that ends before it.
+    """
+    first: str
+    condition: str
+    patterns: Sequence[re.Pattern]
+    local_part: bool = False
+
+# What the email patterns accept before their "@", "[" or "at": the local
+# part characters, as matched case-insensitively.
+_LOCAL_PART_CHAR = re.compile(r'[A-Za-z0-9._%+-]', re.IGNORECASE)
+_WORD_BOUNDARY = re.compile(r'\b')
+
+# Before lower(), maps the only non-ASCII characters that match an ASCII
+# letter when ignoring case, so substring checks on the result find every
+# keyword an IGNORECASE pattern would.
+_ASCII_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+_DIGIT_RUN = re.compile(r'\d{3}')
+
+class ContactScanner:
+    """
+    Finds the matches of several patterns in one pass over the text.
+
+    The triggers are combined into one regex of named groups that stops
+    only at characters a match can start at (or, for emails, the separator
+    after the local part). The group that matched names the patterns to try
+    there, and only those are matched at that position. Replaying
+    re.findall()'s non-overlapping rule per pattern gives exactly its
+    results, provided every position where a pattern matches is reached by
+    one of its triggers. Triggers must not share a first character, and
+    patterns must not match the empty string.
+    """
+    def __init__(self, patterns: Sequence[Tuple[str, re.Pattern]], triggers: Sequence[Trigger]):
+        self.patterns = list(patterns)
+        index_of = {pattern: index for index, (_, pattern) in enumerate(self.patterns)}
+        branches, first = [], []
+        self._dispatch: Dict[str, Tuple[Tuple[int, ...], bool]] = {}
+        for number, trigger in enumerate(triggers):
+            indices = tuple(sorted(index_of[pattern] for pattern in trigger.patterns if pattern in index_of))
+            if indices:
+                branches.append(f"(?P<t{number}>{trigger.condition})")
+                first.append(trigger.first)
+                self._dispatch[f"t{number}"] = (indices, trigger.local_part)
+        # The leading class lets the regex engine skip every other character quickly.
+        self.regex = re.compile(f"(?=[{''.join(first)}])(?:{'|'.join(branches)})") if branches else None
+
+    def find(self, content: str, start_at: Optional[Sequence[int]] = None) -> List[ContactMatch]:
+        """
+        All matches, ordered by pattern and then by position, like successive
+        findall() calls. With `start_at`, pattern i is only tried from
+        position start_at[i] on, as if an earlier match had ended there.
+        """
+        if self.regex is None:
+            return []
+        per_pattern: List[List[ContactMatch]] = [[] for _ in self.patterns]
+        next_start = list(start_at) if start_at is not None else [0] * len(self.patterns)
+        local_parts_done = 0
+        for candidate in self.regex.finditer(content):
+            indices, local_part = self._dispatch[candidate.lastgroup]
+            if not local_part:
+                self._match_at(content, candidate.start(), indices, per_pattern, next_start)
+                continue
+            end = candidate.start()
+            while end > local_parts_done and content[end - 1].isspace():
+                end -= 1
+            start = end
+            while start > local_parts_done and _LOCAL_PART_CHAR.match(content[start - 1]):
+                start -= 1
+            for boundary in _WORD_BOUNDARY.finditer(content, start, end):
+                if boundary.start() < end:
+                    self._match_at(content, boundary.start(), indices, per_pattern, next_start)
+            local_parts_done = max(local_parts_done, end)
+        return [match for matches in per_pattern for match in matches]
+
+    def _match_at(
+        self,
+        content: str,
+        position: int,
+        indices: Tuple[int, ...],
+        per_pattern: List[List[ContactMatch]],
+        next_start: List[int],
+    ) -> None:
+        for index in indices:
+            if position < next_start[index]:
+                continue
+            kind, pattern = self.patterns[index]
+            match = pattern.match(content, position)
+            if match is None:
+                continue
+            next_start[index] = match.end()
+            if pattern.groups == 0:
+                text = match.group()
+            elif pattern.groups == 1:
+                text = match.group(1)
+            else:
+                text = match.groups()
+            per_pattern[index].append(ContactMatch(kind, index, position, match.end(), text))
 
 class ContactProtectionFilter:
     PHONE_PATTERNS = [
@@ -23,19 +144,204 @@ class ContactProtectionFilter:
         re.compile(r'\b(whatsapp|telegram|signal)\b', re.IGNORECASE),
     ]
 
+    def __init__(self):
+        self._patterns = self.scan_patterns()
+        self._triggers = self.candidate_triggers()
+        index_of = {pattern: index for index, (_, pattern) in enumerate(self._patterns)}
+        self._no_patterns: FrozenSet[int] = frozenset()
+        self._phone_indices = frozenset(index_of[pattern] for pattern in self.PHONE_PATTERNS)
+        self._plain_email_indices = frozenset([index_of[self.EMAIL_PATTERNS[0]]])
+        self._bracket_email_indices = frozenset([index_of[self.EMAIL_PATTERNS[1]]])
+        self._spelled_email_indices = frozenset([index_of[self.EMAIL_PATTERNS[2]]])
+        self._intent_indices = [frozenset([index_of[pattern]]) for pattern in self.INTENT_PATTERNS]
+        self._scrub_patterns = self.PHONE_PATTERNS + self.EMAIL_PATTERNS
+        self._scrub_indices = frozenset(range(len(self._scrub_patterns)))
+        # One scanner per set of patterns the prefilter let through.
+        self._scanners: Dict[FrozenSet[int], ContactScanner] = {}
+
+    def scan_patterns(self) -> List[Tuple[str, re.Pattern]]:
+        """Every pattern with its violation kind; phones and emails first, in scrub order."""
+        return (
+            [("phones", pattern) for pattern in self.PHONE_PATTERNS]
+            + [("emails", pattern) for pattern in self.EMAIL_PATTERNS]
+            + [("intent", pattern) for pattern in self.INTENT_PATTERNS]
+        )
+
+    def pattern_version(self) -> str:
+        """Identifies the pattern set; results cached under another version are stale."""
+        source = "\n".join(f"{kind}:{pattern.flags}:{pattern.pattern}" for kind, pattern in self.scan_patterns())
+        return hashlib.blake2b(f"{PATTERN_VERSION}\n{source}".encode("utf-8"), digest_size=8).hexdigest()
+
+    def candidate_triggers(self) -> List[Trigger]:
+        """
+        Where each pattern can start, for ContactScanner. Keep these in sync
+        with the patterns above: a trigger may fire too often, never too
+        rarely.
+        """
+        phones = self.PHONE_PATTERNS
+        return [
+            Trigger(r'(', r'\(', [phones[1]]),
+            Trigger(r'+', r'\+', [phones[3]]),
+            Trigger(r'\d', r'(?<!\w)\d', [phones[0], phones[2]]),
+            # Every email pattern needs "@", "[" or "at" after its local part.
+            Trigger(r'@\[aA', r'[@\[]|(?i:a(?=t))', self.EMAIL_PATTERNS, local_part=True),
+            # "ſ" matches "s" when ignoring case.
+            Trigger(
+                r'ctermwsCTERMWSſ',
+                r'(?<!\w)(?i:c(?=all|ontact)|t(?=ext|elegram)|e(?=mail)|r(?=each)|m(?=y)|w(?=hatsapp)|s(?=ignal))',
+                self.INTENT_PATTERNS,
+            ),
+        ]
+
+    def prefilter(self, content: str) -> FrozenSet[int]:
+        """
+        Indices (into scan_patterns()) of the patterns that can match
+        `content` at all, from substring checks that are much cheaper than
+        any regex pass: phones need a run of three digits, emails an "@" or
+        "at" and a "." or "dot", intents their keywords. Keep this in sync
+        with the patterns: it may let a pattern through needlessly, never
+        rule one out that could match.
+        """
+        folded = (content if content.isascii() else content.translate(_ASCII_FOLD)).lower()
+        candidates = self._no_patterns
+        if _DIGIT_RUN.search(content) is not None:
+            candidates |= self._phone_indices
+        at = "at" in folded
+        if (at or "@" in content) and ("." in content or "dot" in folded):
+            candidates |= self._spelled_email_indices
+            if "@" in content and "." in content:
+                candidates |= self._plain_email_indices
+            if "[" in content and at and "dot" in folded:
+                candidates |= self._bracket_email_indices
+        if "me" in folded and (
+            "call" in folded or "text" in folded or "email" in folded or "contact" in folded or "reach" in folded
+        ):
+            candidates |= self._intent_indices[0]
+        if "my" in folded and ("number" in folded or "phone" in folded or "cell" in folded or "email" in folded):
+            candidates |= self._intent_indices[1]
+        if "whatsapp" in folded or "telegram" in folded or "signal" in folded:
+            candidates |= self._intent_indices[2]
+        return candidates
+
+    def _scanner(self, indices: FrozenSet[int]) -> ContactScanner:
+        scanner = self._scanners.get(indices)
+        if scanner is None:
+            allowed = {self._patterns[index][1] for index in indices}
+            triggers = [
+                trigger._replace(patterns=[pattern for pattern in trigger.patterns if pattern in allowed])
+                for trigger in self._triggers
+            ]
+            scanner = self._scanners[indices] = ContactScanner(self._patterns, triggers)
+        return scanner
+
+    def find_matches(self, content: str, start_at: Optional[Sequence[int]] = None) -> List[ContactMatch]:
+        """
+        Every phone, email and intent match with its span, from a single
+        scan. `start_at` is passed to ContactScanner.find().
+        """
+        indices = self.prefilter(content)
+        return self._scanner(indices).find(content, start_at) if indices else []
+
     def scan_content(self, content: str) -> Dict[str, List[str]]:
+        return self.violations(self.find_matches(content))
+
+    def scan_many(
+        self, messages: Sequence[str], processes: Optional[int] = None
+    ) -> List[Optional[Dict[str, List[str]]]]:
+        """
+        Scans a batch of messages. The result lines up with `messages`: None
+        for a clean message, its scan_content() violations otherwise. With
+        `processes` > 1 the batch is split across a process pool created for
+        the call, which only pays off for batches of thousands of messages.
+        """
+        if not processes or processes <= 1 or len(messages) < 2:
+            return [self._scan_compact(content) for content in messages]
+        chunk_size = -(-len(messages) // (processes * 4))
+        chunks = [messages[start:start + chunk_size] for start in range(0, len(messages), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(type(self),)) as pool:
+            return [result for results in pool.map(_scan_chunk, chunks) for result in results]
+
+    def _scan_compact(self, content: str) -> Optional[Dict[str, List[str]]]:
+        matches = self.find_matches(content)
+        return self.violations(matches) if matches else None
+
+    def violations(self, matches: List[ContactMatch]) -> Dict[str, List[str]]:
+        """Groups find_matches() results the way scan_content() reports them."""
         violations: Dict[str, List[str]] = {"phones": [], "emails": [], "intent": []}
-        for pattern in self.PHONE_PATTERNS:
-            violations["phones"].extend(pattern.findall(content))
-        for pattern in self.EMAIL_PATTERNS:
-            violations["emails"].extend(pattern.findall(content))
-        for pattern in self.INTENT_PATTERNS:
-            violations["intent"].extend(pattern.findall(content))
+        for match in matches:
+            violations[match.kind].append(match.text)
         return violations
 
-    def scrub_content(self, content: str) -> str:
-        scrubbed_content = content
-        all_patterns = self.PHONE_PATTERNS + self.EMAIL_PATTERNS
-        for pattern in all_patterns:
-            scrubbed_content = pattern.sub("[FILTERED]", scrubbed_content)
-        return scrubbed_content
+    def scrub_content(self, content: str, matches: Optional[List[ContactMatch]] = None) -> str:
+        """
+        Replaces phones and emails with [FILTERED]. Pass the result of
+        find_matches() when the content was scanned already.
+        """
+        if matches is None:
+            indices = self.prefilter(content) & self._scrub_indices
+            if not indices:
+                return content
+            matches = self._scanner(indices).find(content)
+        scrub_count = len(self._scrub_patterns)
+        regions, resume = self._scrub_regions(content, [match for match in matches if match.pattern < scrub_count])
+        if regions:
+            pieces, position = [], 0
+            for start, end in regions:
+                pieces.append(content[position:start])
+                pieces.append(FILTERED)
+                position = end
+            pieces.append(content[position:])
+            content = "".join(pieces)
+        # Patterns whose matches can't be taken from the original text.
+        for pattern in self._scrub_patterns[resume:]:
+            content = pattern.sub(FILTERED, content)
+        return content
+
+    def _scrub_regions(self, content: str, matches: List[ContactMatch]) -> Tuple[List[Tuple[int, int]], int]:
+        """
+        Returns the spans that scrubbing replaces, and the index of the first
+        pattern whose matches might not be the ones it would find in the
+        partly scrubbed text; that pattern and the ones after it must be
+        applied with sub() instead.
+
+        Each pattern's substitution runs on the output of the previous ones.
+        A match that lies inside an already replaced span disappears, and no
+        pattern can match into or across "[FILTERED]". Other matches only
+        stay the same when they don't touch an earlier replaced span and
+        each span keeps its word-boundary status on both sides once it is
+        replaced.
+        """
+        regions: List[Tuple[int, int]] = []
+        starts: List[int] = []
+        index = 0
+        while index < len(matches):
+            pattern = matches[index].pattern
+            added = []
+            while index < len(matches) and matches[index].pattern == pattern:
+                match = matches[index]
+                index += 1
+                slot = bisect_right(starts, match.start) - 1
+                if slot >= 0 and regions[slot][0] <= match.start and match.end <= regions[slot][1]:
+                    continue  # Inside an earlier replacement.
+                if (
+                    (slot >= 0 and regions[slot][1] >= match.start)  # Overlaps or touches one.
+                    or (slot + 1 < len(regions) and regions[slot + 1][0] <= match.end)
+                    # "[FILTERED]" starts and ends with non-word characters.
+                    or (_is_word(content, match.start) and _is_word(content, match.start - 1))
+                    or (_is_word(content, match.end - 1) and _is_word(content, match.end))
+                ):
+                    return regions, pattern
+                added.append((match.start, match.end))
+            regions = sorted(regions + added)
+            starts = [start for start, _ in regions]
+        return regions, len(self._scrub_patterns)
+
+# Process pool workers keep one filter each, built once by _init_worker().
+_worker_filter: Optional[ContactProtectionFilter] = None
+
+def _init_worker(filter_class: type) -> None:
+    global _worker_filter
+    _worker_filter = filter_class()
+
+def _scan_chunk(messages: Sequence[str]) -> List[Optional[Dict[str, List[str]]]]:
+    return [_worker_filter._scan_compact(content) for content in messages]
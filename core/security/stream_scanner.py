@@ -0,0 +1,96 @@
+# core/security/stream_scanner.py
+import os
+import re
+from typing import List, Optional
+from core.security.contact_filter import ContactMatch, ContactProtectionFilter
+
+def _max_width(pattern: re.Pattern) -> Optional[int]:
+    """The longest text `pattern` can match, or None when that is unbounded or unknown."""
+    if "(?=" in pattern.pattern or "(?!" in pattern.pattern:
+        return None  # Lookaheads read past the match
+    parser = getattr(re, "_parser", None)
+    if parser is None:
+        return None
+    try:
+        width = parser.parse(pattern.pattern, pattern.flags).getwidth()[1]
+    except Exception:
+        return None
+    return width if width < parser.MAXREPEAT else None
+
+class StreamingContactScanner:
+    """
+    Scans text that arrives in pieces, such as a live transcript, and
+    reports each ContactProtectionFilter match once, as soon as no later
+    text can change it.
+
+    A match attempt for a pattern reads at most its longest match plus one
+    character (for a closing \\b) past where it starts, so once the stream
+    is that far ahead every earlier position is settled for the pattern.
+    Patterns with unbounded repeats use `window` (CONTACT_STREAM_WINDOW,
+    default 64) instead, and that is also the most text kept between
+    chunks. Apart from matches that need more than `window` characters of
+    context, feed() and finish() report exactly what find_matches() gives
+    for the whole stream, with offsets into the stream. The patterns may
+    look at most one character behind a match (\\b).
+    """
+    def __init__(self, contact_filter: Optional[ContactProtectionFilter] = None, window: Optional[int] = None):
+        self.contact_filter = contact_filter or ContactProtectionFilter()
+        self.window = window or int(os.getenv("CONTACT_STREAM_WINDOW", "64"))
+        if self.window < 1:
+            raise ValueError(f"CONTACT_STREAM_WINDOW must be >= 1, got {self.window}.")
+        self.horizons: List[int] = []
+        for _, pattern in self.contact_filter.scan_patterns():
+            width = _max_width(pattern)
+            self.horizons.append(width + 1 if width is not None else self.window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts a new stream."""
+        self._buffer = ""
+        self._offset = 0  # Stream position of _buffer[0]
+        # Per pattern, the first stream position that may still start a match.
+        self._resume = [0] * len(self.horizons)
+
+    @property
+    def position(self) -> int:
+        """Characters fed so far."""
+        return self._offset + len(self._buffer)
+
+    @property
+    def pending(self) -> int:
+        """Characters kept for the next chunk."""
+        return len(self._buffer)
+
+    def feed(self, chunk: str) -> List[ContactMatch]:
+        """Appends `chunk` and returns the matches it settled, in find_matches() order."""
+        self._buffer += chunk
+        return self._scan(final=False)
+
+    def finish(self) -> List[ContactMatch]:
+        """Ends the stream, returning the matches still pending, and resets the scanner."""
+        matches = self._scan(final=True)
+        self.reset()
+        return matches
+
+    def _scan(self, final: bool) -> List[ContactMatch]:
+        buffer, offset = self._buffer, self._offset
+        # Buffer positions below limits[i] are settled for pattern i.
+        end = len(buffer)
+        limits = [end if final else end - horizon + 1 for horizon in self.horizons]
+        start_at = [resume - offset for resume in self._resume]
+        if not any(limit > start for limit, start in zip(limits, start_at)):
+            return []
+
+        settled: List[ContactMatch] = []
+        for match in self.contact_filter.find_matches(buffer, start_at):
+            # Matches come in position order per pattern, so this keeps a prefix of each.
+            if match.start < limits[match.pattern]:
+                start_at[match.pattern] = match.end
+                settled.append(match._replace(start=match.start + offset, end=match.end + offset))
+        self._resume = [offset + max(start, limit) for start, limit in zip(start_at, limits)]
+
+        # Keep one character before the earliest unsettled position for \b.
+        keep_from = max(offset, min(self._resume) - 1)
+        self._buffer = buffer[keep_from - offset:]
+        self._offset = keep_from
+        return settled
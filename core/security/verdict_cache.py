@@ -0,0 +1,50 @@
+# core/security/verdict_cache.py
+import hashlib
+import os
+from typing import Any, Callable, Dict, List, Optional
+from core.memory.tiered_cache import TieredCache
+from core.security.contact_filter import ContactProtectionFilter
+
+class VerdictCache:
+    """
+    Remembers ContactProtectionFilter.scan_content() verdicts, so repeated
+    and templated messages are scanned once. Entries are keyed by the
+    filter's pattern_version() and a BLAKE2b hash of the content with
+    surrounding whitespace stripped, which never changes a verdict (no
+    pattern can start or end on whitespace). A pattern change therefore
+    switches to fresh keys; old entries age out of the LRU and expire in
+    Redis.
+
+    VERDICT_CACHE_SIZE (default 10000) bounds the in-process tier and
+    VERDICT_CACHE_TTL (seconds, default 86400) the shared one, which is only
+    used when `get_client` is given.
+    """
+    def __init__(
+        self,
+        contact_filter: ContactProtectionFilter,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        get_client: Optional[Callable[[], Any]] = None,
+    ):
+        self.contact_filter = contact_filter
+        self.version = contact_filter.pattern_version()
+        self.cache = TieredCache(
+            "contact_verdicts",
+            max_entries=max_entries or int(os.getenv("VERDICT_CACHE_SIZE", "10000")),
+            ttl=ttl or int(os.getenv("VERDICT_CACHE_TTL", "86400")),
+            get_client=get_client,
+        )
+
+    def key(self, content: str) -> str:
+        digest = hashlib.blake2b(content.strip().encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        return f"{self.version}:{digest}"
+
+    async def scan_content(self, content: str) -> Dict[str, List[str]]:
+        """Same result as ContactProtectionFilter.scan_content(), from the cache when possible."""
+        key = self.key(content)
+        violations = await self.cache.get(key)
+        if violations is None:
+            violations = self.contact_filter.scan_content(content)
+            await self.cache.set(key, violations)
+        # Callers get their own lists; the cached entry stays untouched.
+        return {kind: list(texts) for kind, texts in violations.items()}
@@ -14,9 +14,21 @@ CREATE TABLE event_store (
     timestamp TIMESTAMPTZ DEFAULT NOW() NOT NULL
 );
 
-CREATE INDEX idx_event_store_aggregate_id ON event_store(aggregate_id);
+-- Serves keyset-paginated reads of one aggregate (aggregate_id = ? AND id > ? ORDER BY id)
+CREATE INDEX idx_event_store_aggregate_id ON event_store(aggregate_id, id);
 CREATE INDEX idx_event_store_event_type ON event_store(event_type);
 
+-- Latest folded state per aggregate and projection; rebuilds replay only the
+-- events after last_event_id.
+CREATE TABLE aggregate_snapshots (
+    aggregate_id VARCHAR(255) NOT NULL,
+    projection VARCHAR(255) NOT NULL,
+    last_event_id BIGINT NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (aggregate_id, projection)
+);
+
 CREATE TABLE projects (
     id UUID PRIMARY KEY,
     homeowner_id UUID NOT NULL,
@@ -2,8 +2,13 @@ import logging
 import json
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
+from core.base.metrics import aggregate, load_snapshots, render_prometheus
 from core.events.publisher import EventPublisher
+from core.events.stream_health import StreamHealthMonitor
+from core.events.transport import TransportClient
+from core.memory.project_status import ProjectStatusStore
 
 # --- FastAPI App Setup ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -21,10 +26,20 @@ app.add_middleware(
 
 # --- Core Service Components ---
 event_publisher = EventPublisher()
+# Reads state the agents share through Redis (metrics snapshots, stream
+# health, project status records).
+state_client = TransportClient()
+stream_health = StreamHealthMonitor(state_client.get)
+project_status = ProjectStatusStore(state_client.get)
+
+SWARM_AGENT_TYPES = (
+    "homeowner_intake", "project_scope", "communication_filter", "payment_gate", "ui_generator", "project_status",
+)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     await event_publisher.close()
+    await state_client.close()
 
 @app.get("/health", status_code=200)
 async def health_check():
@@ -59,27 +74,51 @@ async def submit_project(submission: ProjectSubmission):
 
 @app.get("/projects/{project_id}/status")
 async def get_project_status(project_id: str):
-    # Placeholder for project status tracking
-    return {
-        "projectId": project_id,
-        "status": "processing",
-        "message": "Project is being processed by the agent swarm."
-    }
+    """Current stage of a project, as projected by the project status agent."""
+    try:
+        status = await project_status.get(project_id)
+    except Exception as e:
+        logger.error(f"Failed to load status of project {project_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Project status is unavailable.")
+    if status is None:
+        raise HTTPException(status_code=404, detail="Project not found.")
+    return status
 
 @app.get("/system/stats")
 async def get_system_stats():
-    # Placeholder for system statistics
+    """Per agent type metrics, aggregated over every running agent process."""
+    try:
+        snapshots = await load_snapshots(state_client.get())
+    except Exception as e:
+        logger.error(f"Failed to load agent metrics: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Agent metrics are unavailable.")
+    agents = aggregate(snapshots)
+    for agent_type in SWARM_AGENT_TYPES:
+        agents.setdefault(agent_type, {"status": "inactive", "instances": 0})
     return {
-        "agents": {
-            "homeowner_intake": "active",
-            "project_scope": "active", 
-            "communication_filter": "active",
-            "payment_gate": "active",
-            "ui_generator": "active"
-        },
-        "redis_streams": "connected",
-        "api_status": "healthy"
+        "agents": agents,
+        "transport": state_client.transport,
+        "api_status": "healthy",
     }
 
+@app.get("/system/metrics", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """Per agent process metrics in the Prometheus text format."""
+    try:
+        snapshots = await load_snapshots(state_client.get())
+    except Exception as e:
+        logger.error(f"Failed to load agent metrics: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Agent metrics are unavailable.")
+    return PlainTextResponse(render_prometheus(snapshots), media_type="text/plain; version=0.0.4")
+
+@app.get("/system/streams")
+async def get_stream_health():
+    """Lag, pending entries and consumer idle times per stream and consumer group."""
+    try:
+        return await stream_health.snapshot()
+    except Exception as e:
+        logger.error(f"Failed to sample stream health: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Stream health is unavailable.")
+
 # For Vercel/DigitalOcean deployment
 handler = app
\ No newline at end of file
@@ -5,9 +5,11 @@ Agent Runner Script - Starts individual agents for the InstaBids Agent Swarm
 """
 import asyncio
 import signal
+import socket
 import sys
 import os
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -17,6 +19,8 @@ from agents.project_scope.scope_agent import ProjectScopeAgent
 from agents.communication_filter.filter_agent import CommunicationFilterAgent
 from agents.payment_gate.payment_agent import PaymentGateAgent
 from agents.ui_generator.ui_agent import UIGeneratorAgent
+from agents.project_status.status_agent import ProjectStatusAgent
+from core.events.transport import get_transport_name
 
 # Environment variables must be set before running
 REQUIRED_ENV_VARS = [
@@ -28,7 +32,10 @@ REQUIRED_ENV_VARS = [
 
 def check_environment():
     """Verify all required environment variables are set."""
-    missing = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+    required = REQUIRED_ENV_VARS
+    if os.getenv("EVENT_TRANSPORT") == "memory":
+        required = [var for var in REQUIRED_ENV_VARS if var != "REDIS_URL"]
+    missing = [var for var in required if not os.getenv(var)]
     if missing:
         print(f"❌ Missing required environment variables: {', '.join(missing)}")
         print("Please set these environment variables before running agents.")
@@ -40,7 +47,8 @@ AGENT_MAP = {
     "scope": ProjectScopeAgent, 
     "filter": CommunicationFilterAgent,
     "payment": PaymentGateAgent,
-    "ui": UIGeneratorAgent
+    "ui": UIGeneratorAgent,
+    "status": ProjectStatusAgent,
 }
 
 class AgentRunner:
@@ -117,6 +125,106 @@ class AgentRunner:
         except KeyboardInterrupt:
             await self.shutdown()
 
+class AgentSupervisor:
+    """
+    Runs each agent type as N separate worker processes so CPU-heavy agents
+    don't share one core and one event loop with everybody else.
+
+    Every worker is `python run_agents.py <type> <agent_id>` with a stable
+    agent_id (`<type>_<host>_<index>`), so a restarted worker rejoins the same
+    consumer group under the same consumer name and picks up its own pending
+    entries. Crashed workers are restarted with exponential backoff.
+    """
+    def __init__(self, replicas: Dict[str, int]):
+        self.replicas = replicas
+        self.running = True
+        self.host_id = os.getenv("AGENT_HOST_ID") or socket.gethostname()
+        self.base_backoff = float(os.getenv("SUPERVISOR_BACKOFF_INITIAL", "1.0"))
+        self.max_backoff = float(os.getenv("SUPERVISOR_BACKOFF_MAX", "60.0"))
+        # A worker that stayed up this long is considered healthy again.
+        self.stable_after = float(os.getenv("SUPERVISOR_STABLE_AFTER", "30.0"))
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._watchers: List[asyncio.Task] = []
+
+    def worker_id(self, agent_type: str, index: int) -> str:
+        return f"{agent_type}_{self.host_id}_{index}"
+
+    async def start(self):
+        total = sum(self.replicas.values())
+        print(f"🧭 Supervising {total} agent workers: {self.replicas}")
+        for agent_type, count in self.replicas.items():
+            for index in range(count):
+                self._watchers.append(asyncio.create_task(self._supervise(agent_type, index)))
+
+    async def _supervise(self, agent_type: str, index: int):
+        """Keeps one worker process alive until the supervisor shuts down."""
+        worker_id = self.worker_id(agent_type, index)
+        backoff = self.base_backoff
+        while self.running:
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, os.path.abspath(__file__), agent_type, worker_id,
+                # Own session, so terminal signals reach only the supervisor,
+                # which then stops the workers in an orderly way.
+                start_new_session=True,
+            )
+            self.processes[worker_id] = process
+            print(f"✅ Worker {worker_id} started (pid {process.pid})")
+            returncode = await process.wait()
+            self.processes.pop(worker_id, None)
+            if not self.running:
+                break
+
+            if time.monotonic() - started >= self.stable_after:
+                backoff = self.base_backoff
+            print(f"⚠️ Worker {worker_id} exited with code {returncode}; restarting in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def shutdown(self):
+        """Stops all workers: SIGTERM first, SIGKILL for stragglers."""
+        if not self.running:
+            return
+        print("\n🛑 Stopping agent workers...")
+        self.running = False
+        processes = list(self.processes.values())
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        if processes:
+            await asyncio.wait(
+                [asyncio.create_task(process.wait()) for process in processes],
+                timeout=float(os.getenv("SUPERVISOR_SHUTDOWN_TIMEOUT", "15.0")),
+            )
+            for process in processes:
+                if process.returncode is None:
+                    process.kill()
+        for watcher in self._watchers:
+            watcher.cancel()
+        print("👋 All agent workers stopped.")
+
+    async def run_forever(self):
+        while self.running:
+            await asyncio.sleep(1)
+
+def parse_replicas(args: List[str]) -> Dict[str, int]:
+    """
+    Builds the per-type replica counts. CLI arguments like `intake=4 scope=2`
+    win over AGENT_REPLICAS_<TYPE> env vars, which win over AGENT_REPLICAS.
+    Types with zero replicas are not started.
+    """
+    default = int(os.getenv("AGENT_REPLICAS", "1"))
+    replicas = {
+        agent_type: int(os.getenv(f"AGENT_REPLICAS_{agent_type.upper()}", default))
+        for agent_type in AGENT_MAP
+    }
+    for arg in args:
+        agent_type, _, count = arg.partition("=")
+        if agent_type not in AGENT_MAP or not count.isdigit():
+            raise ValueError(f"Invalid replica spec '{arg}', expected <type>=<count>")
+        replicas[agent_type] = int(count)
+    return {agent_type: count for agent_type, count in replicas.items() if count > 0}
+
 def setup_signal_handlers(runner):
     """Setup graceful shutdown on SIGINT/SIGTERM."""
     def signal_handler(signum, frame):
@@ -126,6 +234,17 @@ def setup_signal_handlers(runner):
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+async def rebuild_status(project_ids: List[str]):
+    """Replays the event store into the status records of the given projects."""
+    agent = ProjectStatusAgent()
+    try:
+        for project_id in project_ids:
+            status = await agent.rebuild(project_id)
+            print(f"✅ {project_id}: {status['status']}" if status else f"⚠️ {project_id}: no stored events")
+    finally:
+        await agent.event_store.close()
+        await agent.event_consumer.close()
+
 async def main():
     """Main entry point."""
     if not check_environment():
@@ -139,13 +258,37 @@ async def main():
         print("  python run_agents.py filter            # Start filter agent only")
         print("  python run_agents.py payment           # Start payment agent only")
         print("  python run_agents.py ui                # Start UI agent only")
+        print("  python run_agents.py status            # Start project status agent only")
+        print("  python run_agents.py rebuild-status <project_id> ...")
+        print("                                         # Rebuild project status records from the event store")
+        print("  python run_agents.py supervise [intake=4 scope=2 ...]")
+        print("                                         # One process per worker, N workers per type")
+        return
+
+    command = sys.argv[1]
+
+    if command == "supervise":
+        if get_transport_name() == "memory":
+            print("❌ EVENT_TRANSPORT=memory only works within one process; use 'all' or EVENT_TRANSPORT=redis.")
+            return
+        try:
+            replicas = parse_replicas(sys.argv[2:])
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        supervisor = AgentSupervisor(replicas)
+        setup_signal_handlers(supervisor)
+        await supervisor.start()
+        await supervisor.run_forever()
+        return
+
+    if command == "rebuild-status":
+        await rebuild_status(sys.argv[2:])
         return
 
     runner = AgentRunner()
     setup_signal_handlers(runner)
-    
-    command = sys.argv[1]
-    
+
     if command == "all":
         await runner.start_all_agents()
         await runner.run_forever()
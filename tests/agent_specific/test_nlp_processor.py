@@ -0,0 +1,28 @@
+# tests/agent_specific/test_nlp_processor.py
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from agents.homeowner_intake.nlp_processor import NLPProcessor
+
+def llm_answer(content):
+    return AsyncMock(return_value=MagicMock(content=content))
+
+@pytest.mark.asyncio
+async def test_same_submission_is_extracted_once():
+    processor = NLPProcessor()
+    processor.llm = MagicMock(ainvoke=llm_answer('{"project_type": "roofing"}'))
+    first = await processor.extract_project_info("Replace  my roof.\n\n", ["https://img/1.jpg"])
+    second = await processor.extract_project_info("Replace my roof.", ["https://img/1.jpg"])
+    assert first == second == {"project_type": "roofing"}
+    processor.llm.ainvoke.assert_called_once()
+    await processor.extract_project_info("Replace my roof.", ["https://img/2.jpg"])
+    assert processor.llm.ainvoke.call_count == 2
+    assert processor.cache.cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_error_fallback_is_not_cached():
+    processor = NLPProcessor()
+    processor.llm = MagicMock(ainvoke=llm_answer("no json here"))
+    fallback = await processor.extract_project_info("Replace my roof.")
+    assert fallback == {"unclear_points": ["Could not fully analyze the project details."]}
+    processor.llm.ainvoke = llm_answer('{"project_type": "roofing"}')
+    assert await processor.extract_project_info("Replace my roof.") == {"project_type": "roofing"}
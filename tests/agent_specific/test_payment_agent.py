@@ -0,0 +1,36 @@
+# tests/agent_specific/test_payment_agent.py
+import pytest
+from unittest.mock import AsyncMock, patch
+from agents.payment_gate.payment_agent import PaymentGateAgent
+
+@pytest.fixture
+def payment_agent():
+    with patch('core.events.publisher.EventPublisher') as MockPublisher, \
+         patch('core.memory.event_store.EventStore') as MockEventStore:
+        agent = PaymentGateAgent()
+        agent.event_publisher = MockPublisher()
+        agent.event_store = MockEventStore()
+        agent.event_publisher.publish = AsyncMock()
+        agent.event_store.append_event = AsyncMock()
+        yield agent
+
+def test_payment_agent_reads_both_upstream_streams(payment_agent):
+    assert payment_agent.event_consumer.streams == ['payment:events', 'homeowner:scope_complete']
+
+@pytest.mark.asyncio
+async def test_scope_complete_routes_to_payment_request(payment_agent):
+    event_data = {'event_type': 'homeowner:scope_complete', 'correlation_id': 'c1', 'data': '{"project_id": "proj_1"}'}
+    await payment_agent.dispatch_event('homeowner:scope_complete', event_data)
+    assert payment_agent.event_publisher.publish.call_args.kwargs['stream'] == 'ui:updates'
+
+@pytest.mark.asyncio
+async def test_payment_webhook_routes_to_contact_release(payment_agent):
+    event_data = {'event_type': 'stripe:webhook:payment_succeeded', 'data': '{"id": "pi_1", "metadata": {"project_id": "proj_1"}}'}
+    await payment_agent.dispatch_event('payment:events', event_data)
+    payment_agent.event_store.append_event.assert_called_once()
+    assert payment_agent.event_publisher.publish.call_args.kwargs['stream'] == 'payment:contact_released'
+
+@pytest.mark.asyncio
+async def test_unrouted_events_are_ignored(payment_agent):
+    await payment_agent.dispatch_event('payment:events', {'event_type': 'something:else', 'data': '{}'})
+    payment_agent.event_publisher.publish.assert_not_called()
@@ -0,0 +1,25 @@
+# tests/agent_specific/test_scope_agent.py
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from agents.project_scope.scope_agent import ProjectScopeAgent
+
+@pytest.fixture
+def scope_agent():
+    agent = ProjectScopeAgent()
+    agent.chain = MagicMock(arun=AsyncMock(return_value='{"project_title": "New roof"}'))
+    return agent
+
+@pytest.mark.asyncio
+async def test_scope_is_generated_once_per_extracted_data(scope_agent):
+    extracted = {"project_type": "roofing", "requirements": ["shingles"]}
+    assert await scope_agent.generate_scope(extracted) == {"project_title": "New roof"}
+    assert await scope_agent.generate_scope(dict(extracted)) == {"project_title": "New roof"}
+    scope_agent.chain.arun.assert_called_once()
+    assert scope_agent.metrics_snapshot()["caches"]["project_scopes"]["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_unparseable_scope_is_not_cached(scope_agent):
+    scope_agent.chain.arun = AsyncMock(side_effect=["not json", '{"project_title": "New roof"}'])
+    with pytest.raises(ValueError):
+        await scope_agent.generate_scope({"project_type": "roofing"})
+    assert await scope_agent.generate_scope({"project_type": "roofing"}) == {"project_title": "New roof"}
@@ -0,0 +1,103 @@
+# tests/agent_specific/test_status_agent.py
+import pytest
+from unittest.mock import AsyncMock
+from agents.project_status.status_agent import ProjectStatusAgent
+from core.events.memory_transport import memory_connections
+
+@pytest.fixture
+def status_agent(monkeypatch):
+    monkeypatch.setenv("EVENT_TRANSPORT", "memory")
+    memory_connections.broker.reset()
+    agent = ProjectStatusAgent()
+    yield agent
+    memory_connections.broker.reset()
+
+def serve_stored_events(agent, events):
+    async def select_rows(table, params):
+        if table == 'aggregate_snapshots':
+            return []
+        after_id = int(params['id'].split('.', 1)[1])
+        return [row for row in events if row['id'] > after_id][:params['limit']]
+    agent.event_store.db_client.select_rows = select_rows
+    agent.event_store.db_client.upsert = AsyncMock()
+
+def event(event_type, data, timestamp):
+    return {'event_type': event_type, 'timestamp': timestamp, 'data': data}
+
+@pytest.mark.asyncio
+async def test_pipeline_events_advance_the_status(status_agent):
+    store = status_agent.status_store
+    await status_agent.dispatch_event('homeowner:project_submitted', event(
+        'homeowner:project_submitted', '{"project_id": "p1"}', '2025-01-01T00:00:00'))
+    assert (await store.get('p1'))['status'] == 'submitted'
+
+    await status_agent.dispatch_event('homeowner:scope_complete', event(
+        'homeowner:scope_complete',
+        '{"project_id": "p1", "structured_scope": {"project_title": "Deck", "complexity_level": "low",'
+        ' "estimated_duration_weeks": {"min": 1, "max": 2}, "required_skills": ["carpentry"]}}',
+        '2025-01-01T00:02:00'))
+    # Delivered late: must not move the status back.
+    await status_agent.dispatch_event('homeowner:intake_complete', event(
+        'homeowner:intake_complete', '{"project_id": "p1"}', '2025-01-01T00:01:00'))
+    await status_agent.dispatch_event('ui:updates', event(
+        'ui:payment_required', '{"project_id": "p1", "amount_cents": 2500}', '2025-01-01T00:03:00'))
+
+    status = await store.get('p1')
+    assert status['status'] == 'payment_required'
+    assert status['updatedAt'] == '2025-01-01T00:03:00'
+    assert list(status['stages']) == ['submitted', 'intake_complete', 'scope_complete', 'payment_required']
+    assert status['scope'] == {
+        'title': 'Deck', 'complexity': 'low', 'estimatedDurationWeeks': {'min': 1, 'max': 2}, 'requiredSkills': ['carpentry'],
+    }
+    assert status['payment'] == {'state': 'required', 'amountCents': 2500, 'transactionId': None}
+
+    await status_agent.dispatch_event('payment:contact_released', event(
+        'payment:contact_released', '{"project_id": "p1", "transaction_id": "pi_1"}', '2025-01-01T00:04:00'))
+    status = await store.get('p1')
+    assert status['status'] == 'contact_released'
+    assert status['payment'] == {'state': 'succeeded', 'amountCents': 2500, 'transactionId': 'pi_1'}
+
+@pytest.mark.asyncio
+async def test_failures_are_terminal_and_unknown_projects_are_missing(status_agent):
+    await status_agent.dispatch_event('system:agent_errors', event(
+        'scope:generation_failed', '{"project_id": "p2", "error": "bad json"}', '2025-01-01T00:00:00'))
+    await status_agent.dispatch_event('homeowner:intake_complete', event(
+        'homeowner:intake_complete', '{"project_id": "p2"}', '2025-01-01T00:05:00'))
+    status = await status_agent.status_store.get('p2')
+    assert status['status'] == 'failed'
+    assert status['error'] == 'bad json'
+    assert await status_agent.status_store.get('missing') is None
+
+@pytest.mark.asyncio
+async def test_rebuild_replays_the_event_store(status_agent):
+    await status_agent.status_store.record('p3', 'failed', '2024-12-31T00:00:00', {"error": "stale"})
+    serve_stored_events(status_agent, [
+        {'id': 1, 'event_type': 'homeowner:project_submitted', 'event_data': '{"project_id": "p3"}', 'timestamp': '2025-01-01T00:00:00'},
+        {'id': 2, 'event_type': 'project:scope_generated', 'event_data': {'project_title': 'Roof'}, 'timestamp': '2025-01-01T00:01:00'},
+        {'id': 5, 'event_type': 'payment:succeeded', 'event_data': {'id': 'pi_3'}, 'timestamp': '2025-01-01T00:02:00'},
+    ])
+    status = await status_agent.rebuild('p3')
+    assert status['status'] == 'payment_succeeded'
+    assert 'error' not in status
+    assert status['scope']['title'] == 'Roof'
+    assert status['payment']['transactionId'] == 'pi_3'
+
+    serve_stored_events(status_agent, [])
+    assert await status_agent.rebuild('p3') is None
+    assert await status_agent.status_store.get('p3') is None
+
+@pytest.mark.asyncio
+async def test_scope_fields_given_as_text_are_returned_as_text(status_agent):
+    await status_agent.dispatch_event('homeowner:scope_complete', event(
+        'homeowner:scope_complete',
+        '{"project_id": "p4", "structured_scope": {"project_title": "Fence", "estimated_duration_weeks": "2-3",'
+        ' "required_skills": "fencing"}}',
+        '2025-01-01T00:00:00'))
+    scope = (await status_agent.status_store.get('p4'))['scope']
+    assert scope['estimatedDurationWeeks'] == '2-3'
+    assert scope['requiredSkills'] == 'fencing'
+
+    # Records written before these fields were always JSON.
+    await status_agent.status_store.get_client().hset(
+        status_agent.status_store.key('p4'), mapping={'scope_duration_weeks': '2-3'})
+    assert (await status_agent.status_store.get('p4'))['scope']['estimatedDurationWeeks'] == '2-3'
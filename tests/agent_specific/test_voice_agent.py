@@ -0,0 +1,18 @@
+# tests/agent_specific/test_voice_agent.py
+import logging
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from agents.homeowner_intake.voice_agent import VoiceIntakeAgent
+
+@pytest.mark.asyncio
+async def test_contact_details_in_the_last_utterance_are_reported_at_the_end(caplog):
+    agent = VoiceIntakeAgent("proj_123", client_socket=MagicMock())
+    agent.stt = MagicMock(transcribe=AsyncMock(return_value="sure, email me at jane.doe@example.com"))
+    agent.llm = MagicMock(ainvoke=AsyncMock(return_value=MagicMock(content="Thanks!")))
+    agent.tts = MagicMock(stream_audio=AsyncMock(return_value=None))
+    with caplog.at_level(logging.WARNING):
+        await agent.process_user_audio(b"audio")
+        # The email can still grow, so it is only settled once the session ends.
+        assert "Contact violation" not in caplog.text
+        await agent.end_conversation()
+    assert "Contact violation (emails, intent) detected in voice intake for project proj_123." in caplog.text
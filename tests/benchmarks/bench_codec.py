@@ -0,0 +1,40 @@
+# tests/benchmarks/bench_codec.py
+"""
+Encode/decode cost per event for every available event codec, using the
+real pipeline payloads.
+
+    python -m tests.benchmarks.bench_codec [--number 20000]
+"""
+import argparse
+import timeit
+from core.events.codec import CODECS, get_codec
+from tests.benchmarks.payloads import PIPELINE_PAYLOADS
+
+def available_codecs():
+    codecs = {}
+    for name in CODECS:
+        try:
+            codecs[name] = get_codec(name)
+        except ValueError:
+            print(f"skipping codec '{name}' (dependency not installed)")
+    return codecs
+
+def bench(number: int) -> None:
+    codecs = available_codecs()
+    print(f"{'payload':40} {'codec':8} {'bytes':>6} {'encode µs':>10} {'decode µs':>10}")
+    for event_type, payload in PIPELINE_PAYLOADS.items():
+        for name, codec in codecs.items():
+            encoded = codec.encode(payload)
+            assert codec.decode(encoded) == payload
+            size = len(encoded.encode('utf-8') if isinstance(encoded, str) else encoded)
+            encode_time = min(timeit.repeat(lambda: codec.encode(payload), number=number, repeat=5))
+            decode_time = min(timeit.repeat(lambda: codec.decode(encoded), number=number, repeat=5))
+            print(
+                f"{event_type:40} {name:8} {size:6d} "
+                f"{encode_time / number * 1e6:10.2f} {decode_time / number * 1e6:10.2f}"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="iterations per timing run")
+    bench(parser.parse_args().number)
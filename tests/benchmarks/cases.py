@@ -0,0 +1,140 @@
+# tests/benchmarks/cases.py
+"""
+Benchmark cases for the code that runs on every event. Each case is a
+setup function returning `(fn, ops)`: `fn()` is what gets timed and `ops`
+is how many operations one call performs, so results are per operation.
+
+Agent cases construct a BaseAgent, so run them with EVENT_TRANSPORT=memory
+(run.py sets it) to keep them off the network.
+"""
+import asyncio
+from typing import Callable, Dict, Tuple
+from core.base.base_agent import BaseAgent
+from core.events.codec import CODECS, get_codec, load_event_data
+from core.events.publisher import EventPublisher
+from core.events.schemas import IntakePayload
+from core.security.contact_filter import ContactProtectionFilter
+from core.security.verdict_cache import VerdictCache
+from tests.benchmarks.corpus import clean_corpus, dirty_corpus
+from tests.benchmarks.payloads import INTAKE_COMPLETE, PIPELINE_PAYLOADS, PROJECT_SUBMITTED
+
+Case = Callable[[], Tuple[Callable[[], object], int]]
+CASES: Dict[str, Case] = {}
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+    return register
+
+def _filter_case(method: str, corpus):
+    def setup():
+        content_filter = ContactProtectionFilter()
+        run = getattr(content_filter, method)
+        messages = corpus()
+        return (lambda: [run(message) for message in messages]), len(messages)
+    return setup
+
+case("filter.scan_content[clean]")(_filter_case("scan_content", clean_corpus))
+case("filter.scan_content[dirty]")(_filter_case("scan_content", dirty_corpus))
+case("filter.scrub_content[clean]")(_filter_case("scrub_content", clean_corpus))
+case("filter.scrub_content[dirty]")(_filter_case("scrub_content", dirty_corpus))
+
+@case("filter.scan_many[clean]")
+def _scan_many_clean():
+    content_filter = ContactProtectionFilter()
+    messages = clean_corpus()
+    return (lambda: content_filter.scan_many(messages)), len(messages)
+
+@case("filter.verdict_cache[repeated]")
+def _verdict_cache_repeated():
+    # Templated traffic: 50 distinct messages, each seen 10 times.
+    cache = VerdictCache(ContactProtectionFilter(), max_entries=1000)
+    messages = dirty_corpus(50) * 10
+    loop = asyncio.new_event_loop()
+
+    async def scan_all():
+        for message in messages:
+            await cache.scan_content(message)
+    return (lambda: loop.run_until_complete(scan_all())), len(messages)
+
+@case("filter.scan_and_scrub[dirty]")
+def _scan_and_scrub():
+    # What HomeownerIntakeAgent does: one scan, reused for the scrub.
+    content_filter = ContactProtectionFilter()
+    messages = dirty_corpus()
+
+    def run():
+        for message in messages:
+            matches = content_filter.find_matches(message)
+            content_filter.violations(matches)
+            content_filter.scrub_content(message, matches)
+    return run, len(messages)
+
+class _BenchAgent(BaseAgent):
+    async def process_event(self, event_data):
+        load_event_data(event_data)
+
+    async def skip_event(self, event_data):
+        pass
+
+def _raw_message(event_type: str, payload: dict) -> dict:
+    encoded = get_codec("json").encode(payload)
+    return {
+        b'event_id': b'2d1b8f0e-8d4c-4b8e-a0a6-5f3f1f6a9c11',
+        b'event_type': event_type.encode(),
+        b'timestamp': b'2024-05-01T12:00:00.000000',
+        b'correlation_id': b'2d1b8f0e-8d4c-4b8e-a0a6-5f3f1f6a9c11',
+        b'codec': b'json',
+        b'data': encoded.encode() if isinstance(encoded, str) else encoded,
+    }
+
+def _handle_message_case(route_only: bool):
+    def setup():
+        agent = _BenchAgent(agent_type='bench', stream_name='bench:stream', group_name='bench_group')
+
+        async def acknowledge(stream, message_id):
+            pass
+        agent.event_consumer.acknowledge = acknowledge
+        if route_only:
+            agent.route_event('homeowner:intake_complete', agent.skip_event)
+        message = _raw_message('homeowner:intake_complete', INTAKE_COMPLETE)
+        batch = 200
+        loop = asyncio.new_event_loop()
+
+        async def handle_batch():
+            for _ in range(batch):
+                await agent._handle_message(b'bench:stream', b'1-0', message)
+        return (lambda: loop.run_until_complete(handle_batch())), batch
+    return setup
+
+case("agent.handle_message[decode]")(_handle_message_case(route_only=False))
+case("agent.handle_message[route_only]")(_handle_message_case(route_only=True))
+
+@case("publisher.build_payload")
+def _build_payload():
+    publisher = EventPublisher(transport='redis', redis_url='redis://localhost:6379', codec=get_codec("json"))
+    events = list(PIPELINE_PAYLOADS.items())
+    return (lambda: [publisher._build_payload(event_type, data) for event_type, data in events]), len(events)
+
+@case("schemas.intake_payload")
+def _intake_payload():
+    return (lambda: IntakePayload(**PROJECT_SUBMITTED)), 1
+
+def _codec_case(name: str, decode: bool):
+    def setup():
+        codec = get_codec(name)
+        payloads = list(PIPELINE_PAYLOADS.values())
+        if decode:
+            encoded = [codec.encode(payload) for payload in payloads]
+            return (lambda: [codec.decode(raw) for raw in encoded]), len(encoded)
+        return (lambda: [codec.encode(payload) for payload in payloads]), len(payloads)
+    return setup
+
+for _name in CODECS:
+    try:
+        get_codec(_name)
+    except ValueError:  # Optional dependency not installed
+        continue
+    case(f"codec.encode[{_name}]")(_codec_case(_name, decode=False))
+    case(f"codec.decode[{_name}]")(_codec_case(_name, decode=True))
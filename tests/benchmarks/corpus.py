@@ -0,0 +1,84 @@
+# tests/benchmarks/corpus.py
+"""
+Seeded, reproducible message corpora for the contact filter.
+
+Clean messages look like real homeowner/contractor chat: they contain
+prices, sizes, dates and counts, but no contact details. Dirty messages
+are clean messages with contact information spliced in using the formats
+people use to get around filters (phone number variants, plain and
+obfuscated emails, "text me", messaging apps).
+"""
+import random
+from typing import List
+
+DEFAULT_SEED = 1729
+
+SENTENCES = [
+    "The kitchen is about 12x14 and the cabinets are original from 1987.",
+    "We'd like quartz countertops and an undermount sink.",
+    "Budget is around $25,000 but we can stretch to $30k for the right design.",
+    "Can you start the week of June 12 or is that too soon?",
+    "The bathroom has a 60 inch tub we want to replace with a walk-in shower.",
+    "There are 3 bedrooms upstairs that need new carpet, roughly 450 sq ft total.",
+    "Is the permit fee included in your estimate?",
+    "We have two dogs, so please keep the back gate closed.",
+    "The roof was replaced in 2015 but the gutters are leaking on the north side.",
+    "How many weeks do you expect the demolition to take?",
+    "I uploaded 4 photos of the water damage under the sink.",
+    "Please quote both the LVP option and engineered hardwood.",
+    "The HOA needs plans submitted 30 days before work begins.",
+    "Our electrical panel is 100 amp, will we need an upgrade for the induction range?",
+    "We'd prefer a crew that can work 8am to 4pm on weekdays.",
+    "The deck is 16 by 20 feet and the boards are starting to rot.",
+    "Could you send a revised estimate with the trim paint included?",
+    "My husband works from home so noise before 9 is a concern.",
+    "We're flexible on tile, something neutral, maybe 12x24 porcelain.",
+    "What warranty do you offer on labor?",
+    "The basement gets damp after heavy rain, around 2 inches of water last spring.",
+    "Thanks, the walkthrough on Tuesday at 10:30 works for us.",
+]
+
+CONTACT_SNIPPETS = [
+    "call me at {phone}",
+    "my number is {phone}",
+    "text me on {phone} after 5",
+    "you can reach me at ({area}) {exchange}-{line}",
+    "my cell is +1 {area} {exchange} {line}",
+    "it's {area}{exchange}{line}",
+    "email me at {user}@{domain}.com",
+    "my email is {user} at {domain} dot com",
+    "send it to {user} [at] {domain} [dot] net",
+    "ping me on whatsapp",
+    "message me on Telegram, same name",
+    "contact me directly so we can skip the fees",
+]
+
+USERS = ["jane.doe", "mike_r", "homeowner42", "sarah.k", "buildpro", "tom.b"]
+DOMAINS = ["gmail", "yahoo", "outlook", "example", "icloud"]
+
+def _contact_snippet(rng: random.Random) -> str:
+    area, exchange, line = rng.randint(201, 989), rng.randint(200, 999), rng.randint(0, 9999)
+    return rng.choice(CONTACT_SNIPPETS).format(
+        phone=f"{area}-{exchange}-{line:04d}",
+        area=area, exchange=exchange, line=f"{line:04d}",
+        user=rng.choice(USERS), domain=rng.choice(DOMAINS),
+    )
+
+def clean_message(rng: random.Random) -> str:
+    return " ".join(rng.sample(SENTENCES, rng.randint(1, 4)))
+
+def dirty_message(rng: random.Random) -> str:
+    sentences = rng.sample(SENTENCES, rng.randint(1, 3))
+    sentences.insert(rng.randint(0, len(sentences)), _contact_snippet(rng).capitalize() + ".")
+    return " ".join(sentences)
+
+def generate_messages(count: int, dirty_ratio: float = 0.0, seed: int = DEFAULT_SEED) -> List[str]:
+    """`count` messages of which roughly `dirty_ratio` contain contact details."""
+    rng = random.Random(seed)
+    return [dirty_message(rng) if rng.random() < dirty_ratio else clean_message(rng) for _ in range(count)]
+
+def clean_corpus(count: int = 500, seed: int = DEFAULT_SEED) -> List[str]:
+    return generate_messages(count, dirty_ratio=0.0, seed=seed)
+
+def dirty_corpus(count: int = 500, seed: int = DEFAULT_SEED) -> List[str]:
+    return generate_messages(count, dirty_ratio=1.0, seed=seed)
@@ -0,0 +1,76 @@
+# tests/benchmarks/payloads.py
+"""Representative `data` payloads for each hop of the submission pipeline."""
+
+PROJECT_SUBMITTED = {
+    "project_id": "3f0c9a52-6a7e-4f7e-9f3b-2c1d5e8a9b10",
+    "contact_info": {
+        "email": "jane.doe@example.com",
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "zip_code": "78704",
+        "city": "Austin",
+        "state": "TX",
+        "phone": None,
+    },
+    "project_details": {
+        "raw_description": (
+            "We want to remodel our 1980s kitchen. The cabinets are falling apart, the laminate "
+            "countertops are chipped and we'd like quartz instead. Looking to move the sink under "
+            "the window, add an island with seating for three, and replace the vinyl floor with "
+            "luxury vinyl plank that continues into the dining room. Budget is flexible but we'd "
+            "like to be done before the holidays. Photos of the current layout attached."
+        ),
+    },
+}
+
+INTAKE_COMPLETE = {
+    "project_id": PROJECT_SUBMITTED["project_id"],
+    "extracted_data": {
+        "initial_observation": "A dated galley kitchen with oak cabinets and laminate counters.",
+        "project_type": "kitchen_remodel",
+        "requirements": [
+            "replace cabinets", "quartz countertops", "relocate sink under window",
+            "add island with seating for three", "LVP flooring into dining room",
+        ],
+        "unclear_points": [
+            "Is the plumbing wall load-bearing?", "Preferred cabinet style and finish?",
+            "Any appliance upgrades included?",
+        ],
+    },
+}
+
+SCOPE_COMPLETE = {
+    "project_id": PROJECT_SUBMITTED["project_id"],
+    "structured_scope": {
+        "project_title": "Full Kitchen Remodel with Island",
+        "work_breakdown": [
+            "Demolition of existing cabinets and counters", "Plumbing relocation for sink",
+            "Electrical for island outlets and pendants", "Cabinet installation",
+            "Quartz countertop template and install", "LVP flooring installation", "Final trim and paint",
+        ],
+        "materials_list": ["shaker cabinets", "quartz slab", "undermount sink", "LVP flooring", "pendant lights"],
+        "required_skills": ["general contractor", "plumber", "electrician", "countertop fabricator"],
+        "estimated_duration_weeks": {"min": 6, "max": 10},
+        "complexity_level": "high",
+    },
+}
+
+PAYMENT_REQUIRED = {
+    "project_id": PROJECT_SUBMITTED["project_id"],
+    "amount_cents": 2500,
+    "message": "Your project has been scoped. Please complete payment to connect with contractors.",
+}
+
+CONTACT_VIOLATION = {
+    "user_id": "jane.doe@example.com",
+    "project_id": PROJECT_SUBMITTED["project_id"],
+    "violations": {"phones": ["512-555-0147"], "emails": [], "intent": ["call"]},
+}
+
+PIPELINE_PAYLOADS = {
+    "homeowner:project_submitted": PROJECT_SUBMITTED,
+    "homeowner:intake_complete": INTAKE_COMPLETE,
+    "homeowner:scope_complete": SCOPE_COMPLETE,
+    "ui:payment_required": PAYMENT_REQUIRED,
+    "security:contact_violation_detected": CONTACT_VIOLATION,
+}
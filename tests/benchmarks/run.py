@@ -0,0 +1,114 @@
+# tests/benchmarks/run.py
+"""
+Runs the hot-path micro-benchmarks and optionally compares them with a
+saved baseline.
+
+    python -m tests.benchmarks.run                       # run everything
+    python -m tests.benchmarks.run -k filter             # cases matching "filter"
+    python -m tests.benchmarks.run --save                # write the baseline
+    python -m tests.benchmarks.run --compare             # exit 1 on regressions
+
+Each case is calibrated to run for at least `--min-time` seconds per
+repeat, and the fastest of `--repeat` runs is reported, which is the most
+stable statistic on a shared machine. Corpora are seeded, so every run
+times the same inputs. Baselines are only comparable on the same machine.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Any, Dict, List, Optional
+
+DEFAULT_BASELINE = ".benchmarks/baseline.json"
+
+def time_case(fn, ops: int, repeat: int, min_time: float) -> float:
+    """Returns the best observed time per operation, in microseconds."""
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = int(number * min_time / elapsed) + 1
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = min(timer.repeat(repeat=repeat, number=number))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best / number / ops * 1e6
+
+def run_cases(pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    from tests.benchmarks.cases import CASES
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        fn, ops = setup()
+        fn()  # Warm up caches before timing.
+        results[name] = time_case(fn, ops, repeat, min_time)
+        print(f"{name:40} {results[name]:12.3f} µs/op", flush=True)
+    return results
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Returns one row per case present in both runs. A case regresses when
+    it is more than `threshold` (a fraction, 0.1 = 10%) slower than baseline.
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = (current - previous) / previous if previous else 0.0
+        rows.append({
+            "name": name, "baseline": previous, "current": current,
+            "change": change, "regressed": change > threshold,
+        })
+    return rows
+
+def load_baseline(path: str) -> Dict[str, float]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def save_baseline(path: str, results: Dict[str, float]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timing run")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="save results as baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="compare with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a case counts as a regression")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("EVENT_TRANSPORT", "memory")
+    os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+
+    results = run_cases(args.pattern, args.repeat, args.min_time)
+    exit_code = 0
+    if args.compare:
+        rows = compare(results, load_baseline(args.compare), args.threshold)
+        print(f"\n{'case':40} {'baseline':>10} {'current':>10} {'change':>8}")
+        for row in rows:
+            flag = "  REGRESSION" if row["regressed"] else ""
+            print(f"{row['name']:40} {row['baseline']:10.3f} {row['current']:10.3f} {row['change']:+8.1%}{flag}")
+        regressions = [row for row in rows if row["regressed"]]
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}.")
+            exit_code = 1
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\nBaseline saved to {args.save}")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
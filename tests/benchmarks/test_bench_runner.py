@@ -0,0 +1,22 @@
+# tests/benchmarks/test_bench_runner.py
+from tests.benchmarks.corpus import clean_corpus, dirty_corpus
+from tests.benchmarks.run import compare
+
+def test_corpora_are_reproducible_and_labelled_correctly():
+    from core.security.contact_filter import ContactProtectionFilter
+    content_filter = ContactProtectionFilter()
+    assert clean_corpus(50) == clean_corpus(50)
+    assert all(not any(content_filter.scan_content(m).values()) for m in clean_corpus(200))
+    assert all(any(content_filter.scan_content(m).values()) for m in dirty_corpus(200))
+
+def test_compare_flags_only_slowdowns_over_threshold():
+    rows = compare({"a": 1.25, "b": 1.05, "c": 0.5, "new": 1.0}, {"a": 1.0, "b": 1.0, "c": 1.0}, threshold=0.1)
+    assert {row["name"]: row["regressed"] for row in rows} == {"a": True, "b": False, "c": False}
+
+def test_every_case_runs(monkeypatch):
+    monkeypatch.setenv("EVENT_TRANSPORT", "memory")
+    from tests.benchmarks.cases import CASES
+    for name, setup in CASES.items():
+        fn, ops = setup()
+        fn()
+        assert ops > 0, name
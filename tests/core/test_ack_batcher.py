@@ -0,0 +1,49 @@
+# tests/core/test_ack_batcher.py
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from core.events.ack_batcher import AckBatcher
+
+def make_client():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+@pytest.mark.asyncio
+async def test_flushes_one_xack_per_stream_on_size():
+    client, pipe = make_client()
+    batcher = AckBatcher(client, "group", max_batch_size=3, flush_interval=10)
+    await batcher.add("stream_a", "1-0")
+    await batcher.add("stream_b", "2-0")
+    pipe.execute.assert_not_called()
+    await batcher.add("stream_a", "3-0")
+
+    pipe.execute.assert_awaited_once()
+    pipe.xack.assert_any_call("stream_a", "group", "1-0", "3-0")
+    pipe.xack.assert_any_call("stream_b", "group", "2-0")
+    assert batcher.pending_count == 0
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_flushes_on_interval_and_close():
+    client, pipe = make_client()
+    batcher = AckBatcher(client, "group", max_batch_size=100, flush_interval=0.01)
+    await batcher.add("stream_a", "1-0")
+    await asyncio.sleep(0.05)
+    pipe.xack.assert_called_once_with("stream_a", "group", "1-0")
+
+    await batcher.add("stream_a", "2-0")
+    await batcher.close()
+    pipe.xack.assert_called_with("stream_a", "group", "2-0")
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_ids_for_retry():
+    client, pipe = make_client()
+    pipe.execute.side_effect = [ConnectionError("down"), None]
+    batcher = AckBatcher(client, "group", max_batch_size=1, flush_interval=10)
+    await batcher.add("stream_a", "1-0")
+    assert batcher.pending_count == 1
+    await batcher.close()
+    assert batcher.pending_count == 0
@@ -0,0 +1,54 @@
+# tests/core/test_codec.py
+import json
+import pytest
+from unittest.mock import AsyncMock
+from core.base.base_agent import BaseAgent
+from core.events.codec import EventDecodeError, get_codec, load_event_data
+
+PAYLOAD = {"project_id": "proj_1", "extracted_data": {"requirements": ["a", "b"], "budget": None}}
+
+class CapturingAgent(BaseAgent):
+    def __init__(self):
+        super().__init__(agent_type='capture', stream_name='test:stream', group_name='test_group')
+        self.received = []
+
+    async def process_event(self, event_data):
+        self.received.append(load_event_data(event_data))
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_codecs_round_trip(name):
+    try:
+        codec = get_codec(name)
+    except ValueError:
+        pytest.skip(f"{name} not installed")
+    event = {'codec': codec.name, 'data': codec.encode(PAYLOAD)}
+    assert load_event_data(event) == PAYLOAD
+
+def test_envelopes_without_codec_are_json():
+    assert load_event_data({'data': json.dumps(PAYLOAD)}) == PAYLOAD
+    assert load_event_data({}) == {}
+
+def test_undecodable_data_raises_decode_error():
+    with pytest.raises(EventDecodeError):
+        load_event_data({'codec': 'json', 'data': '{not json'})
+    with pytest.raises(EventDecodeError):
+        load_event_data({'codec': 'unknown', 'data': '{}'})
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["json", "msgpack"])
+async def test_handle_message_decodes_any_codec(name):
+    try:
+        codec = get_codec(name)
+    except ValueError:
+        pytest.skip(f"{name} not installed")
+    agent = CapturingAgent()
+    agent.event_consumer.acknowledge = AsyncMock()
+    encoded = codec.encode(PAYLOAD)
+    fields = {
+        b'event_type': b'homeowner:intake_complete',
+        b'codec': codec.name.encode(),
+        b'data': encoded.encode() if isinstance(encoded, str) else encoded,
+    }
+    assert await agent._handle_message(b'test:stream', b'1-0', fields)
+    assert agent.received == [PAYLOAD]
+    agent.event_consumer.acknowledge.assert_awaited_once_with('test:stream', '1-0')
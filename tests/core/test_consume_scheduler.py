@@ -0,0 +1,36 @@
+# tests/core/test_consume_scheduler.py
+from core.events.consume_scheduler import ConsumeScheduler
+
+def test_idle_reads_block_longer_without_sleeping():
+    scheduler = ConsumeScheduler(max_count=100, busy_block_ms=50, idle_block_ms=1000)
+    assert scheduler.next_params(free_slots=10, in_flight=0).block == 50
+    blocks = []
+    for _ in range(6):
+        scheduler.record_read(requested=10, received=0)
+        blocks.append(scheduler.next_params(free_slots=10, in_flight=0).block)
+    assert blocks == sorted(blocks)
+    assert blocks[-1] == 1000
+
+def test_backlog_reads_full_batches_without_blocking():
+    scheduler = ConsumeScheduler(max_count=100, busy_block_ms=50, idle_block_ms=1000)
+    scheduler.record_lag(500)
+    params = scheduler.next_params(free_slots=40, in_flight=2)
+    assert params.count == 40 and params.block is None
+
+    scheduler.record_lag(0)
+    scheduler.record_read(requested=40, received=40)
+    assert scheduler.next_params(free_slots=40, in_flight=2).block is None
+
+    scheduler.record_read(requested=40, received=3)
+    assert scheduler.next_params(free_slots=40, in_flight=2).block == 50
+    assert scheduler.snapshot()["block_ms"] == 50
+
+def test_empty_read_leaves_backlog_mode_before_the_next_lag_sample():
+    scheduler = ConsumeScheduler(max_count=100, busy_block_ms=50, idle_block_ms=1000, lag_sample_interval=60)
+    scheduler.record_lag(500)
+    assert scheduler.next_params(free_slots=10, in_flight=0).block is None
+    # Another replica drained the group: the non-blocking read comes back empty.
+    scheduler.record_read(requested=10, received=0)
+    assert not scheduler.backlogged
+    assert scheduler.next_params(free_slots=10, in_flight=0).block is not None
+    assert scheduler.snapshot()["lag"] == 0
@@ -0,0 +1,67 @@
+# tests/core/test_envelope.py
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from core.events.codec import load_event_data
+from core.events.envelope import EventEnvelope
+
+PAYLOAD = {"project_id": "proj_1", "score": 3}
+
+def make_fields(overrides=None):
+    fields = {
+        b'event_id': b'evt_1',
+        b'event_type': b'homeowner:intake_complete',
+        b'timestamp': b'2024-01-01T00:00:00',
+        b'correlation_id': b'corr_1',
+        b'data': json.dumps(PAYLOAD).encode(),
+    }
+    fields.update(overrides or {})
+    return fields
+
+def test_envelope_behaves_like_the_decoded_dict():
+    envelope = EventEnvelope(make_fields())
+    assert envelope['event_type'] == 'homeowner:intake_complete'
+    assert envelope.get('data') == json.dumps(PAYLOAD)
+    assert envelope.get('codec') is None
+    assert envelope.get('missing', 'default') == 'default'
+    assert 'correlation_id' in envelope
+    assert envelope.to_dict() == {
+        'event_id': 'evt_1',
+        'event_type': 'homeowner:intake_complete',
+        'timestamp': '2024-01-01T00:00:00',
+        'correlation_id': 'corr_1',
+        'data': json.dumps(PAYLOAD),
+    }
+    with pytest.raises(KeyError):
+        envelope['codec']
+
+def test_payload_is_decoded_lazily_and_once():
+    envelope = EventEnvelope(make_fields())
+    with patch('core.events.envelope.decode_data', wraps=lambda raw, codec: json.loads(raw)) as decode:
+        assert envelope.event_type == 'homeowner:intake_complete'
+        decode.assert_not_called()
+        assert load_event_data(envelope) == PAYLOAD
+        assert envelope.payload is envelope.payload
+        decode.assert_called_once()
+
+def test_envelope_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        EventEnvelope(make_fields()).extra = 1
+
+def test_missing_data_is_an_empty_payload():
+    assert EventEnvelope({b'event_type': b'x'}).payload == {}
+
+@pytest.mark.asyncio
+async def test_routing_skips_payload_decoding():
+    from tests.core.test_codec import CapturingAgent
+    agent = CapturingAgent()
+    agent.event_consumer.acknowledge = AsyncMock()
+    seen = []
+
+    async def skip(event_data):
+        seen.append(event_data)
+
+    agent.route_event('homeowner:intake_complete', skip)
+    assert await agent._handle_message(b'test:stream', b'1-0', make_fields({b'data': b'{not json'}))
+    assert isinstance(seen[0], EventEnvelope)
+    agent.event_consumer.acknowledge.assert_awaited_once_with('test:stream', '1-0')
@@ -0,0 +1,86 @@
+# tests/core/test_event_batcher.py
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from core.memory.event_batcher import EventStoreWriteError, EventWriteBatcher
+from core.memory.event_store import EventStore
+
+def make_client(side_effect=None):
+    client = MagicMock()
+    client.insert_many = AsyncMock(side_effect=side_effect or (lambda table, rows, on_conflict=None: rows))
+    return client
+
+@pytest.mark.asyncio
+async def test_flushes_one_bulk_insert_on_size():
+    client = make_client()
+    batcher = EventWriteBatcher(client, max_batch_size=3, flush_interval=10)
+    for index in range(3):
+        await batcher.add({"event_type": "test", "aggregate_id": f"p{index}"})
+    await asyncio.sleep(0)
+
+    client.insert_many.assert_awaited_once()
+    table, rows = client.insert_many.call_args.args
+    assert table == "event_store" and len(rows) == 3
+    assert client.insert_many.call_args.kwargs == {"on_conflict": "event_id"}
+    # Ids and timestamps are fixed when buffered so retries are idempotent.
+    assert all(row["event_id"] and row["timestamp"] for row in rows)
+    assert batcher.pending_count == 0
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_flushes_on_interval_and_close():
+    client = make_client()
+    batcher = EventWriteBatcher(client, max_batch_size=100, flush_interval=0.01)
+    await batcher.add({"event_type": "a"})
+    await asyncio.sleep(0.05)
+    assert client.insert_many.await_count == 1
+
+    await batcher.add({"event_type": "b"})
+    await batcher.close()
+    assert client.insert_many.await_count == 2
+    assert batcher.stored == 2
+
+@pytest.mark.asyncio
+async def test_durable_writers_wait_for_the_batch():
+    client = make_client()
+    batcher = EventWriteBatcher(client, max_batch_size=100, flush_interval=0.01)
+    stored = await batcher.add({"event_type": "a", "event_id": "e1"}, durable=True)
+    assert stored["event_id"] == "e1"
+    client.insert_many.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_retried_then_reported():
+    calls = []
+    def flaky(table, rows, on_conflict=None):
+        calls.append(list(rows))
+        if len(calls) == 1:
+            raise ConnectionError("down")
+        return rows
+    batcher = EventWriteBatcher(make_client(flaky), max_batch_size=10, flush_interval=10, retry_backoff=0)
+    await batcher.add({"event_type": "a"})
+    await batcher.close()
+    assert len(calls) == 2 and calls[0] == calls[1]
+    assert batcher.stored == 1
+
+    batcher = EventWriteBatcher(make_client(ConnectionError("down")), flush_interval=0, max_retries=2, retry_backoff=0)
+    with pytest.raises(EventStoreWriteError):
+        await batcher.add({"event_type": "a"}, durable=True)
+    assert batcher.db_client.insert_many.await_count == 3
+    assert batcher.failed == 1
+
+@pytest.mark.asyncio
+async def test_event_store_write_modes(monkeypatch):
+    monkeypatch.setenv("EVENT_STORE_WRITE_MODE", "batch")
+    store = EventStore()
+    store.db_client.insert_many = AsyncMock(side_effect=lambda table, rows, on_conflict=None: rows)
+    store.db_client.insert = AsyncMock()
+    assert await store.append_event({"event_type": "a", "event_data": {"x": 1}}) is None
+    store.db_client.insert_many.assert_not_called()
+    await store.close()
+    [row] = store.db_client.insert_many.call_args.args[1]
+    assert row["event_data"] == '{"x": 1}'
+    store.db_client.insert.assert_not_called()
+
+    assert EventStore(write_mode="sync").batcher is None
+    with pytest.raises(ValueError):
+        EventStore(write_mode="later")
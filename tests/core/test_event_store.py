@@ -0,0 +1,67 @@
+# tests/core/test_event_store.py
+import pytest
+from unittest.mock import AsyncMock
+from core.memory.event_batcher import EventStoreWriteError
+from core.memory.event_store import EventStore
+
+def make_store(events, snapshot=None):
+    """EventStore whose Supabase reads are served from `events`, recording each query."""
+    store = EventStore(write_mode="sync")
+    queries = []
+    async def select_rows(table, params):
+        queries.append((table, params))
+        if table == 'aggregate_snapshots':
+            return [snapshot] if snapshot else []
+        after_id = int(params['id'].split('.', 1)[1])
+        return [row for row in events if row['id'] > after_id][:params['limit']]
+    store.db_client.select_rows = select_rows
+    store.db_client.upsert = AsyncMock()
+    return store, queries
+
+def make_events(count):
+    return [{'id': index, 'aggregate_id': 'p1', 'event_type': 'test'} for index in range(1, count + 1)]
+
+@pytest.mark.asyncio
+async def test_iterates_in_keyset_pages():
+    store, queries = make_store(make_events(5))
+    ids = [event['id'] async for event in store.iter_events_for_aggregate('p1', page_size=2)]
+    assert ids == [1, 2, 3, 4, 5]
+    assert [params['id'] for _, params in queries] == ['gt.0', 'gt.2', 'gt.4']
+    assert queries[0][1]['aggregate_id'] == 'eq.p1'
+    assert queries[0][1]['order'] == 'id.asc'
+
+    assert [event['id'] for event in await store.get_events_for_aggregate('p1')] == ids
+
+@pytest.mark.asyncio
+async def test_rebuild_saves_a_snapshot_after_a_long_tail():
+    store, _ = make_store(make_events(5))
+    count = lambda state, event: state + 1
+    assert await store.rebuild('p1', count, projection='count', initial_state=0, snapshot_every=5) == 5
+    store.db_client.upsert.assert_awaited_once_with('aggregate_snapshots', {
+        'aggregate_id': 'p1', 'projection': 'count', 'last_event_id': 5, 'state': 5,
+    }, on_conflict='aggregate_id,projection')
+
+@pytest.mark.asyncio
+async def test_rebuild_replays_only_events_after_the_snapshot():
+    store, queries = make_store(make_events(5), snapshot={'last_event_id': 3, 'state': 3})
+    count = lambda state, event: state + 1
+    assert await store.rebuild('p1', count, projection='count', initial_state=0, snapshot_every=5) == 5
+    assert queries[-1][1]['id'] == 'gt.3'
+    store.db_client.upsert.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_durable_sync_append_raises_when_the_insert_fails():
+    store = EventStore(write_mode="sync")
+    store.db_client.insert = AsyncMock(return_value=None)
+    store.db_client.insert_many = AsyncMock(side_effect=RuntimeError("connection reset"))
+    with pytest.raises(EventStoreWriteError):
+        await store.append_event({'event_type': 'payment:completed', 'event_data': {'amount': 20}}, durable=True)
+    # Without durable the failure is only logged.
+    assert await store.append_event({'event_type': 'payment:completed'}) is None
+
+@pytest.mark.asyncio
+async def test_durable_sync_append_returns_the_stored_row():
+    store = EventStore(write_mode="sync")
+    store.db_client.insert_many = AsyncMock(return_value=[{'id': 7, 'event_type': 'payment:completed'}])
+    assert await store.append_event({'event_type': 'payment:completed'}, durable=True) == {'id': 7, 'event_type': 'payment:completed'}
+    store.db_client.insert_many.assert_awaited_once_with('event_store', [{'event_type': 'payment:completed'}])
@@ -0,0 +1,50 @@
+# tests/core/test_http_client.py
+import httpx
+import pytest
+from core.memory import http_client
+from core.memory.http_client import HTTPClientRegistry, http_client_registry
+from core.memory.supabase_client import SupabaseClient
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_and_closed_on_last_release():
+    registry = HTTPClientRegistry()
+    first = registry.acquire("http://db")
+    second = registry.acquire("http://db")
+    assert first is second
+    assert registry.ref_count("http://db") == 2
+
+    await registry.release("http://db")
+    assert not first.is_closed
+    await registry.release("http://db")
+    assert first.is_closed
+    assert registry.acquire("http://db") is not first
+    await registry.close_all()
+
+def test_pool_settings_come_from_environment(monkeypatch):
+    monkeypatch.setenv("HTTP_POOL_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("HTTP_TIMEOUT", "3.5")
+    monkeypatch.setenv("HTTP2_ENABLED", "false")
+    client = http_client.create_http_client()
+    assert client._transport._pool._max_connections == 7
+    assert client.timeout.read == 3.5
+    assert client._transport._pool._http2 is False
+
+@pytest.mark.asyncio
+async def test_supabase_clients_reuse_one_pooled_client(monkeypatch):
+    requests = []
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, json=[{"id": 1}])
+    monkeypatch.setattr(http_client, "create_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    first, second = SupabaseClient(), SupabaseClient()
+    await first.insert("event_store", {"event_type": "a"})
+    await second.insert_many("event_store", [{"event_type": "b"}, {"event_type": "c", "agent_id": "x"}], on_conflict="event_id")
+    assert first._http is second._http
+    assert http_client_registry.ref_count(first.supabase_url) == 2
+    assert requests[1].url.params["columns"] == "event_type,agent_id"
+    assert requests[1].url.params["on_conflict"] == "event_id"
+
+    await first.close()
+    await second.close()
+    assert http_client_registry.ref_count(first.supabase_url) == 0
@@ -0,0 +1,21 @@
+# tests/core/test_llm_cache.py
+import pytest
+from core.memory.llm_cache import LLMResultCache
+
+@pytest.mark.asyncio
+async def test_results_are_keyed_by_model_prompt_version_and_inputs():
+    cache = LLMResultCache("test_llm", model="gpt-4o", prompt_version=1, max_entries=10)
+    await cache.set({"description": "new roof"}, {"project_type": "roofing"})
+    assert await cache.get({"description": "new roof"}) == {"project_type": "roofing"}
+    assert await cache.get({"description": "new deck"}) is None
+    assert cache.key({"a": 1}) != LLMResultCache("test_llm", model="gpt-4o", prompt_version=2).key({"a": 1})
+    assert cache.key({"a": 1}) != LLMResultCache("test_llm", model="gpt-4o-mini", prompt_version=1).key({"a": 1})
+
+@pytest.mark.asyncio
+async def test_callers_cannot_change_cached_results():
+    cache = LLMResultCache("test_llm", model="gpt-4o", prompt_version=1, max_entries=10)
+    result = {"requirements": ["shingles"]}
+    await cache.set("roof", result)
+    result["requirements"].append("gutters")
+    (await cache.get("roof"))["requirements"].append("skylight")
+    assert await cache.get("roof") == {"requirements": ["shingles"]}
@@ -0,0 +1,118 @@
+# tests/core/test_memory_transport.py
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from core.events.codec import load_event_data
+from core.events.consumer import EventConsumer
+from core.events.envelope import EventEnvelope
+from core.events.memory_transport import memory_connections
+from core.events.publisher import EventPublisher
+from core.events.reclaimer import PendingReclaimer
+
+@pytest.fixture
+def broker():
+    memory_connections.broker.reset()
+    yield memory_connections.broker
+    memory_connections.broker.reset()
+
+@pytest.mark.asyncio
+async def test_events_are_passed_without_serialization(broker):
+    publisher = EventPublisher(transport='memory')
+    consumer = EventConsumer('memory:test', 'group', 'consumer_1', transport='memory')
+    await consumer.setup()
+    payload = {"project_id": "p1", "tags": ["a"]}
+    await publisher.publish('memory:test', 'test:event', payload, correlation_id='c1')
+
+    [(stream, [(message_id, envelope)])] = await consumer.consume(count=10, block=None)
+    assert stream == b'memory:test'
+    assert isinstance(envelope, EventEnvelope)
+    assert envelope['correlation_id'] == 'c1'
+    assert load_event_data(envelope) is payload
+    assert envelope.get('codec') is None
+
+    assert (await broker.xinfo_groups('memory:test'))[0]['pending'] == 1
+    await consumer.acknowledge('memory:test', message_id.decode())
+    await consumer.flush_acknowledgements()
+    assert (await broker.xinfo_groups('memory:test'))[0]['pending'] == 0
+    await consumer.close()
+    await publisher.close()
+
+@pytest.mark.asyncio
+async def test_groups_track_delivery_and_lag_independently(broker):
+    first = EventConsumer('memory:test', 'group_a', 'a_1', transport='memory')
+    second = EventConsumer('memory:test', 'group_b', 'b_1', transport='memory')
+    await first.setup()
+    await second.setup()
+    publisher = EventPublisher(transport='memory')
+    await publisher.publish_many([{"stream": "memory:test", "event_type": "t", "data": {"n": n}} for n in range(3)])
+
+    assert await first.get_lag() == 3
+    [(_, messages)] = await first.consume(count=2, block=None)
+    assert [load_event_data(envelope)["n"] for _, envelope in messages] == [0, 1]
+    assert await first.get_lag() == 1
+    assert await second.get_lag() == 3
+    assert await first.consume(count=10, block=None) != []
+    assert await first.consume(count=10, block=None) == []
+
+@pytest.mark.asyncio
+async def test_blocking_read_wakes_on_publish(broker):
+    consumer = EventConsumer('memory:test', 'group', 'consumer_1', transport='memory')
+    await consumer.setup()
+    read = asyncio.create_task(consumer.consume(count=1, block=2000))
+    await asyncio.sleep(0.01)
+    assert not read.done()
+    await EventPublisher(transport='memory').publish('memory:test', 't', {})
+    events = await asyncio.wait_for(read, timeout=1)
+    assert len(events[0][1]) == 1
+    assert await consumer.consume(count=1, block=10) == []
+
+@pytest.mark.asyncio
+async def test_unacknowledged_entries_are_redelivered_then_dead_lettered(broker):
+    consumer = EventConsumer('memory:test', 'group', 'consumer_1', transport='memory')
+    await consumer.setup()
+    await EventPublisher(transport='memory').publish('memory:test', 'poison', {"n": 1})
+    await consumer.consume(count=1, block=None)
+
+    reclaimer = PendingReclaimer(consumer, min_idle_ms=1, max_deliveries=2)
+    await asyncio.sleep(0.005)
+    [(_, [(_, envelope)])] = await reclaimer.reclaim(10)
+    assert envelope['event_type'] == 'poison'
+
+    await asyncio.sleep(0.005)
+    assert await reclaimer.reclaim(10) == []
+    assert reclaimer.stats()['dead_lettered'] == 1
+    assert await broker.xlen('memory:test:dead_letter') == 1
+    assert (await broker.xinfo_groups('memory:test'))[0]['pending'] == 0
+
+@pytest.mark.asyncio
+async def test_agent_handles_in_memory_envelopes(broker, monkeypatch):
+    monkeypatch.setenv("EVENT_TRANSPORT", "memory")
+    from tests.core.test_codec import CapturingAgent
+    agent = CapturingAgent()
+    await agent.setup()
+    await agent.event_publisher.publish('test:stream', 'test:event', {"project_id": "p1"})
+    [(stream, [(message_id, envelope)])] = await agent.event_consumer.consume(count=1, block=None)
+    assert await agent._handle_message(stream, message_id, envelope)
+    assert agent.received == [{"project_id": "p1"}]
+    # Whatever event store the agent holds at shutdown gets flushed and closed.
+    agent.event_store = MagicMock(close=AsyncMock())
+    await agent.graceful_shutdown()
+    agent.event_store.close.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_new_group_skips_history_of_streams_started_at_the_end(broker):
+    publisher = EventPublisher(transport='memory')
+    await publisher.publish('memory:primary', 'old', {"n": 1})
+    await publisher.publish('memory:secondary', 'old', {"n": 2})
+    consumer = EventConsumer(
+        'memory:primary', 'group', 'consumer_1', transport='memory',
+        streams=['memory:secondary'], start_ids={'memory:secondary': '$'},
+    )
+    await consumer.setup()
+    await publisher.publish('memory:secondary', 'new', {"n": 3})
+
+    read = {stream: [load_event_data(envelope)["n"] for _, envelope in entries]
+            for stream, entries in await consumer.consume(count=10, block=None)}
+    assert read == {b'memory:primary': [1], b'memory:secondary': [3]}
+    await consumer.close()
+    await publisher.close()
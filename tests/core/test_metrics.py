@@ -0,0 +1,84 @@
+# tests/core/test_metrics.py
+import json
+import pytest
+from unittest.mock import AsyncMock
+from core.base.metrics import (
+    METRICS_KEY, AgentMetrics, LatencyHistogram, aggregate, load_snapshots, publish_snapshot, render_prometheus,
+)
+from core.events.memory_transport import MemoryStreamBroker
+
+def test_histogram_quantiles_and_merge():
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.observe(0.002)
+    histogram.observe(0.7)
+    assert 0.001 <= histogram.quantile(0.5) <= 0.0025
+    assert 0.5 <= histogram.quantile(0.999) <= 1.0
+
+    other = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+    other.merge(histogram)
+    assert other.count == 200 and other.sum == pytest.approx(2 * histogram.sum)
+
+def test_snapshot_rates_cover_the_last_interval():
+    metrics = AgentMetrics("payment_gate", "payment_1")
+    for _ in range(3):
+        metrics.observe(0.0001, 0.01, 0.0002)
+    metrics.record_error()
+    first = metrics.snapshot(in_flight=2)
+    assert first["processed"] == 3 and first["errors"] == 1
+    assert first["error_rate"] == 0.25 and first["in_flight"] == 2
+    assert first["latency"]["handler"]["count"] == 3
+    second = metrics.snapshot()
+    assert second["error_rate"] == 0.0 and second["processed"] == 3
+
+@pytest.mark.asyncio
+async def test_snapshots_are_aggregated_across_processes():
+    client = MemoryStreamBroker()
+    for agent_id in ("scope_1", "scope_2"):
+        metrics = AgentMetrics("project_scope", agent_id)
+        metrics.observe(0.0001, 0.2, 0.0001)
+        await publish_snapshot(client, metrics.snapshot(in_flight=1))
+    stale = AgentMetrics("ui_generator", "ui_1").snapshot()
+    stale["updated_at"] -= 3600
+    await publish_snapshot(client, stale)
+
+    snapshots = await load_snapshots(client, max_age=30)
+    # The dead process's snapshot is removed, not just skipped.
+    assert sorted(await client.hgetall(METRICS_KEY)) == [b"scope_1", b"scope_2"]
+    summary = aggregate(snapshots)
+    assert list(summary) == ["project_scope"]
+    assert summary["project_scope"]["instances"] == 2
+    assert summary["project_scope"]["processed"] == 2
+    assert summary["project_scope"]["in_flight"] == 2
+    assert 100 <= summary["project_scope"]["latency_ms"]["process"]["p50"] <= 250
+
+    text = render_prometheus(snapshots)
+    assert 'swarm_agent_events_processed_total{agent_type="project_scope",agent_id="scope_1"} 1' in text
+    assert 'swarm_agent_stage_seconds_bucket{agent_type="project_scope",agent_id="scope_2",stage="process",le="+Inf"} 1' in text
+
+@pytest.mark.asyncio
+async def test_handle_message_records_breakdown_and_errors():
+    from tests.core.test_codec import CapturingAgent
+    agent = CapturingAgent()
+    agent.event_consumer.acknowledge = AsyncMock()
+    fields = {b'event_type': b'x', b'data': b'{"project_id": "p1"}'}
+    assert await agent._handle_message(b'test:stream', b'1-0', fields)
+    assert not await agent._handle_message(b'test:stream', b'2-0', {b'data': b'{broken'})
+    snapshot = agent.metrics_snapshot()
+    assert snapshot["processed"] == 1 and snapshot["errors"] == 1
+    assert all(snapshot["latency"][stage]["count"] == 1 for stage in ("decode", "process", "ack", "handler"))
+    assert snapshot["worker_limit"] == agent.worker_pool.limit
+
+def test_cache_stats_are_aggregated_and_exported():
+    snapshots = []
+    for agent_id, hits in (("filter_1", 3), ("filter_2", 1)):
+        snapshot = AgentMetrics("communication_filter", agent_id).snapshot(
+            caches={"contact_verdicts": {"size": 2, "hits": hits, "shared_hits": 0, "misses": 1,
+                                         "evictions": 0, "shared_errors": 0, "hit_rate": 0.0}}
+        )
+        snapshots.append(snapshot)
+    cache = aggregate(snapshots)["communication_filter"]["caches"]["contact_verdicts"]
+    assert (cache["hits"], cache["misses"], cache["size"]) == (4, 2, 4)
+    assert cache["hit_rate"] == pytest.approx(4 / 6)
+    text = render_prometheus(snapshots)
+    assert 'swarm_agent_cache_hits_total{agent_type="communication_filter",agent_id="filter_1",cache="contact_verdicts"} 3' in text
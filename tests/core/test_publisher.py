@@ -0,0 +1,51 @@
+# tests/core/test_publisher.py
+import json
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from core.events.publisher import EventPublisher
+
+@pytest.fixture
+def publisher():
+    publisher = EventPublisher(retention={"ui:updates": {"maxlen": 500}, "system:agent_errors": {"max_age_seconds": 60}})
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[b'1-0', b'2-0', b'3-0'])
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    client.xadd = AsyncMock(return_value=b'1-0')
+    publisher._get_client = AsyncMock(return_value=client)
+    return publisher, client, pipe
+
+@pytest.mark.asyncio
+async def test_publish_applies_approximate_maxlen(publisher):
+    publisher, client, _ = publisher
+    await publisher.publish('ui:updates', 'ui:payment_required', {"project_id": "p1"})
+    assert client.xadd.call_args.kwargs == {"maxlen": 500, "approximate": True}
+
+    await publisher.publish('homeowner:intake_complete', 'homeowner:intake_complete', {})
+    assert client.xadd.call_args.kwargs == {}
+
+@pytest.mark.asyncio
+async def test_publish_many_uses_one_pipeline(publisher):
+    publisher, client, pipe = publisher
+    message_ids = await publisher.publish_many([
+        {"stream": "ui:updates", "event_type": "a", "data": {"n": 1}},
+        {"stream": "system:agent_errors", "event_type": "b", "data": {"n": 2}, "correlation_id": "c1"},
+        {"stream": "payment:events", "event_type": "c", "data": {"n": 3}},
+    ])
+    assert message_ids == ['1-0', '2-0', '3-0']
+    pipe.execute.assert_awaited_once()
+    client.xadd.assert_not_called()
+    calls = pipe.xadd.call_args_list
+    assert calls[1].args[1]['correlation_id'] == 'c1'
+    assert json.loads(calls[2].args[1]['data']) == {"n": 3}
+    assert 'minid' in calls[1].kwargs and calls[2].kwargs == {}
+
+@pytest.mark.asyncio
+async def test_buffered_flushes_on_exit(publisher):
+    publisher, _, pipe = publisher
+    async with publisher.buffered(max_size=10) as buffer:
+        for n in range(3):
+            await buffer.add("ui:updates", "ui:state_change", {"n": n})
+        pipe.execute.assert_not_called()
+    pipe.execute.assert_awaited_once()
+    assert buffer.message_ids == ['1-0', '2-0', '3-0']
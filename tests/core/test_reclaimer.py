@@ -0,0 +1,42 @@
+# tests/core/test_reclaimer.py
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from core.events.reclaimer import PendingReclaimer
+
+@pytest.fixture
+def consumer():
+    consumer = MagicMock(
+        stream_name='payment:events', streams=['payment:events'],
+        group_name='payment_gate_processors', consumer_name='payment_1',
+    )
+    consumer.redis_client.xautoclaim = AsyncMock(return_value=[
+        b'0-0',
+        [(b'1-0', {b'event_type': b'ok'}), (b'2-0', {b'event_type': b'poison'}), (b'3-0', None)],
+        [],
+    ])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=[
+        [[{'times_delivered': 2}], [{'times_delivered': 6}]],
+        [b'9-0', 1],
+    ])
+    consumer.redis_client.pipeline.return_value = pipe
+    return consumer
+
+@pytest.mark.asyncio
+async def test_reclaim_retries_and_dead_letters_poison(consumer):
+    reclaimer = PendingReclaimer(consumer, min_idle_ms=1000, max_deliveries=5)
+    events = await reclaimer.reclaim(10)
+
+    assert events == [(b'payment:events', [(b'1-0', {b'event_type': b'ok'})])]
+    pipe = consumer.redis_client.pipeline.return_value
+    dead_letter_stream, entry = pipe.xadd.call_args.args
+    assert dead_letter_stream == 'payment:events:dead_letter'
+    assert entry['original_id'] == '2-0' and entry['delivery_count'] == 6
+    pipe.xack.assert_called_once_with('payment:events', 'payment_gate_processors', b'2-0')
+    assert reclaimer.stats()['dead_lettered'] == 1
+
+@pytest.mark.asyncio
+async def test_reclaim_skips_without_budget(consumer):
+    reclaimer = PendingReclaimer(consumer)
+    assert await reclaimer.reclaim(0) == []
+    consumer.redis_client.xautoclaim.assert_not_called()
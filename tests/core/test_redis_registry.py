@@ -0,0 +1,26 @@
+# tests/core/test_redis_registry.py
+import pytest
+from core.memory.redis_client import RedisConnectionRegistry
+
+@pytest.mark.asyncio
+async def test_connections_are_shared_and_closed_on_last_release():
+    registry = RedisConnectionRegistry()
+    first = registry.acquire("redis://localhost:6379")
+    second = registry.acquire("redis://localhost:6379")
+    assert first is second
+    assert first.reader.connection_pool is not first.writer.connection_pool
+    assert registry.ref_count("redis://localhost:6379") == 2
+
+    await registry.release("redis://localhost:6379")
+    assert registry.ref_count("redis://localhost:6379") == 1
+    await registry.release("redis://localhost:6379")
+    assert registry.ref_count("redis://localhost:6379") == 0
+    assert registry.acquire("redis://localhost:6379") is not first
+    await registry.close_all()
+
+def test_pool_sizes_come_from_environment(monkeypatch):
+    monkeypatch.setenv("REDIS_READ_POOL_SIZE", "3")
+    monkeypatch.setenv("REDIS_WRITE_POOL_SIZE", "7")
+    connections = RedisConnectionRegistry().acquire("redis://localhost:6379")
+    assert connections.reader.connection_pool.max_connections == 3
+    assert connections.writer.connection_pool.max_connections == 7
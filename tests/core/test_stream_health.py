@@ -0,0 +1,38 @@
+# tests/core/test_stream_health.py
+import pytest
+from unittest.mock import MagicMock
+from core.events.memory_transport import MemoryStreamBroker
+from core.events.stream_health import StreamHealthMonitor
+
+async def make_broker():
+    broker = MemoryStreamBroker()
+    await broker.xgroup_create('homeowner:intake_complete', 'scope_processors', id='0', mkstream=True)
+    for n in range(5):
+        await broker.xadd('homeowner:intake_complete', {'event_type': 'e', 'data': {'n': n}})
+    await broker.xreadgroup('scope_processors', 'scope_1', {'homeowner:intake_complete': '>'}, count=2)
+    return broker
+
+@pytest.mark.asyncio
+async def test_reports_lag_pending_and_consumers():
+    broker = await make_broker()
+    monitor = StreamHealthMonitor(lambda: broker, streams=['homeowner:intake_complete', 'payment:events'], ttl=60)
+    report = await monitor.snapshot()
+
+    assert report["streams"]["payment:events"] == {"exists": False, "length": 0, "groups": {}}
+    stream = report["streams"]["homeowner:intake_complete"]
+    assert stream["length"] == 5
+    group = stream["groups"]["scope_processors"]
+    assert group["lag"] == 3 and group["pending"] == 2
+    assert group["oldest_pending_age_s"] >= 0
+    assert group["consumers"]["scope_1"]["pending"] == 2
+    assert report["totals"]["lag"] == 3 and report["totals"]["pending"] == 2
+
+@pytest.mark.asyncio
+async def test_samples_are_cached_for_the_ttl():
+    broker = await make_broker()
+    get_client = MagicMock(return_value=broker)
+    monitor = StreamHealthMonitor(get_client, streams=['homeowner:intake_complete'], ttl=60)
+    first = await monitor.snapshot()
+    assert await monitor.snapshot() is first
+    assert get_client.call_count == 1
+    assert await monitor.snapshot(force=True) is not first
@@ -0,0 +1,61 @@
+# tests/core/test_tiered_cache.py
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from core.events.memory_transport import MemoryStreamBroker
+from core.memory.tiered_cache import TieredCache
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_and_counts():
+    cache = TieredCache("test", max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1  # "b" is now the oldest
+    await cache.set("c", 3)
+    assert await cache.get("b") is None
+    assert await cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 1, 1, 2)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+@pytest.mark.asyncio
+async def test_shared_tier_serves_other_instances_until_ttl():
+    broker = MemoryStreamBroker()
+    writer = TieredCache("verdicts", max_entries=10, ttl=60, get_client=lambda: broker)
+    reader = TieredCache("verdicts", max_entries=10, ttl=60, get_client=lambda: broker)
+    await writer.set("k", {"phones": ["555-123-4567"]})
+    assert await reader.get("k") == {"phones": ["555-123-4567"]}
+    assert reader.shared_hits == 1
+    # Now served from the reader's own LRU.
+    assert await reader.get("k") == {"phones": ["555-123-4567"]}
+    assert reader.shared_hits == 1 and reader.hits == 2
+
+    await broker.set("verdicts:old", "1", ex=0.001)
+    import asyncio
+    await asyncio.sleep(0.01)
+    assert await reader.get("old") is None
+
+@pytest.mark.asyncio
+async def test_shared_tier_errors_only_cost_a_miss():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=ConnectionError("down"))
+    client.set = AsyncMock(side_effect=ConnectionError("down"))
+    cache = TieredCache("test", max_entries=10, get_client=lambda: client)
+    assert await cache.get("k") is None
+    await cache.set("k", [1])
+    assert await cache.get("k") == [1]
+    assert cache.shared_errors == 2 and cache.misses == 1
+
+@pytest.mark.asyncio
+async def test_unreadable_shared_values_count_as_misses():
+    broker = MemoryStreamBroker()
+    await broker.set("verdicts:k", b"\x80not json")
+    cache = TieredCache("verdicts", max_entries=10, ttl=60, get_client=lambda: broker)
+    assert await cache.get("k") is None
+    assert cache.shared_errors == 1 and cache.misses == 1 and len(cache) == 0
+    # Recomputing overwrites the bad value for everyone.
+    await cache.set("k", {"phones": []})
+    assert await TieredCache("verdicts", max_entries=10, get_client=lambda: broker).get("k") == {"phones": []}
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        TieredCache("test", max_entries=0)
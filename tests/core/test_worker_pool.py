@@ -0,0 +1,41 @@
+# tests/core/test_worker_pool.py
+import asyncio
+import pytest
+from core.base.worker_pool import AdaptiveWorkerPool
+
+@pytest.mark.asyncio
+async def test_pool_never_exceeds_limit():
+    pool = AdaptiveWorkerPool(max_workers=3)
+    peak = 0
+
+    async def handler():
+        nonlocal peak
+        peak = max(peak, pool.in_flight)
+        await asyncio.sleep(0.01)
+
+    for _ in range(10):
+        await pool.submit(handler())
+    await pool.drain()
+    assert peak <= 3
+    assert pool.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_pool_shrinks_on_errors_and_recovers():
+    pool = AdaptiveWorkerPool(max_workers=8, window_size=4)
+
+    async def failing():
+        await asyncio.sleep(0.005)
+        return False
+
+    for _ in range(4):
+        await pool.submit(failing())
+    await pool.drain()
+    assert pool.limit == 4
+
+    async def ok():
+        await asyncio.sleep(0.005)
+
+    for _ in range(40):
+        await pool.submit(ok())
+    await pool.drain()
+    assert pool.limit > 4
@@ -0,0 +1,317 @@
+# tests/load/loadgen.py
+"""
+End-to-end load generator for the submission pipeline.
+
+Sends POST /projects/submit to the FastAPI app in main.py and follows each
+project through homeowner:intake_complete, homeowner:scope_complete and
+ui:updates. The intake, scope, payment and UI agents run in this process
+with stubbed LLM and database backends, so the run is fully offline.
+
+    # open loop: fixed arrival rate (requests/second), one step per rate
+    python -m tests.load.loadgen --rate 5,10,20 --duration 30
+
+    # closed loop: fixed number of projects in flight
+    python -m tests.load.loadgen --concurrency 16 --duration 30
+
+    # against a local Redis instead of the in-memory transport
+    python -m tests.load.loadgen --transport redis --redis-url redis://localhost:6379/15 --rate 10
+
+Open-loop latencies are measured from each request's scheduled send time,
+so they include any time the generator or the system fell behind
+(coordinated omission). Closed-loop runs can correct with
+--expected-interval-ms. With --transport redis, use a dedicated database:
+the agents' consumer groups also pick up whatever is already in the streams.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import uuid
+from typing import Any, Dict, List, Optional
+
+STAGES = ("homeowner:intake_complete", "homeowner:scope_complete", "ui:updates")
+FINAL_STAGE = STAGES[-1]
+PIPELINE_AGENTS = ("intake", "scope", "payment", "ui")
+
+class PipelineTracker:
+    """
+    Follows submitted projects through the pipeline stages with its own
+    consumer group, which starts at the end of each stream so earlier
+    traffic is ignored.
+    """
+    def __init__(self, transport: str, expected_interval: Optional[float] = None):
+        from core.events.consumer import EventConsumer
+        from tests.load.stats import LatencyRecorder
+        self.group_name = f"loadgen_{uuid.uuid4().hex[:8]}"
+        self.consumer = EventConsumer(
+            stream_name=STAGES[0], group_name=self.group_name, consumer_name=self.group_name,
+            streams=list(STAGES[1:]), transport=transport,
+        )
+        self.recorders = {stage: LatencyRecorder(stage, expected_interval) for stage in STAGES}
+        self.http = LatencyRecorder("http", expected_interval)
+        self._started: Dict[str, float] = {}
+        self._seen: Dict[str, set] = {}
+        self._done: Dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        for stream in self.consumer.streams:
+            await self.consumer.redis_client.xgroup_create(stream, self.group_name, id='$', mkstream=True)
+        self._task = asyncio.create_task(self._run())
+
+    def expect(self, project_id: str, intended_start: float) -> asyncio.Future:
+        self._started[project_id] = intended_start
+        self._seen[project_id] = set()
+        self._done[project_id] = asyncio.get_running_loop().create_future()
+        return self._done[project_id]
+
+    def forget(self, project_id: str) -> None:
+        self._started.pop(project_id, None)
+        self._seen.pop(project_id, None)
+        future = self._done.pop(project_id, None)
+        if future and not future.done():
+            future.cancel()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(1 for future in self._done.values() if not future.done())
+
+    async def _run(self) -> None:
+        from core.events.codec import load_event_data
+        loop = asyncio.get_running_loop()
+        while True:
+            events = await self.consumer.consume(count=500, block=100)
+            now = loop.time()
+            for stream, messages in events or []:
+                stage = stream.decode('utf-8') if isinstance(stream, bytes) else stream
+                for message_id, fields in messages:
+                    project_id = load_event_data(fields).get('project_id')
+                    seen = self._seen.get(project_id)
+                    if seen is not None and stage not in seen:
+                        seen.add(stage)
+                        self.recorders[stage].record(now - self._started[project_id])
+                        if stage == FINAL_STAGE and not self._done[project_id].done():
+                            self._done[project_id].set_result(now)
+                    message_id = message_id.decode('utf-8') if isinstance(message_id, bytes) else message_id
+                    await self.consumer.acknowledge(stage, message_id)
+
+    async def drain(self, timeout: float) -> None:
+        pending = [future for future in self._done.values() if not future.done()]
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+        await self.consumer.flush_acknowledgements()
+        for stream in self.consumer.streams:
+            try:
+                await self.consumer.redis_client.xgroup_destroy(stream, self.group_name)
+            except Exception:
+                pass
+        await self.consumer.close()
+
+def build_submission(project_id: str, description: str) -> Dict[str, Any]:
+    from tests.benchmarks.payloads import PROJECT_SUBMITTED
+    return {
+        "project_id": project_id,
+        "contact_info": PROJECT_SUBMITTED["contact_info"],
+        "project_details": {"raw_description": description},
+    }
+
+class LoadGenerator:
+    def __init__(self, client: Any, tracker: PipelineTracker, messages: List[str], rng: random.Random):
+        self.client = client
+        self.tracker = tracker
+        self.messages = messages
+        self.rng = rng
+        self.submitted = 0
+        self.errors = 0
+
+    async def submit(self, intended_start: float) -> Optional[asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        project_id = str(uuid.uuid4())
+        done = self.tracker.expect(project_id, intended_start)
+        self.submitted += 1
+        try:
+            response = await self.client.post(
+                "/projects/submit", json=build_submission(project_id, self.rng.choice(self.messages))
+            )
+            response.raise_for_status()
+        except Exception as e:
+            self.errors += 1
+            self.tracker.forget(project_id)
+            logging.getLogger("loadgen").warning(f"Submission failed: {e}")
+            return None
+        self.tracker.http.record(loop.time() - intended_start)
+        return done
+
+    async def open_loop(self, rate: float, duration: float, poisson: bool = False) -> None:
+        """Sends at `rate` requests/second whether or not earlier ones finished."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        offset, tasks = 0.0, []
+        while offset < duration:
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.submit(start + offset)))
+            offset += self.rng.expovariate(rate) if poisson else 1.0 / rate
+        await asyncio.gather(*tasks)
+
+    async def closed_loop(self, concurrency: int, duration: float, timeout: float) -> None:
+        """Keeps `concurrency` projects in flight, each worker waiting for its project to finish."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+
+        async def worker():
+            while loop.time() < deadline:
+                done = await self.submit(loop.time())
+                if done is not None:
+                    try:
+                        await asyncio.wait_for(asyncio.shield(done), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+def configure_environment(args: argparse.Namespace) -> None:
+    os.environ["EVENT_TRANSPORT"] = args.transport
+    if args.redis_url:
+        os.environ["REDIS_URL"] = args.redis_url
+    os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+    # Backends are stubbed; these only satisfy the constructors.
+    os.environ.setdefault("OPENAI_API_KEY", "loadgen-offline")
+    os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+    os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "loadgen-offline")
+
+async def start_agents(args: argparse.Namespace, rng: random.Random) -> List[Any]:
+    from run_agents import AGENT_MAP
+    from tests.load.stubs import LatencyDistribution, StubEventStore, StubNLPProcessor, StubScopeChain
+    nlp_latency = LatencyDistribution(args.nlp_latency, rng)
+    llm_latency = LatencyDistribution(args.llm_latency, rng)
+    store_latency = LatencyDistribution(args.store_latency, rng)
+    replicas = {agent_type: 1 for agent_type in PIPELINE_AGENTS}
+    for spec in args.replicas:
+        agent_type, _, count = spec.partition("=")
+        replicas[agent_type] = int(count)
+    agents = []
+    for agent_type, count in replicas.items():
+        for _ in range(count):
+            agent = AGENT_MAP[agent_type]()
+            if hasattr(agent, "event_store"):
+                agent.event_store = StubEventStore(store_latency)
+            if agent_type == "intake":
+                agent.nlp_processor = StubNLPProcessor(nlp_latency)
+            elif agent_type == "scope":
+                agent.chain = StubScopeChain(llm_latency)
+                # The stub extractions are all alike and would always hit the cache.
+                agent.scope_cache = None
+            await agent.setup()
+            agents.append((agent, asyncio.create_task(agent.run())))
+    return agents
+
+async def stop_agents(agents: List[Any]) -> None:
+    for agent, task in agents:
+        await agent.graceful_shutdown()
+        task.cancel()
+
+def report(label: str, generator: LoadGenerator, tracker: PipelineTracker, elapsed: float) -> Dict[str, Any]:
+    completed = len(tracker.recorders[FINAL_STAGE].values) - tracker.recorders[FINAL_STAGE].corrected_samples
+    result = {
+        "step": label,
+        "submitted": generator.submitted,
+        "http_errors": generator.errors,
+        "completed": completed,
+        "incomplete": tracker.in_flight,
+        "elapsed_s": elapsed,
+        "throughput_per_s": completed / elapsed if elapsed else 0.0,
+        "latency_s": {name: recorder.summary() for name, recorder in
+                      [("http", tracker.http)] + list(tracker.recorders.items())},
+    }
+    print(f"\n== {label}: submitted {generator.submitted}, completed {completed}, "
+          f"incomplete {tracker.in_flight}, errors {generator.errors}, "
+          f"throughput {result['throughput_per_s']:.2f}/s")
+    print(f"{'stage':28} {'count':>7} {'p50 ms':>10} {'p99 ms':>10} {'p999 ms':>10} {'max ms':>10}")
+    for name, summary in result["latency_s"].items():
+        cells = [summary[key] for key in ("p50", "p99", "p99.9", "max")]
+        formatted = " ".join(f"{cell * 1000:10.1f}" if cell is not None else f"{'-':>10}" for cell in cells)
+        print(f"{name:28} {summary['count']:7d} {formatted}")
+    return result
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    configure_environment(args)
+    import httpx
+    import main as api
+    from tests.benchmarks.corpus import generate_messages
+
+    rng = random.Random(args.seed)
+    messages = generate_messages(500, dirty_ratio=args.dirty_ratio, seed=args.seed)
+    agents = await start_agents(args, rng)
+    transport = None if args.url else httpx.ASGITransport(app=api.app)
+    results = []
+    loop = asyncio.get_running_loop()
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=args.url or "http://loadgen", timeout=args.timeout) as client:
+            steps = [("concurrency", args.concurrency)] if args.concurrency else [
+                ("rate", float(rate)) for rate in args.rate.split(",")
+            ]
+            for mode, value in steps:
+                expected_interval = args.expected_interval_ms / 1000.0 if args.expected_interval_ms else None
+                tracker = PipelineTracker(args.transport, expected_interval if mode == "concurrency" else None)
+                await tracker.start()
+                generator = LoadGenerator(client, tracker, messages, rng)
+                started = loop.time()
+                if mode == "rate":
+                    await generator.open_loop(value, args.duration, poisson=args.poisson)
+                else:
+                    await generator.closed_loop(int(value), args.duration, args.timeout)
+                await tracker.drain(args.drain_timeout)
+                elapsed = loop.time() - started
+                label = f"{value:g} req/s" if mode == "rate" else f"concurrency {int(value)}"
+                results.append(report(label, generator, tracker, elapsed))
+                await tracker.close()
+    finally:
+        await stop_agents(agents)
+        await api.event_publisher.close()
+    return results
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rate", default="10", help="arrival rate(s) in requests/second, comma-separated for a sweep")
+    mode.add_argument("--concurrency", type=int, help="closed loop with this many projects in flight")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of traffic per step")
+    parser.add_argument("--poisson", action="store_true", help="exponential inter-arrival times instead of a fixed interval")
+    parser.add_argument("--drain-timeout", type=float, default=30.0, help="seconds to wait for in-flight projects after a step")
+    parser.add_argument("--timeout", type=float, default=30.0, help="HTTP and per-project timeout in seconds")
+    parser.add_argument("--expected-interval-ms", type=float, help="closed loop: coordinated-omission correction interval")
+    parser.add_argument("--transport", choices=("memory", "redis"), default="memory")
+    parser.add_argument("--redis-url", help="Redis URL for --transport redis")
+    parser.add_argument("--url", help="send HTTP to a running API instead of main.app in-process")
+    parser.add_argument("--nlp-latency", default="lognormal:800,0.4", help="intake LLM latency distribution (ms)")
+    parser.add_argument("--llm-latency", default="lognormal:1500,0.4", help="scope LLM latency distribution (ms)")
+    parser.add_argument("--store-latency", default="0", help="event store write latency distribution (ms)")
+    parser.add_argument("--replicas", nargs="*", default=[], metavar="TYPE=N", help="in-process agents per type, e.g. scope=4")
+    parser.add_argument("--dirty-ratio", type=float, default=0.1, help="share of descriptions containing contact info")
+    parser.add_argument("--seed", type=int, default=1729)
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args(argv)
+    if args.url and args.transport == "memory":
+        parser.error("--url needs --transport redis: the in-memory transport can't reach another process.")
+    return args
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
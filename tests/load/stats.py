@@ -0,0 +1,50 @@
+# tests/load/stats.py
+"""Latency recording with percentile reports for the load generator."""
+import math
+from typing import Dict, List, Optional, Sequence
+
+PERCENTILES = (50.0, 99.0, 99.9)
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(round(pct / 100.0 * len(sorted_values), 9)))
+    return sorted_values[rank - 1]
+
+class LatencyRecorder:
+    """
+    Collects latencies in seconds.
+
+    Open-loop runs measure every latency from the request's *intended*
+    start time, so stalls in the generator or the system under test are
+    never hidden (no coordinated omission). Closed-loop runs can't do that,
+    so record() optionally back-fills the samples that a stalled worker
+    failed to send, like HdrHistogram's recordValueWithExpectedInterval:
+    a latency L > expected_interval adds L - i * expected_interval for
+    i = 1, 2, ... while that stays positive.
+    """
+    def __init__(self, name: str, expected_interval: Optional[float] = None):
+        self.name = name
+        self.expected_interval = expected_interval
+        self.values: List[float] = []
+        self.corrected_samples = 0
+
+    def record(self, latency: float) -> None:
+        self.values.append(latency)
+        if self.expected_interval and latency > self.expected_interval:
+            missed = latency - self.expected_interval
+            while missed > 0:
+                self.values.append(missed)
+                self.corrected_samples += 1
+                missed -= self.expected_interval
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        ordered = sorted(self.values)
+        result = {"count": len(ordered), "max": ordered[-1] if ordered else None}
+        for pct in PERCENTILES:
+            result[f"p{pct:g}"] = percentile(ordered, pct)
+        return result
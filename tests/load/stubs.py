@@ -0,0 +1,91 @@
+# tests/load/stubs.py
+"""
+Offline stand-ins for the external backends of the submission pipeline.
+LLM calls are replaced by sleeps drawn from a configurable latency
+distribution, so agent saturation can be measured without an API key.
+"""
+import asyncio
+import json
+import random
+from typing import Any, Dict, List, Optional
+from tests.benchmarks.payloads import INTAKE_COMPLETE, SCOPE_COMPLETE
+
+class LatencyDistribution:
+    """
+    Latency in seconds, parsed from a spec in milliseconds:
+
+        const:800              always 800 ms
+        uniform:200,1200       uniform between 200 and 1200 ms
+        exp:500                exponential with a 500 ms mean
+        lognormal:800,0.5      lognormal with an 800 ms median and sigma 0.5
+        0                      no delay
+    """
+    KINDS = ("const", "uniform", "exp", "lognormal")
+
+    def __init__(self, spec: str, rng: Optional[random.Random] = None):
+        self.spec = spec
+        self.rng = rng or random.Random()
+        kind, _, args = spec.partition(":")
+        if not args:
+            kind, args = "const", kind
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}'. Expected one of {list(self.KINDS)}.")
+        self.kind = kind
+        self.args = [float(value) for value in args.split(",")]
+        expected = {"const": 1, "uniform": 2, "exp": 1, "lognormal": 2}[kind]
+        if len(self.args) != expected:
+            raise ValueError(f"Latency distribution '{kind}' takes {expected} argument(s), got '{args}'.")
+
+    def sample(self) -> float:
+        if self.kind == "const":
+            ms = self.args[0]
+        elif self.kind == "uniform":
+            ms = self.rng.uniform(*self.args)
+        elif self.kind == "exp":
+            ms = self.rng.expovariate(1.0 / self.args[0]) if self.args[0] > 0 else 0.0
+        else:
+            median, sigma = self.args
+            ms = self.rng.lognormvariate(0.0, sigma) * median
+        return max(ms, 0.0) / 1000.0
+
+    async def wait(self) -> None:
+        delay = self.sample()
+        if delay:
+            await asyncio.sleep(delay)
+
+class StubNLPProcessor:
+    """Replaces NLPProcessor.extract_project_info() with a delayed canned answer."""
+    def __init__(self, latency: LatencyDistribution):
+        self.latency = latency
+
+    async def extract_project_info(self, description: str, image_urls: Optional[List[str]] = None) -> Dict[str, Any]:
+        await self.latency.wait()
+        return dict(INTAKE_COMPLETE["extracted_data"])
+
+class StubScopeChain:
+    """Replaces ProjectScopeAgent.chain; arun() returns the scope JSON text."""
+    def __init__(self, latency: LatencyDistribution):
+        self.latency = latency
+        self._response = json.dumps(SCOPE_COMPLETE["structured_scope"])
+
+    async def arun(self, **kwargs: Any) -> str:
+        await self.latency.wait()
+        return self._response
+
+class StubEventStore:
+    """Accepts event store writes without a database."""
+    def __init__(self, latency: Optional[LatencyDistribution] = None):
+        self.latency = latency
+        self.appended = 0
+
+    async def append_event(self, event_data: Dict[str, Any], durable: bool = False) -> Optional[Dict[str, Any]]:
+        if self.latency:
+            await self.latency.wait()
+        self.appended += 1
+        return None
+
+    async def close(self) -> None:
+        pass
+
+    async def get_events_for_aggregate(self, aggregate_id: str) -> List[Dict[str, Any]]:
+        return []
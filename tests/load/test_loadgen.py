@@ -0,0 +1,45 @@
+# tests/load/test_loadgen.py
+import random
+import pytest
+from tests.load.stats import LatencyRecorder, percentile
+from tests.load.stubs import LatencyDistribution
+
+def test_percentiles_use_nearest_rank():
+    values = [float(n) for n in range(1, 1001)]
+    assert percentile(values, 50) == 500.0
+    assert percentile(values, 99) == 990.0
+    assert percentile(values, 99.9) == 999.0
+    assert percentile([], 50) is None
+
+def test_closed_loop_correction_backfills_missed_samples():
+    recorder = LatencyRecorder("e2e", expected_interval=0.1)
+    recorder.record(0.05)
+    recorder.record(0.35)
+    assert recorder.values == pytest.approx([0.05, 0.35, 0.25, 0.15, 0.05])
+    assert recorder.corrected_samples == 3
+
+def test_latency_distributions():
+    rng = random.Random(1)
+    assert LatencyDistribution("0").sample() == 0.0
+    assert LatencyDistribution("const:250").sample() == 0.25
+    assert all(0.1 <= LatencyDistribution("uniform:100,200", rng).sample() <= 0.2 for _ in range(100))
+    with pytest.raises(ValueError):
+        LatencyDistribution("gamma:1")
+    with pytest.raises(ValueError):
+        LatencyDistribution("uniform:100")
+
+@pytest.mark.asyncio
+async def test_open_loop_run_tracks_projects_end_to_end(monkeypatch):
+    monkeypatch.setenv("EVENT_TRANSPORT", "memory")
+    import main
+    from core.events.publisher import EventPublisher
+    from tests.load import loadgen
+    monkeypatch.setattr(main, "event_publisher", EventPublisher(transport="memory"))
+    args = loadgen.parse_args([
+        "--rate", "40", "--duration", "0.5", "--drain-timeout", "5",
+        "--nlp-latency", "0", "--llm-latency", "const:5",
+    ])
+    [result] = await loadgen.run(args)
+    assert result["submitted"] == 20
+    assert result["completed"] == 20 and result["incomplete"] == 0
+    assert result["latency_s"]["ui:updates"]["p50"] >= result["latency_s"]["homeowner:intake_complete"]["p50"]
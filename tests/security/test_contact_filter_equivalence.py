@@ -0,0 +1,91 @@
+# tests/security/test_contact_filter_equivalence.py
+"""
+Differential test: the single-pass scanner and span-based scrub must give
+exactly what the original pattern-by-pattern findall()/sub() calls give.
+"""
+import random
+import pytest
+from core.security.contact_filter import ContactProtectionFilter
+from tests.benchmarks.corpus import generate_messages
+
+# Fragments that exercise word boundaries, overlapping patterns, case
+# folding ("ſ" matches "s", "K" matches "k") and non-ASCII digits.
+TOKENS = [
+    "555", "123", "4567", "5551234567", "(555)", " ", "  ", "-", ".", "+1", "+", "@", "[at]", "[dot]",
+    " at ", " AT ", " dot ", "com", "net", "gmail", "john", "a", "at", "_", "%", "ſ", "K", "İ", "call me",
+    "text  me", "my number", "My Email", "whatsapp", "SIGNAL", "\n", "(", "[", "]", "x", "7", "12", "|",
+    "[FILTERED]", "é", "٣",
+]
+
+EDGE_CASES = [
+    "",
+    "+1 555-123-4567",
+    "5551234567",
+    "(555) 123-45678901234567",
+    "john@example.com.",
+    "555-123-4567@gmail.com",
+    "Call me at 762-428-6586. What time works?",
+    "whatſapp me, ſignal too",
+    "john.doe [at] gmail [dot] com or jane AT yahoo DOT com",
+    "that.x@y.com atat@b.co a@b@c.de",
+    "me@555-123-4567.com",
+    "555.123.4567 555 123 4567 555-123-4567x",
+]
+
+@pytest.fixture(scope="module")
+def contact_filter():
+    return ContactProtectionFilter()
+
+def reference_scan(contact_filter, content):
+    return {
+        "phones": [m for p in contact_filter.PHONE_PATTERNS for m in p.findall(content)],
+        "emails": [m for p in contact_filter.EMAIL_PATTERNS for m in p.findall(content)],
+        "intent": [m for p in contact_filter.INTENT_PATTERNS for m in p.findall(content)],
+    }
+
+def reference_scrub(contact_filter, content):
+    for pattern in contact_filter.PHONE_PATTERNS + contact_filter.EMAIL_PATTERNS:
+        content = pattern.sub("[FILTERED]", content)
+    return content
+
+def fuzz_messages(count, seed=7):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(TOKENS) for _ in range(rng.randint(1, 14))) for _ in range(count)]
+
+def assert_equivalent(contact_filter, messages):
+    for content in messages:
+        assert contact_filter.scan_content(content) == reference_scan(contact_filter, content), content
+        expected = reference_scrub(contact_filter, content)
+        assert contact_filter.scrub_content(content) == expected, content
+        assert contact_filter.scrub_content(content, contact_filter.find_matches(content)) == expected, content
+
+def test_edge_cases_match_reference(contact_filter):
+    assert_equivalent(contact_filter, EDGE_CASES)
+
+def test_corpus_matches_reference(contact_filter):
+    assert_equivalent(contact_filter, generate_messages(5000, dirty_ratio=0.5))
+
+def test_fuzzed_fragments_match_reference(contact_filter):
+    assert_equivalent(contact_filter, fuzz_messages(30000))
+
+def test_match_spans_point_at_the_match(contact_filter):
+    content = "Call me at 555-867-5309 or mail jane.doe@example.com"
+    matches = contact_filter.find_matches(content)
+    assert [(m.kind, content[m.start:m.end]) for m in matches if m.kind != "intent"] == [
+        ("phones", "555-867-5309"),
+        ("emails", "jane.doe@example.com"),
+        ("emails", "jane.doe@example.com"),
+    ]
+    assert [m.text for m in matches if m.kind == "intent"] == ["Call"]
+
+def test_prefilter_never_rules_out_a_matching_pattern(contact_filter):
+    messages = EDGE_CASES + generate_messages(2000, dirty_ratio=0.5) + fuzz_messages(10000, seed=11)
+    for content in messages:
+        candidates = contact_filter.prefilter(content)
+        for index, (_, pattern) in enumerate(contact_filter.scan_patterns()):
+            if pattern.search(content):
+                assert index in candidates, (index, content)
+
+def test_prefilter_rules_out_plain_text(contact_filter):
+    assert contact_filter.prefilter("I need a new roof") == frozenset()
+    assert contact_filter.find_matches("I need a new roof") == []
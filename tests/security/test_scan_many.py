@@ -0,0 +1,22 @@
+# tests/security/test_scan_many.py
+from core.security.contact_filter import ContactProtectionFilter
+from tests.benchmarks.corpus import generate_messages
+
+MESSAGES = ["I need a new roof", "call me at 555-867-5309", "", "my email is test@example.com"]
+
+def test_scan_many_returns_none_for_clean_messages():
+    contact_filter = ContactProtectionFilter()
+    results = contact_filter.scan_many(MESSAGES)
+    assert results[0] is None
+    assert results[2] is None
+    assert results[1] == contact_filter.scan_content(MESSAGES[1])
+    assert results[3] == contact_filter.scan_content(MESSAGES[3])
+
+def test_scan_many_in_process_pool_matches_single_scans():
+    contact_filter = ContactProtectionFilter()
+    messages = generate_messages(400, dirty_ratio=0.3)
+    expected = [contact_filter.scan_content(content) for content in messages]
+    results = contact_filter.scan_many(messages, processes=2)
+    assert len(results) == len(messages)
+    for result, violations in zip(results, expected):
+        assert result == (violations if any(violations.values()) else None)
@@ -0,0 +1,59 @@
+# tests/security/test_stream_scanner.py
+import random
+import pytest
+from core.security.contact_filter import ContactProtectionFilter
+from core.security.stream_scanner import StreamingContactScanner
+from tests.benchmarks.corpus import generate_messages
+
+@pytest.fixture(scope="module")
+def contact_filter():
+    return ContactProtectionFilter()
+
+def stream(scanner, chunks):
+    matches = []
+    for chunk in chunks:
+        matches += scanner.feed(chunk)
+    return matches + scanner.finish()
+
+def random_chunks(content, rng):
+    chunks, position = [], 0
+    while position < len(content):
+        size = rng.randint(1, 12)
+        chunks.append(content[position:position + size])
+        position += size
+    return chunks
+
+def test_chunked_stream_matches_whole_text_scan(contact_filter):
+    rng = random.Random(5)
+    for content in generate_messages(1000, dirty_ratio=0.5):
+        scanner = StreamingContactScanner(contact_filter)
+        assert sorted(stream(scanner, random_chunks(content, rng))) == sorted(contact_filter.find_matches(content)), content
+
+def test_number_split_across_chunks(contact_filter):
+    scanner = StreamingContactScanner(contact_filter)
+    matches = stream(scanner, ["you can get me on 555 ", "867", " 5309 any time"])
+    assert [(m.kind, m.text, m.start) for m in matches] == [("phones", "555 867 5309", 18)]
+
+def test_bounded_matches_are_reported_before_the_stream_ends(contact_filter):
+    scanner = StreamingContactScanner(contact_filter)
+    assert scanner.feed("my cell is 555-867-") == []
+    assert [m.text for m in scanner.feed("5309 and the kitchen is small")] == ["555-867-5309"]
+    # "my\s+cell" has no longest match, so it waits for the window or the end.
+    assert [m.text for m in scanner.finish()] == ["cell"]
+
+def test_kept_text_stays_bounded(contact_filter):
+    scanner = StreamingContactScanner(contact_filter, window=32)
+    for _ in range(500):
+        scanner.feed("the old deck needs new boards and a railing ")
+        assert scanner.pending <= 32
+    assert scanner.position == 500 * 44
+
+def test_finish_resets_the_stream(contact_filter):
+    scanner = StreamingContactScanner(contact_filter)
+    assert [m.text for m in stream(scanner, ["call ", "me"])] == ["call"]
+    assert scanner.position == 0
+    assert stream(scanner, ["me"]) == []
+
+def test_window_must_be_positive(contact_filter):
+    with pytest.raises(ValueError):
+        StreamingContactScanner(contact_filter, window=-1)
@@ -0,0 +1,33 @@
+# tests/security/test_verdict_cache.py
+import pytest
+import core.security.contact_filter as contact_filter_module
+from core.events.memory_transport import MemoryStreamBroker
+from core.security.contact_filter import ContactProtectionFilter
+from core.security.verdict_cache import VerdictCache
+
+@pytest.mark.asyncio
+async def test_repeated_content_is_scanned_once():
+    contact_filter = ContactProtectionFilter()
+    cache = VerdictCache(contact_filter, max_entries=100)
+    content = "call me at 555-867-5309"
+    first = await cache.scan_content(content)
+    assert first == contact_filter.scan_content(content)
+    first["phones"].append("mutated")
+    # Surrounding whitespace never changes a verdict, so it shares the entry.
+    assert await cache.scan_content(f"  {content}\n") == contact_filter.scan_content(content)
+    assert cache.cache.hits == 1 and cache.cache.misses == 1
+
+@pytest.mark.asyncio
+async def test_pattern_version_change_invalidates_shared_entries(monkeypatch):
+    broker = MemoryStreamBroker()
+    old = VerdictCache(ContactProtectionFilter(), max_entries=10, get_client=lambda: broker)
+    await old.scan_content("text me on whatsapp")
+    monkeypatch.setattr(contact_filter_module, "PATTERN_VERSION", contact_filter_module.PATTERN_VERSION + 1)
+    new = VerdictCache(ContactProtectionFilter(), max_entries=10, get_client=lambda: broker)
+    assert new.version != old.version
+    assert await new.scan_content("text me on whatsapp") == {"phones": [], "emails": [], "intent": ["text", "whatsapp"]}
+    assert new.cache.shared_hits == 0 and new.cache.misses == 1
+    # Replicas on the same version do share verdicts.
+    same = VerdictCache(ContactProtectionFilter(), max_entries=10, get_client=lambda: broker)
+    await same.scan_content("text me on whatsapp")
+    assert same.cache.shared_hits == 1